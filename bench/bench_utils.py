@@ -0,0 +1,14 @@
+import os
+
+# Set BENCH_FULL=1 to run the biggest sizes (slow)
+BENCH_FULL = os.environ.get("BENCH_FULL", "0") == "1"
+
+
+def sizes(small, full):
+    """
+    Get the sizes of a benchmark
+    :param small: sizes always run
+    :param full: sizes added with BENCH_FULL=1
+    :return: sizes
+    """
+    return small + full if BENCH_FULL else small
@@ -0,0 +1 @@
+from PySide2._stub import QT_NAMES as __all__, module_getattr as __getattr__
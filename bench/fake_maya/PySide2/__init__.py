@@ -0,0 +1,3 @@
+"""
+Stand-in of PySide2 without any display (see _stub)
+"""
@@ -0,0 +1,86 @@
+"""
+Permissive stand-ins of the Qt classes so that the tool modules can be imported and their widgets built without a
+display. Every attribute, call or operation on a stub returns another stub and does nothing
+"""
+
+# Names imported with "from PySide2.QtXxx import *" by the tools
+QT_NAMES = [
+    "QAbstractItemView", "QAbstractTableModel", "QAction", "QApplication", "QButtonGroup", "QCheckBox",
+    "QCloseEvent", "QDesktopWidget", "QDialog", "QDoubleValidator", "QEvent", "QFileDialog", "QFont", "QFormLayout",
+    "QFrame", "QGridLayout", "QHBoxLayout", "QHeaderView", "QIcon", "QIntValidator", "QLabel", "QLayout", "QLineEdit",
+    "QListWidget", "QListWidgetItem", "QLocale", "QMessageBox", "QModelIndex", "QObject", "QPixmap", "QPoint",
+    "QPushButton", "QRadioButton", "QRegExp", "QRegExpValidator", "QRunnable", "QScrollArea", "QShowEvent", "QSize",
+    "QSizePolicy", "QSlider", "QSpacerItem", "QStackedLayout", "QStyle", "QStyleOptionButton", "QStyleOptionViewItem",
+    "QStyledItemDelegate", "QTabWidget", "QTableView", "QTableWidget", "QTableWidgetItem", "QThreadPool", "QTimer",
+    "QTreeWidget", "QTreeWidgetItem", "QVBoxLayout", "QWidget", "Qt", "Signal", "Slot",
+]
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Stub()
+
+
+class Stub(metaclass=_StubMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Stub()
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+    def __bool__(self):
+        return False
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+    def __int__(self):
+        return 0
+
+    def __index__(self):
+        return 0
+
+    def __float__(self):
+        return 0.0
+
+    def __add__(self, other):
+        return Stub()
+
+    __sub__ = __mul__ = __truediv__ = __floordiv__ = __or__ = __and__ = __radd__ = __rsub__ = __rmul__ = __ror__ = \
+        __rand__ = __add__
+
+
+# Stub classes by name (the same class for all the modules so that isinstance and subclassing work)
+_classes = {}
+
+
+def get_stub_class(name):
+    """
+    Get the stub class of a Qt name
+    :param name
+    :return: class
+    """
+    if name not in _classes:
+        _classes[name] = type(name, (Stub,), {})
+    return _classes[name]
+
+
+def module_getattr(name):
+    """
+    __getattr__ of the stub modules
+    :param name
+    :return: stub class
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return get_stub_class(name)
@@ -0,0 +1,278 @@
+"""
+Lightweight stand-in of maya.OpenMaya (API 1.0) working on the scene graph of the fake pymel.core
+"""
+import pymel.core as pm
+
+
+class MFn:
+    kInvalid = 0
+    kDependencyNode = 4
+    kDagNode = 107
+    kTransform = 110
+    kShape = 248
+    kMesh = 296
+    kFileTexture = 493
+    kShadingEngine = 320
+    kPluginDependNode = 455
+
+
+# Function sets of the node types
+_TYPE_FNS = {
+    "transform": {MFn.kDagNode, MFn.kTransform},
+    "joint": {MFn.kDagNode, MFn.kTransform},
+    "mesh": {MFn.kDagNode, MFn.kShape, MFn.kMesh},
+    "file": {MFn.kFileTexture},
+    "shadingEngine": {MFn.kShadingEngine},
+}
+# Node types of the render setup plugin
+for _node_type in ["renderSetupLayer", "collection", "renderSettingsCollection", "simpleSelector", "absUniqueOverride"]:
+    _TYPE_FNS[_node_type] = {MFn.kPluginDependNode}
+
+
+def _get_fns(node_type):
+    fns = _TYPE_FNS.get(node_type)
+    if fns is None:
+        fns = {MFn.kDagNode, MFn.kShape} if node_type in pm.SHAPE_TYPES else set()
+    return fns | {MFn.kDependencyNode}
+
+
+class MObject:
+    def __init__(self, node=None):
+        self._node = node
+
+    def isNull(self):
+        return self._node is None
+
+    def hasFn(self, fn):
+        return self._node is not None and fn in _get_fns(self._node.type())
+
+    def apiTypeStr(self):
+        return self._node.type() if self._node is not None else "kInvalid"
+
+
+class MObjectHandle:
+    def __init__(self, mobj=None):
+        self._node = mobj._node if mobj is not None else None
+
+    def isValid(self):
+        return self._node is not None and self._node.exists()
+
+    def isAlive(self):
+        return self.isValid()
+
+    def object(self):
+        return MObject(self._node)
+
+    def hashCode(self):
+        return id(self._node)
+
+
+class MDagPath:
+    def __init__(self, node=None):
+        self._node = node
+
+    def partialPathName(self):
+        return self._node.name()
+
+    def fullPathName(self):
+        return self._node.longName()
+
+    def node(self):
+        return MObject(self._node)
+
+
+class _AttributeObject:
+    # MObject of an attribute (read with MFnAttribute)
+    def __init__(self, name):
+        self._name = name
+
+
+class MFnAttribute:
+    def __init__(self, attribute):
+        self._name = attribute._name
+
+    def name(self):
+        return self._name
+
+
+class MPlug:
+    def __init__(self, node=None, attr_name=None):
+        self._node = node
+        self._attr_name = attr_name
+
+    def isNull(self):
+        return self._node is None
+
+    def node(self):
+        return MObject(self._node)
+
+    def attribute(self):
+        return _AttributeObject(self._attr_name)
+
+    def name(self):
+        return self._node.name() + "." + self._attr_name
+
+    def partialName(self, *args):
+        return self._attr_name
+
+    def isLocked(self):
+        return self._node._is_locked(self._attr_name)
+
+    def setLocked(self, locked):
+        self._node._set_locked(self._attr_name, locked)
+
+    def isConnected(self):
+        return self._node._is_connected(self._attr_name)
+
+    def isCompound(self):
+        return self._attr_name in pm.COMPOUND_ATTRIBUTES
+
+    def isChild(self):
+        return False
+
+    def asString(self):
+        return str(self._node._get_value(self._attr_name))
+
+    def asDouble(self):
+        return float(self._node._get_value(self._attr_name))
+
+    def asFloat(self):
+        return self.asDouble()
+
+    def asInt(self):
+        return int(self._node._get_value(self._attr_name))
+
+    def asShort(self):
+        return self.asInt()
+
+    def asBool(self):
+        return bool(self._node._get_value(self._attr_name))
+
+
+class MSelectionList:
+    def __init__(self):
+        # Nodes or (node, attribute name) of the plugs
+        self._items = []
+
+    def add(self, name, *args):
+        name = str(name)
+        try:
+            if "." in name:
+                node_name, attr_name = name.split(".", 1)
+                node = pm.get_scene().get_node(node_name)
+                if not node.hasAttr(attr_name):
+                    raise RuntimeError(name)
+                self._items.append((node, attr_name))
+            else:
+                self._items.append((pm.get_scene().get_node(name), None))
+        except pm.MayaNodeError:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+
+    def length(self):
+        return len(self._items)
+
+    def clear(self):
+        self._items = []
+
+    def getDependNode(self, index, mobj):
+        mobj._node = self._items[index][0]
+
+    def getDagPath(self, index, dag_path, *args):
+        dag_path._node = self._items[index][0]
+
+    def getPlug(self, index, plug):
+        plug._node, plug._attr_name = self._items[index]
+
+
+class MFnDependencyNode:
+    def __init__(self, mobj=None):
+        self._node = mobj._node if mobj is not None else None
+
+    def setObject(self, mobj):
+        self._node = mobj._node
+
+    def name(self):
+        return self._node.name()
+
+    def typeName(self):
+        return self._node.type()
+
+    def findPlug(self, attr_name, want_networked=False):
+        if not self._node.hasAttr(attr_name):
+            raise RuntimeError("(kInvalidParameter): No element at given index")
+        return MPlug(self._node, attr_name)
+
+
+class MItDependencyNodes:
+    def __init__(self, fn=MFn.kInvalid):
+        scene = pm.get_scene()
+        if fn == MFn.kInvalid:
+            self._nodes = list(scene.nodes.values())
+        else:
+            self._nodes = [node for node_type, nodes in scene.nodes_by_type.items()
+                           if fn in _get_fns(node_type) for node in nodes.values()]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._nodes)
+
+    def thisNode(self):
+        return MObject(self._nodes[self._index])
+
+    def next(self):
+        self._index += 1
+
+
+# ###################################################### Messages ######################################################
+
+
+class MMessage:
+    @staticmethod
+    def removeCallback(callback_id):
+        pm.get_scene().callbacks.pop(callback_id, None)
+
+    @staticmethod
+    def removeCallbacks(callback_ids):
+        for callback_id in callback_ids:
+            MMessage.removeCallback(callback_id)
+
+
+class MNodeMessage(MMessage):
+    kConnectionMade = 0x01
+    kConnectionBroken = 0x02
+    kAttributeEval = 0x04
+    kAttributeSet = 0x08
+    kAttributeLocked = 0x10
+    kAttributeUnlocked = 0x20
+    kIncomingDirection = 0x800
+    kOtherPlugSet = 0x4000
+
+    @staticmethod
+    def addAttributeChangedCallback(mobj, function, client_data=None):
+        return pm.get_scene().add_callback("attributeChanged", function, mobj._node, client_data)
+
+    @staticmethod
+    def addNameChangedCallback(mobj, function, client_data=None):
+        return pm.get_scene().add_callback("nameChanged", function, mobj._node, client_data)
+
+
+class MDGMessage(MMessage):
+    @staticmethod
+    def addNodeAddedCallback(function, node_type="dependNode", client_data=None):
+        return pm.get_scene().add_callback("nodeAdded", function, None if node_type == "dependNode" else node_type,
+                                           client_data)
+
+    @staticmethod
+    def addNodeRemovedCallback(function, node_type="dependNode", client_data=None):
+        return pm.get_scene().add_callback("nodeRemoved", function,
+                                           None if node_type == "dependNode" else node_type, client_data)
+
+    @staticmethod
+    def addConnectionCallback(function, client_data=None):
+        return pm.get_scene().add_callback("connection", function, None, client_data)
+
+
+class MEventMessage(MMessage):
+    @staticmethod
+    def addEventCallback(event, function, client_data=None):
+        return pm.get_scene().add_callback("event", function, event, client_data)
@@ -0,0 +1,4 @@
+"""
+Stand-in of maya.OpenMayaUI without any display (see PySide2._stub)
+"""
+from PySide2._stub import module_getattr as __getattr__
@@ -0,0 +1,220 @@
+"""
+Lightweight stand-in of maya.api.OpenMaya (API 2.0) working on the scene graph of the fake pymel.core
+"""
+import pymel.core as pm
+
+
+class MFn:
+    kInvalid = 0
+    kDependencyNode = 4
+    kDagNode = 107
+    kTransform = 110
+    kMesh = 296
+
+
+class MSpace:
+    kInvalid = 0
+    kTransform = 1
+    kPreTransform = 2
+    kPostTransform = 3
+    kWorld = 4
+    kObject = kPreTransform
+
+
+class MObject:
+    def __init__(self, node=None):
+        self._node = node
+
+    def isNull(self):
+        return self._node is None
+
+    def hasFn(self, fn):
+        if fn == MFn.kDependencyNode:
+            return self._node is not None
+        if fn == MFn.kDagNode:
+            return self._node is not None and self._node.type() in pm.DAG_TYPES
+        return False
+
+
+class MDagPath:
+    def __init__(self, node=None):
+        self._node = node
+
+    def fullPathName(self):
+        return self._node.longName()
+
+    def partialPathName(self):
+        return self._node.name()
+
+    def node(self):
+        return MObject(self._node)
+
+
+class MSelectionList:
+    def __init__(self):
+        self._nodes = []
+
+    def add(self, name):
+        try:
+            self._nodes.append(pm.get_scene().get_node(name))
+        except pm.MayaNodeError:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+        return self
+
+    def length(self):
+        return len(self._nodes)
+
+    def getDagPath(self, index):
+        return MDagPath(self._nodes[index])
+
+    def getDependNode(self, index):
+        return MObject(self._nodes[index])
+
+
+class MFnDependencyNode:
+    def __init__(self, mobj=None):
+        self._node = mobj._node if mobj is not None else None
+
+    def name(self):
+        return self._node.name()
+
+    @property
+    def typeName(self):
+        return self._node.type()
+
+
+class MFnDagNode(MFnDependencyNode):
+    def __init__(self, dag_path=None):
+        super(MFnDagNode, self).__init__()
+        self._node = dag_path._node if dag_path is not None else None
+
+    def fullPathName(self):
+        return self._node.longName()
+
+
+class MItDag:
+    kDepthFirst = 1
+    kBreadthFirst = 2
+
+    def __init__(self, traversal=kDepthFirst, fn=MFn.kInvalid):
+        self._paths = []
+        self._index = 0
+
+    def reset(self, root, traversal=kDepthFirst, fn=MFn.kInvalid):
+        root_node = root._node
+        self._paths = [root_node]
+        if traversal == MItDag.kBreadthFirst:
+            index = 0
+            while index < len(self._paths):
+                self._paths.extend(self._paths[index]._children or [])
+                index += 1
+        else:
+            to_visit = [root_node]
+            self._paths = []
+            while len(to_visit) > 0:
+                node = to_visit.pop()
+                self._paths.append(node)
+                to_visit.extend(reversed(node._children or []))
+        self._index = 0
+        return self
+
+    def isDone(self):
+        return self._index >= len(self._paths)
+
+    def next(self):
+        self._index += 1
+        return self
+
+    def getPath(self):
+        return MDagPath(self._paths[self._index])
+
+    def currentItem(self):
+        return MObject(self._paths[self._index])
+
+
+# ###################################################### Meshes ########################################################
+
+
+class MPoint:
+    __slots__ = ("x", "y", "z", "w")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, w=1.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.z, self.w)[index]
+
+
+class MPointArray:
+    """
+    The points are kept as tuples and the MPoints created on access, as the real one does
+    """
+    def __init__(self, points=None):
+        self._points = [] if points is None else [tuple(point)[:3] for point in points]
+
+    def __len__(self):
+        return len(self._points)
+
+    def __getitem__(self, index):
+        return MPoint(*self._points[index])
+
+    def __iter__(self):
+        for point in self._points:
+            yield MPoint(*point)
+
+
+class MColor:
+    __slots__ = ("r", "g", "b", "a")
+
+    def __init__(self, *args):
+        values = tuple(args[0]) if len(args) == 1 else args
+        self.r, self.g, self.b = values[:3]
+        self.a = values[3] if len(values) > 3 else 1.0
+
+
+class MColorArray:
+    """
+    The real one converts the sequence in C++ so the items are kept as they are
+    """
+    def __init__(self, colors=None):
+        self._colors = [] if colors is None else list(colors)
+
+    def __len__(self):
+        return len(self._colors)
+
+    def __getitem__(self, index):
+        color = self._colors[index]
+        return color if isinstance(color, MColor) else MColor(color)
+
+
+class MIntArray(list):
+    pass
+
+
+class MFnMesh(MFnDagNode):
+    def __init__(self, dag_path=None):
+        super(MFnMesh, self).__init__(dag_path)
+        self._color_set = None
+
+    @property
+    def numVertices(self):
+        return len(pm.get_scene().mesh_points.get(self._node, []))
+
+    def getPoints(self, space=MSpace.kObject):
+        points = MPointArray()
+        points._points = list(pm.get_scene().mesh_points.get(self._node, []))
+        return points
+
+    def setCurrentColorSetName(self, color_set):
+        self._color_set = color_set
+
+    def setVertexColors(self, colors, vertex_ids):
+        if len(colors) != len(vertex_ids):
+            raise RuntimeError("(kInvalidParameter): Array lengths don't match")
+        pm.get_scene().color_sets.setdefault(self._node, {})[self._color_set] = colors
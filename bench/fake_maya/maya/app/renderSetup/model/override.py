@@ -0,0 +1,9 @@
+"""
+Stand-in of the render setup override module (see renderSetup). Anything else is a stub (see PySide2._stub)
+"""
+import pymel.core as pm
+from PySide2._stub import module_getattr as __getattr__
+
+
+def delete(override):
+    pm.delete(override._node)
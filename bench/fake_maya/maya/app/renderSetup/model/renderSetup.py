@@ -0,0 +1,154 @@
+"""
+Stand-in of the render setup : the render layers, collections, selectors and overrides are nodes of the scene of the
+fake pymel.core, the children being parented to their collection or layer. Anything else is a stub (see
+PySide2._stub)
+"""
+import pymel.core as pm
+from PySide2._stub import module_getattr as __getattr__
+
+OVERRIDE_TYPES = {"absUniqueOverride"}
+COLLECTION_TYPES = {"renderSetupLayer", "collection", "renderSettingsCollection"}
+
+
+def user_node(node):
+    """
+    Get the render setup object of a node of the scene
+    :param node
+    :return: RenderSetupNode or None
+    """
+    if node is None:
+        return None
+    if node.type() == "renderSetupLayer":
+        return RenderLayer(node)
+    if node.type() in COLLECTION_TYPES:
+        return Collection(node)
+    if node.type() in OVERRIDE_TYPES:
+        return Override(node)
+    if node.type() == "simpleSelector":
+        return Selector(node)
+    return None
+
+
+class RenderSetupNode:
+    def __init__(self, node):
+        self._node = node
+
+    def __eq__(self, other):
+        return isinstance(other, RenderSetupNode) and self._node is other._node
+
+    def __hash__(self):
+        return id(self._node)
+
+    def name(self):
+        return self._node.name()
+
+    def typeName(self):
+        return self._node.type()
+
+    def parent(self):
+        return user_node(self._node.getParent())
+
+    def getChildren(self):
+        return [user_node(child) for child in self._node._children or []]
+
+
+class Override(RenderSetupNode):
+    def targetNodeName(self):
+        return self._node.targetNodeName.get()
+
+    def attributeName(self):
+        return self._node.attribute.get()
+
+    def setTargetNodeName(self, node_name):
+        self._node.targetNodeName.set(node_name)
+
+    def setAttributeName(self, attr_name):
+        self._node.attribute.set(attr_name)
+
+
+class Selector(RenderSetupNode):
+    def setPattern(self, pattern):
+        self._node.pattern.set(pattern)
+
+    def parent(self):
+        # The selector is connected to its collection
+        connections = self._node.listConnections(type=list(COLLECTION_TYPES))
+        return user_node(connections[0]) if len(connections) > 0 else None
+
+
+class Collection(RenderSetupNode):
+    def createCollection(self, name):
+        collection = pm.createNode("collection", name=name, parent=self._node)
+        selector = pm.createNode("simpleSelector", name=name + "Selector")
+        pm.connectAttr(collection.selector, selector.collection)
+        return Collection(collection)
+
+    def getSelector(self):
+        connections = self._node.listConnections(type="simpleSelector")
+        return Selector(connections[0]) if len(connections) > 0 else None
+
+    def createAbsoluteOverride(self, node_name, attr_name):
+        override = pm.createNode("absUniqueOverride", name=node_name + "_" + attr_name, parent=self._node)
+        override.targetNodeName.set(node_name)
+        override.attribute.set(attr_name)
+        return Override(override)
+
+
+class RenderLayer(Collection):
+    def renderSettingsCollectionInstance(self):
+        for child in self._node._children or []:
+            if child.type() == "renderSettingsCollection":
+                return Collection(child)
+        return Collection(pm.createNode("renderSettingsCollection", name=self.name() + "_renderSettings",
+                                        parent=self._node))
+
+
+class _DefaultRenderLayer:
+    def name(self):
+        return "defaultRenderLayer"
+
+    def typeName(self):
+        return "renderLayer"
+
+    def getChildren(self):
+        return []
+
+
+class _RenderSetup:
+    def __init__(self):
+        self._default_layer = _DefaultRenderLayer()
+        self._visible_layer = self._default_layer
+        self._observers = []
+
+    def createRenderLayer(self, name):
+        return RenderLayer(pm.createNode("renderSetupLayer", name=name))
+
+    def getRenderLayers(self):
+        return [RenderLayer(node) for node in pm.ls(type="renderSetupLayer")]
+
+    def getDefaultRenderLayer(self):
+        return self._default_layer
+
+    def getVisibleRenderLayer(self):
+        return self._visible_layer
+
+    def switchToLayer(self, layer):
+        self._visible_layer = layer if layer is not None else self._default_layer
+        for observer in list(self._observers):
+            observer()
+
+    def addActiveLayerObserver(self, observer):
+        self._observers.append(observer)
+
+    def removeActiveLayerObserver(self, observer):
+        self._observers.remove(observer)
+
+
+def instance():
+    """
+    Getter of the render setup of the current fake scene
+    """
+    scene = pm.get_scene()
+    if not hasattr(scene, "render_setup"):
+        scene.render_setup = _RenderSetup()
+    return scene.render_setup
@@ -0,0 +1,31 @@
+"""
+Stand-in of the render setup utils (see renderSetup). Anything else is a stub (see PySide2._stub)
+"""
+import pymel.core as pm
+from PySide2._stub import module_getattr as __getattr__
+
+from maya.app.renderSetup.model.renderSetup import Override, user_node
+
+
+def getOverridesRecursive(collection):
+    """
+    Get the overrides under a layer or a collection, depth first
+    :param collection
+    :return: overrides
+    """
+    overrides = []
+    for child in collection.getChildren():
+        if isinstance(child, Override):
+            overrides.append(child)
+        elif child is not None:
+            overrides.extend(getOverridesRecursive(child))
+    return overrides
+
+
+def nameToUserNode(name):
+    """
+    Get the render setup object of a node from its name
+    :param name
+    :return: RenderSetupNode or None
+    """
+    return user_node(pm.PyNode(name)) if pm.objExists(name) else None
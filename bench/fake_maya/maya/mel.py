@@ -0,0 +1,8 @@
+"""
+Stand-in of maya.mel (see pymel.core.mel)
+"""
+import pymel.core as pm
+
+
+def eval(command):
+    return pm.mel.eval(command)
@@ -0,0 +1,777 @@
+"""
+Lightweight stand-in of pymel.core working on an in-memory scene graph, to profile the tools without Maya.
+Only the subset used by the tools is implemented: node creation, ls, listRelatives, listConnections, getAttr,
+setAttr, fileInfo, scriptJob and the attribute access on the nodes.
+Never put this folder in the path of a Maya session, it would shadow the real pymel.
+"""
+import re
+
+# ######################################################################################################################
+
+SHAPE_TYPES = {"mesh", "nurbsCurve", "nurbsSurface", "camera", "locator", "aiStandIn"}
+TRANSFORM_TYPES = {"transform", "joint"}
+DAG_TYPES = SHAPE_TYPES | TRANSFORM_TYPES
+
+# Children of the compound attributes
+COMPOUND_ATTRIBUTES = {
+    "translate": ("translateX", "translateY", "translateZ"),
+    "rotate": ("rotateX", "rotateY", "rotateZ"),
+    "scale": ("scaleX", "scaleY", "scaleZ"),
+    "displayGateMaskColor": ("displayGateMaskColorR", "displayGateMaskColorG", "displayGateMaskColorB"),
+}
+
+_TRANSFORM_ATTRIBUTES = {
+    "translateX": 0.0, "translateY": 0.0, "translateZ": 0.0,
+    "rotateX": 0.0, "rotateY": 0.0, "rotateZ": 0.0,
+    "scaleX": 1.0, "scaleY": 1.0, "scaleZ": 1.0,
+    "visibility": True,
+}
+
+# Default values of the attributes by node type
+DEFAULT_ATTRIBUTES = {
+    "transform": _TRANSFORM_ATTRIBUTES,
+    "joint": _TRANSFORM_ATTRIBUTES,
+    "mesh": {"visibility": True, "intermediateObject": False},
+    "camera": {"visibility": True, "renderable": False, "depthOfField": False, "fStop": 5.6, "overscan": 1.0,
+               "displayResolution": False, "displayGateMaskOpacity": 0.7, "displayGateMaskColorR": 0.5,
+               "displayGateMaskColorG": 0.5, "displayGateMaskColorB": 0.5},
+    "file": {"fileTextureName": "", "colorSpace": "sRGB", "outColor": None, "uvTilingMode": 0},
+    "shadingEngine": {"surfaceShader": None, "displacementShader": None},
+    "aiStandardSurface": {"baseColor": None, "outColor": None, "normalCamera": None},
+    "aiStandIn": {"visibility": True, "dso": ""},
+    # Render setup (see maya.app.renderSetup.model.renderSetup)
+    "renderSetupLayer": {"renderable": True},
+    "collection": {"selfEnabled": True, "selector": None},
+    "renderSettingsCollection": {"selfEnabled": True},
+    "simpleSelector": {"pattern": "", "staticSelection": "", "collection": None},
+    "absUniqueOverride": {"enabled": True, "attribute": "", "targetNodeName": "", "attrValue": None},
+}
+
+# ######################################################################################################################
+
+
+class MayaNodeError(RuntimeError):
+    # Raised when a node doesn't exist
+    pass
+
+
+class MayaAttributeError(AttributeError):
+    # Raised when an attribute doesn't exist
+    pass
+
+
+class Attribute:
+    """
+    Attribute of a node (node.attribute)
+    """
+    __slots__ = ("_node", "_name")
+
+    def __init__(self, node, name):
+        self._node = node
+        self._name = name
+
+    def node(self):
+        return self._node
+
+    def attrName(self, longName=False):
+        return self._name
+
+    def longName(self):
+        return self._name
+
+    def name(self):
+        return self._node.name() + "." + self._name
+
+    def get(self):
+        return self._node._get_value(self._name)
+
+    def set(self, *values, **kwargs):
+        _scene.set_value(self._node, self._name, values[0] if len(values) == 1 else values)
+
+    def isLocked(self):
+        return self._node._is_locked(self._name)
+
+    def setLocked(self, locked):
+        self._node._set_locked(self._name, locked)
+
+    def lock(self):
+        self.setLocked(True)
+
+    def unlock(self):
+        self.setLocked(False)
+
+    def isConnected(self):
+        return self._node._is_connected(self._name)
+
+    def listConnections(self, **kwargs):
+        return _scene.list_connections(self._node, self._name, **kwargs)
+
+    def __str__(self):
+        return self.name()
+
+    def __repr__(self):
+        return "Attribute('" + self.name() + "')"
+
+    def __add__(self, other):
+        return self.name() + other
+
+    def __eq__(self, other):
+        if isinstance(other, Attribute):
+            return self._node is other._node and self._name == other._name
+        return self.name() == other
+
+    def __hash__(self):
+        return hash((id(self._node), self._name))
+
+    def __rshift__(self, other):
+        connectAttr(self, other)
+
+
+class DependNode:
+    """
+    Node of the scene. Attributes are created from the defaults of the type on first write only so that a scene
+    of millions of nodes stays small in memory
+    """
+    __slots__ = ("_name", "_type", "_parent", "_children", "_values", "_locked", "_sources", "_destinations",
+                 "_alive", "__weakref__")
+
+    def __init__(self, name, node_type, parent=None):
+        self._name = name
+        self._type = node_type
+        self._parent = parent
+        self._children = None
+        self._values = None
+        self._locked = None
+        # Incoming connections by attribute : (source node, source attribute)
+        self._sources = None
+        # Outgoing connections : list of (attribute, destination node, destination attribute)
+        self._destinations = None
+        self._alive = True
+
+    # ################################################### Identity #####################################################
+
+    def name(self, long=False):
+        return self.longName() if long else self._name
+
+    def nodeName(self):
+        return self._name
+
+    def shortName(self):
+        return self._name
+
+    def longName(self):
+        if self._type not in DAG_TYPES:
+            return self._name
+        names = []
+        node = self
+        while node is not None:
+            names.append(node._name)
+            node = node._parent
+        return "|" + "|".join(reversed(names))
+
+    def fullPath(self):
+        return self.longName()
+
+    def type(self):
+        return self._type
+
+    def nodeType(self):
+        return self._type
+
+    def exists(self):
+        return self._alive
+
+    def rename(self, new_name):
+        return _scene.rename(self, new_name)
+
+    def __str__(self):
+        return self._name
+
+    def __repr__(self):
+        return "nt." + self._type[0].upper() + self._type[1:] + "('" + self._name + "')"
+
+    def __add__(self, other):
+        return self._name + other
+
+    def __radd__(self, other):
+        return other + self._name
+
+    def __eq__(self, other):
+        if isinstance(other, DependNode):
+            return self is other
+        if isinstance(other, str):
+            return self._name == other
+        return False
+
+    def __hash__(self):
+        return id(self)
+
+    # ################################################## Attributes ####################################################
+
+    def _has_attribute(self, attr_name):
+        if self._values is not None and attr_name in self._values:
+            return True
+        return attr_name in DEFAULT_ATTRIBUTES.get(self._type, {}) or attr_name in COMPOUND_ATTRIBUTES
+
+    def _get_value(self, attr_name):
+        if attr_name in COMPOUND_ATTRIBUTES:
+            return tuple(self._get_value(child) for child in COMPOUND_ATTRIBUTES[attr_name])
+        if self._values is not None and attr_name in self._values:
+            return self._values[attr_name]
+        defaults = DEFAULT_ATTRIBUTES.get(self._type, {})
+        if attr_name not in defaults:
+            raise MayaAttributeError(self._name + "." + attr_name)
+        return defaults[attr_name]
+
+    def _write_value(self, attr_name, value):
+        if attr_name in COMPOUND_ATTRIBUTES:
+            for child, child_value in zip(COMPOUND_ATTRIBUTES[attr_name], value):
+                self._write_value(child, child_value)
+            return
+        if self._values is None:
+            self._values = {}
+        self._values[attr_name] = value
+
+    def _is_locked(self, attr_name):
+        return self._locked is not None and attr_name in self._locked
+
+    def _set_locked(self, attr_name, locked):
+        if locked:
+            if self._locked is None:
+                self._locked = set()
+            self._locked.add(attr_name)
+        elif self._locked is not None:
+            self._locked.discard(attr_name)
+
+    def _is_connected(self, attr_name):
+        if self._sources is not None and attr_name in self._sources:
+            return True
+        return self._destinations is not None and any(attr == attr_name for attr, _, _ in self._destinations)
+
+    def attr(self, attr_name):
+        if not self._has_attribute(attr_name):
+            raise MayaAttributeError(self._name + "." + attr_name)
+        return Attribute(self, attr_name)
+
+    def hasAttr(self, attr_name):
+        return self._has_attribute(attr_name)
+
+    def addAttr(self, attr_name, defaultValue=None, **kwargs):
+        self._write_value(attr_name, defaultValue)
+
+    def __getattr__(self, attr_name):
+        if attr_name.startswith("_"):
+            raise AttributeError(attr_name)
+        return self.attr(attr_name)
+
+    # ################################################## Relatives #####################################################
+
+    def getParent(self):
+        return self._parent
+
+    def getChildren(self, **kwargs):
+        return self.listRelatives(children=True, **kwargs)
+
+    def getShapes(self):
+        return self.listRelatives(shapes=True)
+
+    def getShape(self):
+        shapes = self.getShapes()
+        return shapes[0] if len(shapes) > 0 else None
+
+    def listRelatives(self, **kwargs):
+        return listRelatives(self, **kwargs)
+
+    def listConnections(self, **kwargs):
+        return _scene.list_connections(self, None, **kwargs)
+
+
+# ######################################################################################################################
+
+
+class FileInfo(dict):
+    """
+    Informations stored in the scene file (pm.fileInfo)
+    """
+    def __call__(self, key, value):
+        self[key] = value
+
+    def remove(self, key):
+        self.pop(key, None)
+
+
+class _Mel:
+    """
+    Stand-in of pm.mel. Only the "setAttr -lock" commands are evaluated
+    """
+    __SET_LOCK_REGEX = re.compile(r'setAttr -lock ([01]) "([^"]+)";')
+
+    def eval(self, command):
+        commands = self.__SET_LOCK_REGEX.findall(command)
+        if len(commands) == 0 and len(command.strip()) > 0:
+            raise NotImplementedError("MEL not supported by the fake pymel : " + command)
+        for locked, plug_name in commands:
+            setAttr(plug_name, lock=locked == "1")
+
+
+class _Scene:
+    """
+    In-memory scene graph
+    """
+    def __init__(self):
+        # Nodes by name (insertion ordered) and by type
+        self.nodes = {}
+        self.nodes_by_type = {}
+        self.selection = []
+        self.file_info = FileInfo()
+        self.script_jobs = {}
+        self.next_job_id = 1
+        self.name_counters = {}
+        # API callbacks : {id: (kind, filter, function, client data)}
+        self.callbacks = {}
+        self.next_callback_id = 1
+        # Geometry of the meshes : {mesh node: [(x, y, z), ...]} and {mesh node: {color set: colors}}
+        self.mesh_points = {}
+        self.color_sets = {}
+        self.current_time = 1.0
+        self.playback_range = (1.0, 1.0)
+
+    # ################################################### Nodes ########################################################
+
+    def unique_name(self, name):
+        if name not in self.nodes:
+            return name
+        base = name.rstrip("0123456789")
+        counter = self.name_counters.get(base, 0)
+        while True:
+            counter += 1
+            candidate = base + str(counter)
+            if candidate not in self.nodes:
+                self.name_counters[base] = counter
+                return candidate
+
+    def add_node(self, node_type, name=None, parent=None):
+        name = self.unique_name(name if name else node_type + "1")
+        node = DependNode(name, node_type, parent)
+        self.nodes[name] = node
+        self.nodes_by_type.setdefault(node_type, {})[name] = node
+        if parent is not None:
+            if parent._children is None:
+                parent._children = []
+            parent._children.append(node)
+        self.call_node_callbacks("nodeAdded", node)
+        return node
+
+    def remove_node(self, node):
+        if not node._alive:
+            return
+        if node._children is not None:
+            for child in list(node._children):
+                self.remove_node(child)
+        self.call_node_callbacks("nodeRemoved", node)
+        if node._parent is not None and node._parent._children is not None:
+            node._parent._children.remove(node)
+        if node._sources is not None:
+            for attr_name, (src_node, src_attr) in list(node._sources.items()):
+                self.disconnect(src_node, src_attr, node, attr_name)
+        if node._destinations is not None:
+            for attr_name, dst_node, dst_attr in list(node._destinations):
+                self.disconnect(node, attr_name, dst_node, dst_attr)
+        del self.nodes[node._name]
+        del self.nodes_by_type[node._type][node._name]
+        if node in self.selection:
+            self.selection.remove(node)
+        node._alive = False
+
+    def rename(self, node, new_name):
+        new_name = self.unique_name(new_name)
+        del self.nodes[node._name]
+        del self.nodes_by_type[node._type][node._name]
+        node._name = new_name
+        self.nodes[new_name] = node
+        self.nodes_by_type[node._type][new_name] = node
+        return node
+
+    def get_node(self, name):
+        if isinstance(name, DependNode):
+            return name
+        name = str(name)
+        if "|" in name:
+            name = name.rsplit("|", 1)[-1]
+        if name not in self.nodes:
+            raise MayaNodeError(name)
+        return self.nodes[name]
+
+    def get_attribute(self, plug):
+        if isinstance(plug, Attribute):
+            return plug
+        node_name, attr_name = str(plug).split(".", 1)
+        return self.get_node(node_name).attr(attr_name)
+
+    # ################################################# Attributes #####################################################
+
+    def set_value(self, node, attr_name, value):
+        if node._is_locked(attr_name):
+            raise RuntimeError("The attribute '" + node._name + "." + attr_name + "' is locked")
+        if not node._has_attribute(attr_name):
+            raise MayaAttributeError(node._name + "." + attr_name)
+        node._write_value(attr_name, value)
+        self.call_attribute_callbacks(node, attr_name)
+
+    # ################################################ Connections #####################################################
+
+    def connect(self, src_node, src_attr, dst_node, dst_attr):
+        if dst_node._sources is None:
+            dst_node._sources = {}
+        if dst_attr in dst_node._sources:
+            previous_node, previous_attr = dst_node._sources[dst_attr]
+            self.disconnect(previous_node, previous_attr, dst_node, dst_attr)
+        dst_node._sources[dst_attr] = (src_node, src_attr)
+        if src_node._destinations is None:
+            src_node._destinations = []
+        src_node._destinations.append((src_attr, dst_node, dst_attr))
+        self.call_connection_callbacks(src_node, src_attr, dst_node, dst_attr, True)
+
+    def disconnect(self, src_node, src_attr, dst_node, dst_attr):
+        if dst_node._sources is not None:
+            dst_node._sources.pop(dst_attr, None)
+        if src_node._destinations is not None:
+            src_node._destinations.remove((src_attr, dst_node, dst_attr))
+        self.call_connection_callbacks(src_node, src_attr, dst_node, dst_attr, False)
+
+    def list_connections(self, node, attr_name, source=True, destination=True, type=None, plugs=False,
+                         connections=False, **kwargs):
+        source = kwargs.get("s", source)
+        destination = kwargs.get("d", destination)
+        plugs = kwargs.get("p", plugs)
+        connections = kwargs.get("c", connections)
+        results = []
+        if source and node._sources is not None:
+            for dst_attr, (src_node, src_attr) in node._sources.items():
+                if attr_name is None or attr_name == dst_attr:
+                    results.append((Attribute(node, dst_attr), src_node, src_attr))
+        if destination and node._destinations is not None:
+            for src_attr, dst_node, dst_attr in node._destinations:
+                if attr_name is None or attr_name == src_attr:
+                    results.append((Attribute(node, src_attr), dst_node, dst_attr))
+        if type is not None:
+            types = {type} if isinstance(type, str) else set(type)
+            results = [result for result in results if result[1]._type in types]
+        if connections:
+            return [(own, Attribute(other, other_attr) if plugs else other) for own, other, other_attr in results]
+        if plugs:
+            return [Attribute(other, other_attr) for _, other, other_attr in results]
+        # Unique nodes keeping the order
+        return list({other: None for _, other, _ in results}.keys())
+
+    # ################################################# Callbacks ######################################################
+
+    def add_callback(self, kind, function, callback_filter=None, client_data=None):
+        callback_id = self.next_callback_id
+        self.next_callback_id += 1
+        self.callbacks[callback_id] = (kind, callback_filter, function, client_data)
+        return callback_id
+
+    def call_node_callbacks(self, kind, node):
+        if len(self.callbacks) == 0:
+            return
+        from maya.OpenMaya import MObject
+        for callback_kind, callback_filter, function, client_data in list(self.callbacks.values()):
+            if callback_kind == kind and (callback_filter is None or callback_filter == node._type):
+                function(MObject(node), client_data)
+
+    def call_attribute_callbacks(self, node, attr_name):
+        if len(self.callbacks) == 0:
+            return
+        from maya.OpenMaya import MObject, MPlug, MNodeMessage
+        for callback_kind, callback_filter, function, client_data in list(self.callbacks.values()):
+            if callback_kind == "attributeChanged" and callback_filter is node:
+                function(MNodeMessage.kAttributeSet, MPlug(node, attr_name), MPlug(), client_data)
+
+    def call_connection_callbacks(self, src_node, src_attr, dst_node, dst_attr, made):
+        # Attribute changed callbacks of both ends of a connection
+        if len(self.callbacks) == 0:
+            return
+        from maya.OpenMaya import MPlug, MNodeMessage
+        msg = MNodeMessage.kConnectionMade if made else MNodeMessage.kConnectionBroken
+        src_plug = MPlug(src_node, src_attr)
+        dst_plug = MPlug(dst_node, dst_attr)
+        for callback_kind, callback_filter, function, client_data in list(self.callbacks.values()):
+            if callback_kind == "attributeChanged":
+                if callback_filter is src_node:
+                    function(msg | MNodeMessage.kOtherPlugSet, src_plug, dst_plug, client_data)
+                if callback_filter is dst_node:
+                    function(msg | MNodeMessage.kOtherPlugSet | MNodeMessage.kIncomingDirection, dst_plug, src_plug,
+                             client_data)
+
+
+_scene = _Scene()
+fileInfo = _scene.file_info
+mel = _Mel()
+
+# ######################################################################################################################
+
+
+def _as_list(nodes):
+    if nodes is None:
+        return []
+    if isinstance(nodes, (list, tuple, set)):
+        result = []
+        for node in nodes:
+            result.extend(_as_list(node))
+        return result
+    return [nodes]
+
+
+def newFile(force=False, **kwargs):
+    """
+    Start a new empty scene
+    """
+    global _scene, fileInfo
+    _scene = _Scene()
+    fileInfo = _scene.file_info
+
+
+def get_scene():
+    """
+    Getter of the current fake scene (used by the fake OpenMaya modules)
+    """
+    return _scene
+
+
+def PyNode(name):
+    return _scene.get_node(name)
+
+
+def createNode(node_type, name=None, parent=None, **kwargs):
+    name = kwargs.get("n", name)
+    parent = kwargs.get("p", parent)
+    if parent is not None:
+        parent = _scene.get_node(parent)
+    return _scene.add_node(node_type, name, parent)
+
+
+def shadingNode(node_type, name=None, asShader=False, asTexture=False, asUtility=False, **kwargs):
+    return createNode(node_type, name=kwargs.get("n", name))
+
+
+def group(*nodes, name=None, empty=False, parent=None, **kwargs):
+    group_node = createNode("transform", name=kwargs.get("n", name) or "group1", parent=parent)
+    return group_node
+
+
+def objExists(name):
+    name = str(name)
+    if "." in name:
+        try:
+            _scene.get_attribute(name)
+            return True
+        except (MayaNodeError, MayaAttributeError):
+            return False
+    try:
+        _scene.get_node(name)
+        return True
+    except MayaNodeError:
+        return False
+
+
+def delete(*nodes, **kwargs):
+    for node in _as_list(list(nodes)):
+        _scene.remove_node(_scene.get_node(node))
+
+
+def rename(node, new_name, **kwargs):
+    return _scene.rename(_scene.get_node(node), new_name)
+
+
+def select(*nodes, replace=True, add=False, deselect=False, clear=False, **kwargs):
+    add = kwargs.get("af", add) or kwargs.get("addFirst", False)
+    deselect = kwargs.get("d", deselect)
+    clear = kwargs.get("cl", clear)
+    nodes = [_scene.get_node(node) for node in _as_list(list(nodes))]
+    if clear:
+        _scene.selection = []
+    elif deselect:
+        _scene.selection = [node for node in _scene.selection if node not in nodes]
+    elif add:
+        _scene.selection.extend(node for node in nodes if node not in _scene.selection)
+    else:
+        _scene.selection = nodes
+
+
+def ls(*args, selection=False, type=None, shapes=False, transforms=False, dag=False, long=False, **kwargs):
+    selection = kwargs.get("sl", selection)
+    shapes = kwargs.get("s", shapes)
+    transforms = kwargs.get("tr", transforms)
+    types = None
+    if type is not None:
+        types = {type} if isinstance(type, str) else set(type)
+    if shapes:
+        types = SHAPE_TYPES if types is None else types & SHAPE_TYPES
+    if transforms:
+        types = TRANSFORM_TYPES if types is None else types & TRANSFORM_TYPES
+    if dag and types is None:
+        types = DAG_TYPES
+
+    if selection:
+        nodes = list(_scene.selection)
+    elif len(args) > 0:
+        nodes = []
+        for arg in _as_list(list(args)):
+            if isinstance(arg, str) and arg == "*":
+                nodes.extend(_scene.nodes.values())
+            elif objExists(arg):
+                nodes.append(_scene.get_node(arg))
+    elif types is not None:
+        nodes = []
+        for node_type in types:
+            nodes.extend(_scene.nodes_by_type.get(node_type, {}).values())
+        return nodes
+    else:
+        return list(_scene.nodes.values())
+    if types is not None:
+        nodes = [node for node in nodes if node._type in types]
+    return nodes
+
+
+def listRelatives(*nodes, children=False, allDescendents=False, shapes=False, type=None, parent=False,
+                  allParents=False, fullPath=False, path=False, **kwargs):
+    allDescendents = kwargs.get("ad", allDescendents)
+    shapes = kwargs.get("s", shapes)
+    parent = kwargs.get("p", parent)
+    allParents = kwargs.get("ap", allParents)
+    nodes = [_scene.get_node(node) for node in _as_list(list(nodes))]
+    if len(nodes) == 0:
+        nodes = list(_scene.selection)
+    types = None
+    if type is not None:
+        types = {type} if isinstance(type, str) else set(type)
+    if shapes:
+        types = SHAPE_TYPES if types is None else types & SHAPE_TYPES
+
+    relatives = []
+    for node in nodes:
+        if parent or allParents:
+            current = node._parent
+            while current is not None:
+                relatives.append(current)
+                current = current._parent if allParents else None
+        elif allDescendents:
+            # Maya lists the deepest descendants first
+            descendants = []
+            to_visit = [node]
+            while len(to_visit) > 0:
+                current = to_visit.pop()
+                if current._children is not None:
+                    descendants.extend(current._children)
+                    to_visit.extend(current._children)
+            relatives.extend(reversed(descendants))
+        elif node._children is not None:
+            relatives.extend(node._children)
+    if types is not None:
+        relatives = [relative for relative in relatives if relative._type in types]
+    return relatives
+
+
+def listConnections(node, source=True, destination=True, **kwargs):
+    if isinstance(node, Attribute):
+        return _scene.list_connections(node._node, node._name, source, destination, **kwargs)
+    if isinstance(node, str) and "." in node:
+        attribute = _scene.get_attribute(node)
+        return _scene.list_connections(attribute._node, attribute._name, source, destination, **kwargs)
+    return _scene.list_connections(_scene.get_node(node), None, source, destination, **kwargs)
+
+
+def connectAttr(source, destination, force=False, **kwargs):
+    source = _scene.get_attribute(source)
+    destination = _scene.get_attribute(destination)
+    _scene.connect(source._node, source._name, destination._node, destination._name)
+
+
+def disconnectAttr(source, destination, **kwargs):
+    source = _scene.get_attribute(source)
+    destination = _scene.get_attribute(destination)
+    _scene.disconnect(source._node, source._name, destination._node, destination._name)
+
+
+def getAttr(plug, lock=False, **kwargs):
+    attribute = _scene.get_attribute(plug)
+    if kwargs.get("l", lock):
+        return attribute.isLocked()
+    return attribute.get()
+
+
+def setAttr(plug, *values, lock=None, type=None, **kwargs):
+    lock = kwargs.get("l", lock)
+    attribute = _scene.get_attribute(plug)
+    if len(values) > 0:
+        attribute.set(*values)
+    if lock is not None:
+        attribute.setLocked(lock)
+
+
+def scriptJob(kill=None, exists=None, listJobs=False, **kwargs):
+    """
+    The jobs are registered (to count them) but never triggered
+    """
+    if kill is not None:
+        _scene.script_jobs.pop(kill, None)
+        return None
+    if exists is not None:
+        return exists in _scene.script_jobs
+    if listJobs:
+        return [str(job_id) + ": " + str(job) for job_id, job in _scene.script_jobs.items()]
+    job_id = _scene.next_job_id
+    _scene.next_job_id += 1
+    _scene.script_jobs[job_id] = kwargs
+    return job_id
+
+
+def currentTime(time=None, query=False, update=True, **kwargs):
+    if kwargs.get("q", query) or time is None:
+        return _scene.current_time
+    _scene.current_time = float(time)
+    return _scene.current_time
+
+
+def playbackOptions(query=False, minTime=None, maxTime=None, **kwargs):
+    min_time = kwargs.get("min", minTime)
+    max_time = kwargs.get("max", maxTime)
+    if kwargs.get("q", query):
+        return _scene.playback_range[0] if min_time else _scene.playback_range[1]
+    _scene.playback_range = (
+        _scene.playback_range[0] if min_time is None else float(min_time),
+        _scene.playback_range[1] if max_time is None else float(max_time))
+
+
+def polyColorSet(shape, query=False, allColorSets=False, create=False, colorSet=None, **kwargs):
+    color_sets = _scene.color_sets.setdefault(_scene.get_node(shape), {})
+    if kwargs.get("q", query):
+        return list(color_sets.keys()) if allColorSets else None
+    if create:
+        color_sets[colorSet] = None
+
+
+def set_mesh_points(mesh, points):
+    """
+    Set the vertices of a mesh of the fake scene (there is no real geometry)
+    :param mesh
+    :param points: list of (x, y, z)
+    """
+    _scene.mesh_points[_scene.get_node(mesh)] = points
+
+
+def undoInfo(**kwargs):
+    return None
+
+
+def refresh(**kwargs):
+    return None
+
+
+def warning(*args):
+    print("Warning: " + " ".join(str(arg) for arg in args))
+
+
+def sceneName():
+    return ""
@@ -0,0 +1,8 @@
+"""
+Stand-in of shiboken2 (see PySide2._stub)
+"""
+from PySide2._stub import Stub
+
+
+def wrapInstance(pointer, cls):
+    return Stub()
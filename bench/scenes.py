@@ -0,0 +1,55 @@
+"""
+Builders of synthetic scenes on the fake pymel.core
+"""
+import pymel.core as pm
+
+
+def build_hierarchy(nb_nodes, nb_roots=10, branching=8, locked_every=10):
+    """
+    Build nb_roots trees of transforms, each transform having a mesh shape
+    :param nb_nodes: number of nodes of the scene (transforms + shapes)
+    :param nb_roots
+    :param branching: number of transform children of each transform
+    :param locked_every: one transform out of locked_every has its translate locked
+    :return: the roots
+    """
+    pm.newFile(force=True)
+    nb_transforms = max(nb_roots, nb_nodes // 2)
+    roots = [pm.createNode("transform", name="root_" + str(i) + "_GRP") for i in range(nb_roots)]
+    parents = list(roots)
+    nb_created = nb_roots
+    parent_index = 0
+    while nb_created < nb_transforms:
+        parent = parents[parent_index]
+        parent_index += 1
+        for _ in range(branching):
+            if nb_created >= nb_transforms:
+                break
+            transform = pm.createNode("transform", name="geo_" + str(nb_created), parent=parent)
+            pm.createNode("mesh", name="geo_" + str(nb_created) + "Shape", parent=transform)
+            if nb_created % locked_every == 0:
+                for attr in ["translate", "translateX", "translateY", "translateZ"]:
+                    transform.attr(attr).lock()
+            parents.append(transform)
+            nb_created += 1
+    return roots
+
+
+def build_file_nodes(nb_file_nodes, nodes_by_path=3, bad_every=5):
+    """
+    Build file nodes sharing their textures, some textures having file nodes with different colorspaces
+    :param nb_file_nodes
+    :param nodes_by_path: number of file nodes by texture
+    :param bad_every: one texture out of bad_every has a file node in Raw instead of sRGB
+    :return: the file nodes
+    """
+    pm.newFile(force=True)
+    file_nodes = []
+    for i in range(nb_file_nodes):
+        path_index = i // nodes_by_path
+        file_node = pm.shadingNode("file", asTexture=True, name="file" + str(i))
+        file_node.fileTextureName.set("/textures/asset_" + str(path_index) + "_BaseColor.<UDIM>.tx")
+        if path_index % bad_every == 0 and i % nodes_by_path == 0:
+            file_node.colorSpace.set("Raw")
+        file_nodes.append(file_node)
+    return file_nodes
@@ -0,0 +1,110 @@
+"""
+Checks of the fake pymel.core and maya.OpenMaya used by the benchmarks
+"""
+import pytest
+
+import pymel.core as pm
+import maya.OpenMaya as OpenMaya
+
+from scenes import build_hierarchy
+
+
+@pytest.fixture
+def scene():
+    pm.newFile(force=True)
+    root = pm.createNode("transform", name="root")
+    child = pm.createNode("transform", name="child", parent=root)
+    shape = pm.createNode("mesh", name="childShape", parent=child)
+    shading_group = pm.createNode("shadingEngine", name="SG")
+    shader = pm.shadingNode("aiStandardSurface", asShader=True, name="shader")
+    texture = pm.shadingNode("file", asTexture=True, name="tex")
+    pm.connectAttr(texture.outColor, shader.baseColor)
+    pm.connectAttr(shader.outColor, shading_group.surfaceShader)
+    return root, child, shape, shading_group, shader, texture
+
+
+def test_ls(scene):
+    root, child, shape, shading_group, shader, texture = scene
+    assert pm.ls(type="transform") == [root, child]
+    assert pm.ls(type="file") == [texture]
+    assert pm.ls(shapes=True) == [shape]
+    pm.select(root)
+    assert pm.ls(selection=True) == [root]
+    assert pm.ls(sl=True, type="mesh") == []
+    assert pm.objExists("tex") and not pm.objExists("missing")
+
+
+def test_list_relatives(scene):
+    root, child, shape, _, _, _ = scene
+    assert root.listRelatives() == [child]
+    assert pm.listRelatives(root, allDescendents=True) == [shape, child]
+    assert pm.listRelatives(root, allDescendents=True, type="transform") == [child]
+    assert child.getShapes() == [shape]
+    assert shape.getParent() is child
+    assert shape.longName() == "|root|child|childShape"
+
+
+def test_list_connections(scene):
+    _, _, _, shading_group, shader, texture = scene
+    assert shading_group.listConnections(source=True, destination=False) == [shader]
+    assert shader.listConnections(source=True, destination=False) == [texture]
+    assert texture.listConnections(type="shadingEngine") == []
+    assert pm.listConnections("shader.outColor", plugs=True) == ["SG.surfaceShader"]
+
+
+def test_attributes(scene):
+    _, child, _, _, _, texture = scene
+    texture.fileTextureName.set("/tex/color.exr")
+    assert pm.getAttr("tex.fileTextureName") == "/tex/color.exr"
+    pm.setAttr("tex.colorSpace", "Raw", type="string")
+    assert texture.colorSpace.get() == "Raw"
+    pm.setAttr("child.translate", 1, 2, 3)
+    assert child.translate.get() == (1, 2, 3)
+    pm.setAttr("child.translateX", lock=True)
+    assert pm.getAttr("child.translateX", lock=True)
+    with pytest.raises(RuntimeError):
+        pm.setAttr("child.translateX", 4)
+    pm.mel.eval('setAttr -lock 0 "child.translateX";')
+    assert not child.translateX.isLocked()
+    with pytest.raises(AttributeError):
+        texture.missingAttribute
+
+
+def test_file_info_and_script_jobs(scene):
+    pm.fileInfo["key"] = "value"
+    assert pm.fileInfo["key"] == "value"
+    job = pm.scriptJob(event=["SelectionChanged", lambda: None])
+    assert pm.scriptJob(exists=job)
+    pm.scriptJob(kill=job)
+    assert not pm.scriptJob(exists=job)
+    pm.newFile(force=True)
+    assert "key" not in pm.fileInfo
+
+
+def test_open_maya(scene):
+    root, child, _, _, _, texture = scene
+    sel_list = OpenMaya.MSelectionList()
+    sel_list.add("child")
+    mobj = OpenMaya.MObject()
+    sel_list.getDependNode(0, mobj)
+    assert mobj.hasFn(OpenMaya.MFn.kDagNode)
+    child.translateX.lock()
+    assert OpenMaya.MFnDependencyNode(mobj).findPlug("translateX", False).isLocked()
+    with pytest.raises(RuntimeError):
+        sel_list.add("missing")
+
+    changes = []
+    callback = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+        OpenMaya.MItDependencyNodes(OpenMaya.MFn.kFileTexture).thisNode(),
+        lambda msg, plug, other_plug, client_data: changes.append(plug.name()))
+    texture.colorSpace.set("ACEScg")
+    OpenMaya.MMessage.removeCallback(callback)
+    texture.colorSpace.set("Raw")
+    assert changes == ["tex.colorSpace"]
+
+
+def test_build_hierarchy():
+    roots = build_hierarchy(1000, nb_roots=4)
+    # 500 transforms, all but the 4 roots have a mesh shape
+    assert len(pm.ls()) == 500 + 496
+    assert len(pm.listRelatives(roots, allDescendents=True, type="transform")) == 496
@@ -0,0 +1,80 @@
+"""
+OverrideIndex of Control Room kept current by the callbacks on the render setup of the fake maya
+"""
+import pytest
+
+import pymel.core as pm
+import maya.app.renderSetup.model.renderSetup as render_setup
+
+from control_room.ControlRoom import ControlRoom
+from control_room.OverrideIndex import OverrideIndex
+
+
+@pytest.fixture
+def layer():
+    pm.newFile(force=True)
+    pm.createNode("camera", name="cam1")
+    pm.createNode("camera", name="cam2")
+    layer = render_setup.instance().createRenderLayer("layer1")
+    render_setup.instance().switchToLayer(layer)
+    return layer
+
+
+@pytest.fixture
+def override_index(layer):
+    override_index = OverrideIndex.get_instance()
+    override_index.add_callbacks()
+    yield override_index
+    override_index.remove_callbacks()
+
+
+def _count_builds(monkeypatch):
+    """
+    Record the names of the layers whose index is built
+    :param monkeypatch
+    :return: list of layer names filled on each build
+    """
+    builds = []
+    build_index = OverrideIndex._OverrideIndex__build_index
+    monkeypatch.setattr(OverrideIndex, "_OverrideIndex__build_index",
+                        staticmethod(lambda layer: builds.append(layer.name()) or build_index(layer)))
+    return builds
+
+
+def test_retarget_override(layer):
+    # Override created before the index observes the scene
+    override = layer.renderSettingsCollectionInstance().createAbsoluteOverride("cam1", "fStop")
+    override_index = OverrideIndex.get_instance()
+    override_index.add_callbacks()
+    try:
+        assert ControlRoom.retrieve_override("cam1", "fStop") == override
+        override.setTargetNodeName("cam2")
+        assert ControlRoom.retrieve_override("cam1", "fStop") is None
+        assert ControlRoom.retrieve_override("cam2", "fStop") == override
+        override.setAttributeName("depthOfField")
+        assert ControlRoom.retrieve_override("cam2", "fStop") is None
+        assert ControlRoom.retrieve_override("cam2", "depthOfField") == override
+    finally:
+        override_index.remove_callbacks()
+
+
+def test_collection_changes(layer, override_index, monkeypatch):
+    collection = layer.createCollection("cameras")
+    assert ControlRoom.retrieve_override("cam1", "overscan") is None
+    # Override added under a plain collection
+    override = collection.createAbsoluteOverride("cam1", "overscan")
+    assert ControlRoom.retrieve_override("cam1", "overscan") == override
+    # A change of the selector of the collection rebuilds the index of the layer
+    builds = _count_builds(monkeypatch)
+    collection.getSelector().setPattern("cam*")
+    assert ControlRoom.retrieve_override("cam1", "overscan") == override
+    assert builds == ["layer1"]
+
+
+def test_value_change_keeps_index(layer, override_index, monkeypatch):
+    override = layer.renderSettingsCollectionInstance().createAbsoluteOverride("cam1", "fStop")
+    assert ControlRoom.retrieve_override("cam1", "fStop") == override
+    builds = _count_builds(monkeypatch)
+    pm.setAttr(override.name() + ".attrValue", 2.8)
+    assert ControlRoom.retrieve_override("cam1", "fStop") == override
+    assert builds == []
@@ -0,0 +1,114 @@
+import json
+import os
+
+import pytest
+
+from bench_utils import sizes
+
+pytest.importorskip("pytest_benchmark")
+
+from common.Prefs import Prefs, get_folder_prefs, create_folder_prefs
+
+_NAMESPACE = "bench"
+_NB_KEYS = sizes([10, 1000, 10000], [100000])
+
+
+def _fill_prefs(nb_keys):
+    """
+    Create a prefs file of nb_keys keys looking like the ones of Bug-out bag
+    :param nb_keys
+    :return: the prefs
+    """
+    prefs = Prefs(_NAMESPACE)
+    with prefs:
+        for i in range(nb_keys):
+            prefs["tool_" + str(i)] = {"collapsed": i % 2 == 0, "children": True, "ignore_root": False}
+    return prefs
+
+
+@pytest.fixture(params=_NB_KEYS, ids=lambda nb_keys: str(nb_keys) + "_keys")
+def filled_prefs(request, home):
+    return request.param, _fill_prefs(request.param)
+
+
+def test_get(benchmark, filled_prefs):
+    nb_keys, prefs = filled_prefs
+    benchmark.group = "get"
+    key = "tool_" + str(nb_keys // 2)
+    benchmark(lambda: prefs[key])
+
+
+def test_get_first_access(benchmark, filled_prefs):
+    # A new instance loads the file on its first read
+    nb_keys, _ = filled_prefs
+    benchmark.group = "get_first_access"
+    key = "tool_" + str(nb_keys // 2)
+    benchmark(lambda: Prefs(_NAMESPACE)[key])
+
+
+def test_contains(benchmark, filled_prefs):
+    nb_keys, prefs = filled_prefs
+    benchmark.group = "contains"
+    benchmark(lambda: ("tool_" + str(nb_keys // 2)) in prefs and "missing" not in prefs)
+
+
+def test_set(benchmark, filled_prefs):
+    # Set in memory, flushed later
+    nb_keys, prefs = filled_prefs
+    benchmark.group = "set"
+    key = "tool_" + str(nb_keys // 2)
+    benchmark(prefs.__setitem__, key, {"collapsed": True})
+
+
+def test_set_and_flush(benchmark, filled_prefs):
+    nb_keys, prefs = filled_prefs
+    benchmark.group = "set_and_flush"
+    key = "tool_" + str(nb_keys // 2)
+
+    def set_and_flush():
+        prefs[key] = {"collapsed": True}
+        prefs.flush()
+    benchmark(set_and_flush)
+
+
+def test_pop_and_flush(benchmark, filled_prefs):
+    nb_keys, prefs = filled_prefs
+    benchmark.group = "pop_and_flush"
+    key = "tool_" + str(nb_keys // 2)
+
+    def add_key():
+        with prefs:
+            prefs[key] = {"collapsed": True}
+        return (), {}
+
+    def pop_and_flush():
+        prefs.pop(key)
+        prefs.flush()
+    benchmark.pedantic(pop_and_flush, setup=add_key, rounds=20)
+
+
+def test_file_size_growth(benchmark, home):
+    # Size of the file for each number of keys, in the extra info of the benchmark
+    benchmark.group = "file_size"
+    path_prefs = get_folder_prefs()
+    create_folder_prefs(path_prefs)
+    file_path = os.path.join(path_prefs, _NAMESPACE)
+    prefs = Prefs(_NAMESPACE)
+    nb_keys_written = 0
+    for nb_keys in _NB_KEYS:
+        with prefs:
+            for i in range(nb_keys_written, nb_keys):
+                prefs["tool_" + str(i)] = {"collapsed": i % 2 == 0, "children": True, "ignore_root": False}
+        nb_keys_written = nb_keys
+        file_size = os.path.getsize(file_path)
+        benchmark.extra_info["bytes_" + str(nb_keys) + "_keys"] = file_size
+        benchmark.extra_info["bytes_by_key_" + str(nb_keys) + "_keys"] = round(file_size / nb_keys, 1)
+        with open(file_path, "r") as f:
+            assert len(json.load(f)) == nb_keys
+    # Time of a flush of the biggest file
+    key = "tool_0"
+
+    def set_and_flush():
+        prefs[key] = {"collapsed": True}
+        prefs.flush()
+    benchmark(set_and_flush)
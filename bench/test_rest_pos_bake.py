@@ -0,0 +1,59 @@
+"""
+Files written by RestPosToVertexColorTool.bake_frame_range on the fake maya.api.OpenMaya
+"""
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+import pymel.core as pm
+
+from bug_out_bag.tool_instances.RestPosToVertexColorTool import RestPosToVertexColorTool, BAKE_VELOCITIES
+
+
+@pytest.fixture
+def meshes():
+    pm.newFile(force=True)
+    shapes = []
+    for name in ["static", "changing"]:
+        transform = pm.createNode("transform", name=name)
+        shape = pm.createNode("mesh", name=name + "Shape", parent=transform)
+        pm.set_mesh_points(shape, [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0)])
+        shapes.append(shape)
+    return shapes
+
+
+def test_bake_velocities(tmp_path, meshes):
+    files = RestPosToVertexColorTool.bake_frame_range(meshes[:1], 1, 3, str(tmp_path), BAKE_VELOCITIES)
+    assert [path.name for path in tmp_path.iterdir()] == ["staticShape_velocities.npy"]
+    cache = numpy.load(files["staticShape"])
+    assert cache.shape == (3, 2, 3)
+    assert not cache.any()
+
+
+def test_bake_skips_changing_topology(tmp_path, meshes, monkeypatch):
+    # A vertex is added to the second mesh on the frame 2
+    current_time = pm.currentTime
+
+    def set_time(time=None, **kwargs):
+        if time == 2:
+            pm.set_mesh_points(meshes[1], [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0), (4.0, 5.0, 6.0)])
+        return current_time(time, **kwargs)
+    monkeypatch.setattr(pm, "currentTime", set_time)
+
+    files = RestPosToVertexColorTool.bake_frame_range(meshes, 1, 3, str(tmp_path))
+    assert list(files.keys()) == ["staticShape"]
+    # No temporary file left by the mesh skipped
+    assert [path.name for path in tmp_path.iterdir()] == ["staticShape_positions.npy"]
+    assert numpy.load(files["staticShape"])[2, 1].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_bake_error_removes_files(tmp_path, meshes, monkeypatch):
+    def set_time(time=None, **kwargs):
+        if time == 2:
+            raise RuntimeError("Evaluation failed")
+        return 1.0
+    monkeypatch.setattr(pm, "currentTime", set_time)
+
+    with pytest.raises(RuntimeError):
+        RestPosToVertexColorTool.bake_frame_range(meshes, 1, 3, str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
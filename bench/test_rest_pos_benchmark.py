@@ -0,0 +1,78 @@
+"""
+Store of the rest position to the vertex colors by RestPosToVertexColorTool on meshes of the fake maya.api.OpenMaya
+(100k vertices, 1M and 5M with BENCH_FULL=1). The numpy conversion of the points to colors and of the vertex indices
+is compared to the loop by vertex used without numpy.
+The fake arrays are written in Python so the absolute timings are not the ones of Maya
+"""
+import pytest
+
+from bench_utils import sizes
+
+pytest.importorskip("pytest_benchmark")
+numpy = pytest.importorskip("numpy")
+
+import pymel.core as pm
+import maya.api.OpenMaya as om2
+
+from bug_out_bag.tool_instances.RestPosToVertexColorTool import RestPosToVertexColorTool
+
+_NB_VERTICES = sizes([100000], [1000000, 5000000])
+
+
+def _loop_points_to_colors(points):
+    """
+    Conversion of the points to colors without numpy : a tuple by vertex
+    :param points: om2.MPointArray
+    :return: om2.MColorArray
+    """
+    return om2.MColorArray([(point.x, point.y, point.z) for point in points])
+
+
+def _numpy_points_to_colors(points):
+    return RestPosToVertexColorTool._RestPosToVertexColorTool__points_to_colors(points)
+
+
+def _loop_vertex_indices(nb_vertices):
+    return om2.MIntArray(range(nb_vertices))
+
+
+def _numpy_vertex_indices(nb_vertices):
+    return RestPosToVertexColorTool._RestPosToVertexColorTool__vertex_indices(nb_vertices)
+
+
+@pytest.fixture(scope="module", params=_NB_VERTICES, ids=lambda nb_vertices: str(nb_vertices) + "_vertices")
+def mesh(request):
+    pm.newFile(force=True)
+    transform = pm.createNode("transform", name="geo")
+    shape = pm.createNode("mesh", name="geoShape", parent=transform)
+    # Few distinct coordinates so that millions of vertices stay small in memory
+    coordinates = [i * 0.5 for i in range(100)]
+    pm.set_mesh_points(shape, [(coordinates[i % 100], coordinates[i % 37], coordinates[i % 91])
+                               for i in range(request.param)])
+    return shape
+
+
+def test_store_rest_batch(benchmark, mesh):
+    benchmark.group = "store_rest_batch"
+    benchmark.pedantic(RestPosToVertexColorTool.store_rest_batch, args=([mesh],), rounds=3)
+    colors = pm.get_scene().color_sets[mesh]["Pref"]
+    assert len(colors) == len(pm.get_scene().mesh_points[mesh])
+    assert colors[1].b == 0.5
+
+
+@pytest.mark.parametrize("points_to_colors", [_loop_points_to_colors, _numpy_points_to_colors],
+                         ids=["loop", "numpy"])
+def test_points_to_colors(benchmark, mesh, points_to_colors):
+    points = om2.MFnMesh(om2.MSelectionList().add(str(mesh)).getDagPath(0)).getPoints(om2.MSpace.kWorld)
+    benchmark.group = "points_to_colors_" + str(len(points))
+    colors = benchmark.pedantic(points_to_colors, args=(points,), rounds=3)
+    assert len(colors) == len(points)
+    assert (colors[1].r, colors[1].g, colors[1].b) == (points[1].x, points[1].y, points[1].z)
+
+
+@pytest.mark.parametrize("vertex_indices", [_loop_vertex_indices, _numpy_vertex_indices], ids=["range", "numpy"])
+def test_vertex_indices(benchmark, mesh, vertex_indices):
+    nb_vertices = len(pm.get_scene().mesh_points[mesh])
+    benchmark.group = "vertex_indices_" + str(nb_vertices)
+    indices = benchmark.pedantic(vertex_indices, args=(nb_vertices,), rounds=3)
+    assert list(indices[-2:]) == [nb_vertices - 2, nb_vertices - 1]
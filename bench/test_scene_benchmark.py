@@ -0,0 +1,61 @@
+"""
+Hot paths of the tools timed on synthetic scenes of the fake pymel.core (10k nodes, up to 1M with BENCH_FULL=1)
+"""
+import pytest
+
+from bench_utils import sizes
+
+pytest.importorskip("pytest_benchmark")
+
+import pymel.core as pm
+
+from scenes import build_hierarchy
+from bug_out_bag.SelectionSnapshot import SelectionSnapshot
+from common.lock_utils import LockSnapshot, set_locked, TRS_COMPOUND_ATTRIBUTES
+
+_NB_NODES = sizes([10000], [100000, 1000000])
+
+
+@pytest.fixture(scope="module", params=_NB_NODES, ids=lambda nb_nodes: str(nb_nodes) + "_nodes")
+def hierarchy(request):
+    roots = build_hierarchy(request.param)
+    return request.param, roots
+
+
+def test_selection_snapshot(benchmark, hierarchy):
+    # Queries shared by the Bug-out bag tools on a selection changed event
+    _, roots = hierarchy
+    pm.select(roots)
+    benchmark.group = "selection_snapshot"
+
+    def query_selection():
+        snapshot = SelectionSnapshot()
+        return len(snapshot.get_descendant_transforms()) + len(snapshot.get_descendant_shapes())
+    assert benchmark(query_selection) > 0
+
+
+def test_lock_tool_refresh(benchmark, hierarchy):
+    # LockTool state : lock flags of all the transforms under the selection
+    _, roots = hierarchy
+    pm.select(roots)
+    benchmark.group = "lock_tool_refresh"
+
+    def refresh():
+        lock_snapshot = LockSnapshot(SelectionSnapshot().get_descendant_transforms())
+        return lock_snapshot.has_locked(), lock_snapshot.has_unlocked()
+    assert benchmark(refresh) == (True, True)
+
+
+def test_set_locked(benchmark, hierarchy):
+    # LockTool and CleanFreezeTool : lock then unlock the transforms under the selection
+    _, roots = hierarchy
+    pm.select(roots)
+    transforms = SelectionSnapshot().get_descendant_transforms()
+    snapshot = LockSnapshot(transforms)
+    benchmark.group = "set_locked"
+
+    def lock_and_unlock():
+        set_locked(transforms, True, TRS_COMPOUND_ATTRIBUTES)
+        set_locked(transforms, False)
+    benchmark.pedantic(lock_and_unlock, rounds=3)
+    snapshot.restore()
@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from bench_utils import sizes
+
+pytest.importorskip("pytest_benchmark")
+
+from common.Prefs import Prefs, get_folder_prefs, create_folder_prefs
+from common.SqlitePrefs import SqlitePrefs
+
+_NAMESPACE = "bench"
+_NB_KEYS = sizes([10, 1000], [100000])
+_BACKENDS = {"json": Prefs, "sqlite": SqlitePrefs}
+
+
+def _write_json_prefs(nb_keys):
+    """
+    Write a json prefs file of nb_keys keys
+    :param nb_keys
+    :return:
+    """
+    path_prefs = get_folder_prefs()
+    create_folder_prefs(path_prefs)
+    datas = {"key_" + str(i): {"collapsed": i % 2 == 0, "value": i} for i in range(nb_keys)}
+    with open(os.path.join(path_prefs, _NAMESPACE), "w") as f:
+        f.write(json.dumps(datas, indent=1))
+
+
+@pytest.fixture(params=_NB_KEYS, ids=lambda nb_keys: str(nb_keys) + "_keys")
+def nb_keys(request, home):
+    _write_json_prefs(request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("backend", _BACKENDS.keys())
+def test_get_first_access(benchmark, nb_keys, backend):
+    # First read of a tool: parse of the whole json file or one SQLite query
+    if backend == "sqlite":
+        # Migrate the json file before the benchmark
+        SqlitePrefs(_NAMESPACE).close()
+    benchmark.group = "first_access_" + str(nb_keys)
+    key = "key_" + str(nb_keys // 2)
+    benchmark(lambda: _BACKENDS[backend](_NAMESPACE)[key])
+
+
+@pytest.mark.parametrize("backend", _BACKENDS.keys())
+def test_get(benchmark, nb_keys, backend):
+    prefs = _BACKENDS[backend](_NAMESPACE)
+    benchmark.group = "get_" + str(nb_keys)
+    key = "key_" + str(nb_keys // 2)
+    benchmark(lambda: prefs[key])
+
+
+@pytest.mark.parametrize("backend", _BACKENDS.keys())
+def test_set_and_flush(benchmark, nb_keys, backend):
+    # One key written and persisted
+    prefs = _BACKENDS[backend](_NAMESPACE)
+    benchmark.group = "set_and_flush_" + str(nb_keys)
+    key = "key_" + str(nb_keys // 2)
+
+    def set_and_flush():
+        prefs[key] = {"collapsed": True, "value": 0}
+        prefs.flush()
+    benchmark(set_and_flush)
+
+
+@pytest.mark.parametrize("backend", _BACKENDS.keys())
+def test_batch_set(benchmark, nb_keys, backend):
+    # 100 keys written in one "with" block (one flush or one transaction)
+    prefs = _BACKENDS[backend](_NAMESPACE)
+    benchmark.group = "batch_set_100_" + str(nb_keys)
+
+    def batch_set():
+        with prefs:
+            for i in range(100):
+                prefs["batch_" + str(i)] = i
+    benchmark(batch_set)
+
+
+def test_sqlite_migration(benchmark, nb_keys):
+    # First use of the SQLite store with an existing json file
+    benchmark.group = "sqlite_migration"
+
+    def remove_db():
+        db_path = os.path.join(get_folder_prefs(), "prefs.db")
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        return (), {}
+    benchmark.pedantic(lambda: SqlitePrefs(_NAMESPACE).close(), setup=remove_db, rounds=5)
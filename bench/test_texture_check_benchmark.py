@@ -0,0 +1,55 @@
+"""
+Audit of the colorspaces of the file nodes by the TextureCheckTool on a fake scene (3k file nodes, 30k with
+BENCH_FULL=1)
+"""
+import pytest
+
+from bench_utils import sizes
+
+pytest.importorskip("pytest_benchmark")
+
+import pymel.core as pm
+
+from scenes import build_file_nodes
+from bug_out_bag.tool_instances.TextureCheckTool import TextureCheckDialog
+
+_NB_FILE_NODES = sizes([3000], [30000])
+
+
+class _DialogOwner:
+    # Stands for the TextureCheckTool which needs its UI to be populated
+    def set_opened(self, opened):
+        pass
+
+
+@pytest.fixture(params=_NB_FILE_NODES, ids=lambda nb_file_nodes: str(nb_file_nodes) + "_file_nodes")
+def nb_file_nodes(request):
+    build_file_nodes(request.param)
+    return request.param
+
+
+def test_build_bad_cs(benchmark, nb_file_nodes):
+    # Index of all the file nodes (with their callbacks) done on each opening of the dialog
+    dialog = TextureCheckDialog(_DialogOwner())
+    benchmark.group = "build_bad_cs"
+    bad_cs_tex = benchmark(dialog.build_bad_cs)
+    assert len(bad_cs_tex) == nb_file_nodes // 3 // 5
+
+
+def test_submit_renamed_file_nodes():
+    # The file nodes renamed after the audit must still be assigned
+    file_nodes = build_file_nodes(6)
+    dialog = TextureCheckDialog(_DialogOwner())
+    dialog.showEvent(None)
+    dialog.refresh_ui()
+    bad_cs_tex = dialog._TextureCheckDialog__bad_cs_tex
+    filepath = file_nodes[0].fileTextureName.get()
+    assert list(bad_cs_tex.keys()) == [filepath]
+    pm.rename(file_nodes[0], "renamed_file")
+    pm.rename(file_nodes[1], "other_file")
+
+    dialog._TextureCheckDialog__on_click_button(filepath, "Raw")
+    dialog._TextureCheckDialog__submit_cs_choices()
+    assert [file_node.colorSpace.get() for file_node in file_nodes[:3]] == ["Raw", "Raw", "Raw"]
+    assert len(bad_cs_tex) == 0
+    dialog.hideEvent(None)
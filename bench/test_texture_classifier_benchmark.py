@@ -0,0 +1,92 @@
+"""
+Classification of the textures of Shader.load : the former regexps (one re.match per channel and per file) against
+the precompiled TextureClassifier, on synthetic texture filenames (100k)
+"""
+import random
+import re
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# ShaderMaker is the entry point of the package (Shader imports it first)
+import shader_maker.ShaderMaker as ShaderMaker
+from shader_maker.Shader import TEXTURE_CLASSIFIER
+
+_NB_FILES = 100000
+
+# Regexps of Shader before the TextureClassifier
+_OLD_SHADER_FIELDS_REGEX = {
+    "base_color": r"(.*)(?:basecolor|albedo|diffuse).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
+    "normal": r"((?:(?!combine).)*)(?:normal)(?:(?!combine).)*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
+    "displacement": r"(.*)(?:height|displacement|disp).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
+    "roughness": r"(.*)(?:roughness).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
+    "metalness": r"(.*)(?:metalness).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
+    "emissive": r"(.*)(?:emissive).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
+    "sss": r"(.*)(?:sssamount).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")"
+}
+
+_CHANNEL_NAMES = ["BaseColor", "albedo", "Diffuse", "Normal", "normal_combine", "Height", "Displacement", "disp",
+                  "Roughness", "Metalness", "Emissive", "SSSAmount", "Opacity", "Specular", "mask"]
+_EXTENSIONS = ShaderMaker.FILE_EXTENSION_SUPPORTED + ["psd", "txt"]
+
+
+def _generate_file_names(nb_files):
+    """
+    Generate texture filenames looking like the ones of the asset folders (some of them don't match any channel)
+    :param nb_files
+    :return: file names
+    """
+    rand = random.Random(0)
+    file_names = []
+    for i in range(nb_files):
+        asset = "asset" + str(i % 500)
+        file_name = asset + "_" + rand.choice(["body", "head", "cloth", "Props_Wood"]) + "_" + \
+            rand.choice(_CHANNEL_NAMES)
+        if rand.random() < 0.5:
+            file_name += "." + str(1001 + rand.randrange(20))
+        file_names.append(file_name + "." + rand.choice(_EXTENSIONS))
+    return file_names
+
+
+def _old_classify(file_names):
+    """
+    Former classification of Shader.load
+    :param file_names
+    :return: (prefix, channel, file name) found
+    """
+    results = []
+    for keyword, regexp in _OLD_SHADER_FIELDS_REGEX.items():
+        for file_name in file_names:
+            match = re.match(regexp, file_name.lower(), re.IGNORECASE)
+            if match:
+                results.append((match.groups()[0], keyword, file_name))
+    return results
+
+
+def _new_classify(file_names):
+    """
+    Classification of Shader.load with the TextureClassifier
+    :param file_names
+    :return: (prefix, channel, file name) found
+    """
+    files_by_keyword = {keyword: [] for keyword in TEXTURE_CLASSIFIER.get_channels()}
+    for file_name in file_names:
+        for prefix, keyword in TEXTURE_CLASSIFIER.classify(file_name):
+            files_by_keyword[keyword].append((prefix, keyword, file_name))
+    return [result for results in files_by_keyword.values() for result in results]
+
+
+@pytest.fixture(scope="module")
+def file_names():
+    return _generate_file_names(_NB_FILES)
+
+
+def test_same_results(file_names):
+    assert _old_classify(file_names) == _new_classify(file_names)
+
+
+@pytest.mark.parametrize("classify", [_old_classify, _new_classify], ids=["old_regex", "texture_classifier"])
+def test_classify(benchmark, file_names, classify):
+    benchmark.group = "classify_" + str(_NB_FILES) + "_files"
+    assert len(benchmark.pedantic(classify, args=(file_names,), rounds=5)) > 0
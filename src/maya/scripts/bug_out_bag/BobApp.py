@@ -19,6 +19,7 @@ import common.utils
 
 from common.Prefs import *
 from .BobCategory import *
+from .SelectionSnapshot import *
 
 from .tool_instances.LockTool import *
 from .tool_instances.CleanFreezeTool import *
@@ -40,6 +41,9 @@ from .tool_instances.TraceSetTool import *
 
 _FILE_NAME_PREFS = "bug_out_bag"
 
+# Delay (ms) to gather the events of a burst before distributing them
+_EVENT_DISPATCH_DELAY = 20
+
 
 # See bob_categories in __init__ to edit tools and categories
 
@@ -97,6 +101,15 @@ class BobApp(QDialog):
         # Makes the object get deleted from memory, not just hidden, when it is closed.
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
+        self.__selection_timer = QTimer(self)
+        self.__selection_timer.setSingleShot(True)
+        self.__selection_timer.setInterval(_EVENT_DISPATCH_DELAY)
+        self.__selection_timer.timeout.connect(self.__dispatch_selection_changed)
+        self.__dag_timer = QTimer(self)
+        self.__dag_timer.setSingleShot(True)
+        self.__dag_timer.setInterval(_EVENT_DISPATCH_DELAY)
+        self.__dag_timer.timeout.connect(self.__dispatch_dag_changed)
+
         self.__create_callback()
 
         # Create the layout, linking it to actions and refresh the display
@@ -108,13 +121,14 @@ class BobApp(QDialog):
         Save preferences
         :return:
         """
-        size = self.size()
-        self.__prefs["window_size"] = {"width": size.width(), "height": size.height()}
-        pos = self.pos()
-        self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
-        self.__prefs["selected_category"] = self.__selected_category
-        for bob_categ in self.__bob_categories:
-            bob_categ.save_prefs()
+        with self.__prefs:
+            size = self.size()
+            self.__prefs["window_size"] = {"width": size.width(), "height": size.height()}
+            pos = self.pos()
+            self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
+            self.__prefs["selected_category"] = self.__selected_category
+            for bob_categ in self.__bob_categories:
+                bob_categ.save_prefs()
 
     def __retrieve_prefs(self):
         """
@@ -152,6 +166,8 @@ class BobApp(QDialog):
         """
         OpenMaya.MMessage.removeCallback(self.__selection_callback)
         OpenMaya.MMessage.removeCallback(self.__dag_callback)
+        self.__selection_timer.stop()
+        self.__dag_timer.stop()
         self.__save_prefs()
 
     def __create_ui(self):
@@ -185,13 +201,28 @@ class BobApp(QDialog):
 
     def __on_selection_changed(self, *args, **kwargs):
         """
-        Distribute to categories the selection changed event
+        Defer the selection changed event to distribute a burst of events only once
         :return:
         """
-        for bob_categ in self.__bob_categories:
-            bob_categ.on_selection_changed()
+        self.__selection_timer.start()
 
     def __on_dag_changed(self, *args, **kwargs):
+        """
+        Defer the dag changed event to distribute a burst of events only once
+        :return:
+        """
+        self.__dag_timer.start()
+
+    def __dispatch_selection_changed(self):
+        """
+        Distribute to categories the selection changed event with a selection snapshot shared by all the tools
+        :return:
+        """
+        snapshot = SelectionSnapshot()
+        for bob_categ in self.__bob_categories:
+            bob_categ.on_selection_changed(snapshot)
+
+    def __dispatch_dag_changed(self):
         """
         Distribute to categories the dag changed event
         :return:
@@ -206,3 +237,5 @@ class BobApp(QDialog):
         :return:
         """
         self.__selected_category = index
+        for i, bob_categ in enumerate(self.__bob_categories):
+            bob_categ.set_visible(i == index)
@@ -49,13 +49,14 @@ class BobCategory(BobElement):
         scroll.setWidget(widget)
         return scroll
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Distribute the selection changed event to tools
+        :param snapshot: SelectionSnapshot shared by all the tools
         :return:
         """
         for bob_tool in self._bob_tools:
-            bob_tool.on_selection_changed()
+            bob_tool.notify_selection_changed(snapshot)
 
     def on_dag_changed(self):
         """
@@ -63,7 +64,16 @@ class BobCategory(BobElement):
         :return:
         """
         for bob_tool in self._bob_tools:
-            bob_tool.on_dag_changed()
+            bob_tool.notify_dag_changed()
+
+    def set_visible(self, visible):
+        """
+        Distribute the visibility of the category to tools
+        :param visible
+        :return:
+        """
+        for bob_tool in self._bob_tools:
+            bob_tool.set_category_visible(visible)
 
     def save_prefs(self):
         """
@@ -3,6 +3,9 @@ from PySide2 import QtWidgets, QtGui, QtCore
 class Header(QtWidgets.QWidget):
     """Header class for collapsible group"""
 
+    # Emitted with True when expanded and False when collapsed
+    expanded_changed = QtCore.Signal(bool)
+
     def __init__(self, name, content_widget,pref_name, prefs,  bg_color, margins):
         """
         Constructor
@@ -17,6 +20,7 @@ class Header(QtWidgets.QWidget):
         self.pref_name = pref_name
         self.prefs = prefs
         self.content = content_widget
+        self.expanded = True
         self.expand_ico = QtGui.QPixmap(":teDownArrow.png")
         self.collapse_ico = QtGui.QPixmap(":teRightArrow.png")
 
@@ -61,6 +65,8 @@ class Header(QtWidgets.QWidget):
         :return:
         """
         self.expand() if not self.content.isVisible() else self.collapse()
+        # Written outside of the "with" block of BobApp so persist it now
+        self.prefs.flush()
 
     def expand(self):
         """
@@ -72,6 +78,8 @@ class Header(QtWidgets.QWidget):
         pref = self.prefs[self.pref_name] if self.pref_name in self.prefs else {}
         pref["collapsed"] = False
         self.prefs[self.pref_name] = pref
+        self.expanded = True
+        self.expanded_changed.emit(True)
 
     def collapse(self):
         """
@@ -83,6 +91,8 @@ class Header(QtWidgets.QWidget):
         pref = self.prefs[self.pref_name] if self.pref_name in self.prefs else {}
         pref["collapsed"] = True
         self.prefs[self.pref_name] = pref
+        self.expanded = False
+        self.expanded_changed.emit(False)
 
 
 class BobCollapsibleWidget(QtWidgets.QWidget):
@@ -124,6 +134,15 @@ class BobCollapsibleWidget(QtWidgets.QWidget):
         self.collapse = header.collapse
         self.expand = header.expand
         self.toggle = header.mousePressEvent
+        self.expanded_changed = header.expanded_changed
+        self.__header = header
+
+    def is_expanded(self):
+        """
+        Getter of whether the widget is expanded or not
+        :return: boolean
+        """
+        return self.__header.expanded
 
     @property
     def contentWidget(self):
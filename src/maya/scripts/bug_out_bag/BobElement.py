@@ -26,9 +26,10 @@ class BobElement(ABC):
         pass
 
     @abstractmethod
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Event on selection changed
+        :param snapshot: SelectionSnapshot shared by all the elements
         :return:
         """
         pass
@@ -6,10 +6,16 @@ from PySide2.QtCore import *
 import pymel.core as pm
 
 from .BobElement import *
+from .SelectionSnapshot import *
 from .BobCollapsibleWidget import *
 
 
 class BobTool(BobElement, ABC):
+    # Scene states that the tool has to follow (events are received only while the tool is visible)
+    SELECTION = "selection"
+    DAG = "dag"
+    _scene_dependencies = []
+
     def __init__(self, name, pref_name, tooltip=""):
         """
         Constructor
@@ -21,6 +27,9 @@ class BobTool(BobElement, ABC):
         self.__tooltip = tooltip
         self._pref_name = pref_name
         self._prefs = None
+        self.__collapsible = None
+        self.__category_visible = False
+        self.__stale_states = set()
 
     def populate(self):
         """
@@ -31,12 +40,80 @@ class BobTool(BobElement, ABC):
         collapsible = BobCollapsibleWidget(self._name, self._pref_name, self._prefs, bg_color="rgb(50, 50, 50)",
                                            widget_color="rgb(80, 80, 100)", margins=[3, 3, 3, 3])
         collapsible.setToolTip(self.__tooltip)
+        collapsible.expanded_changed.connect(self.__on_expanded_changed)
         layout.addWidget(collapsible)
+        self.__collapsible = collapsible
+        # The state is computed by the populate of the tool
+        self.__stale_states.clear()
         return layout
 
-    def on_selection_changed(self):
+    def is_visible(self):
+        """
+        Getter of whether the tool is displayed (category selected and tool expanded) or not
+        :return: boolean
+        """
+        return self.__category_visible and self.__collapsible is not None and self.__collapsible.is_expanded()
+
+    def set_category_visible(self, visible):
+        """
+        Setter of the visibility of the category of the tool
+        :param visible
+        :return:
+        """
+        self.__category_visible = visible
+        self.__refresh_stale_states()
+
+    def __on_expanded_changed(self, expanded):
+        """
+        Recompute the outdated states when the tool is expanded
+        :param expanded
+        :return:
+        """
+        self.__refresh_stale_states()
+
+    def __refresh_stale_states(self):
+        """
+        Recompute the states that changed while the tool was hidden
+        :return:
+        """
+        if not self.is_visible() or len(self.__stale_states) == 0:
+            return
+        stale_states = self.__stale_states
+        self.__stale_states = set()
+        if BobTool.SELECTION in stale_states:
+            self.on_selection_changed(SelectionSnapshot())
+        if BobTool.DAG in stale_states:
+            self.on_dag_changed()
+
+    def notify_selection_changed(self, snapshot):
+        """
+        Forward the selection changed event if the tool depends on it and is visible, else mark it as outdated
+        :param snapshot: SelectionSnapshot shared by all the tools
+        :return:
+        """
+        if BobTool.SELECTION not in self._scene_dependencies:
+            return
+        if self.is_visible():
+            self.on_selection_changed(snapshot)
+        else:
+            self.__stale_states.add(BobTool.SELECTION)
+
+    def notify_dag_changed(self):
+        """
+        Forward the dag changed event if the tool depends on it and is visible, else mark it as outdated
+        :return:
+        """
+        if BobTool.DAG not in self._scene_dependencies:
+            return
+        if self.is_visible():
+            self.on_dag_changed()
+        else:
+            self.__stale_states.add(BobTool.DAG)
+
+    def on_selection_changed(self, snapshot):
         """
         By default do nothing on selection changed
+        :param snapshot: SelectionSnapshot shared by all the tools
         :return:
         """
         pass
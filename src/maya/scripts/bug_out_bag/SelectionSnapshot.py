@@ -0,0 +1,90 @@
+import pymel.core as pm
+
+
+class SelectionSnapshot:
+    """
+    Selection of the scene at a given time, shared by all the tools on a selection changed event.
+    Each query is computed on first use only and reused by the next tools
+    """
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__cache = {}
+
+    def __get(self, key, compute):
+        """
+        Get a query from the cache or compute it
+        :param key
+        :param compute: function computing the query
+        :return: copy of the query result
+        """
+        if key not in self.__cache:
+            self.__cache[key] = compute()
+        # Copy so that tools can modify their list
+        return list(self.__cache[key])
+
+    @staticmethod
+    def __list_relatives(nodes, **kwargs):
+        """
+        listRelatives that returns nothing for no nodes (instead of working on the selection)
+        :param nodes
+        :param kwargs: flags of listRelatives
+        :return: relatives
+        """
+        if len(nodes) == 0:
+            return []
+        return pm.listRelatives(nodes, **kwargs)
+
+    def get_selection(self):
+        """
+        Getter of the nodes selected
+        :return: nodes
+        """
+        return self.__get("selection", lambda: pm.ls(selection=True))
+
+    def get_selected_transforms(self):
+        """
+        Getter of the transforms selected
+        :return: transforms
+        """
+        return self.__get("selected_transforms", lambda: pm.ls(selection=True, type="transform"))
+
+    def get_selected_shapes(self):
+        """
+        Getter of the shapes selected
+        :return: shapes
+        """
+        return self.__get("selected_shapes", lambda: pm.ls(selection=True, shapes=True))
+
+    def get_descendant_transforms(self):
+        """
+        Getter of the transforms under the selection
+        :return: transforms
+        """
+        return self.__get("descendant_transforms", lambda: SelectionSnapshot.__list_relatives(
+            self.get_selection(), allDescendents=True, type="transform"))
+
+    def get_descendant_shapes(self):
+        """
+        Getter of the shapes under the selection
+        :return: shapes
+        """
+        return self.__get("descendant_shapes", lambda: SelectionSnapshot.__list_relatives(
+            self.get_selection(), allDescendents=True, shapes=True))
+
+    def get_descendant_meshes(self):
+        """
+        Getter of the meshes under the selection
+        :return: meshes
+        """
+        return self.__get("descendant_meshes", lambda: SelectionSnapshot.__list_relatives(
+            self.get_selection(), allDescendents=True, shapes=True, type="mesh"))
+
+    def get_standins(self):
+        """
+        Getter of the StandIns of the transforms selected
+        :return: standins
+        """
+        return self.__get("standins", lambda: SelectionSnapshot.__list_relatives(
+            self.get_selected_transforms(), type="aiStandIn"))
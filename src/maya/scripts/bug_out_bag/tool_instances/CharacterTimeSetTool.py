@@ -3,28 +3,28 @@ from common.utils import *
 
 
 class CharacterTimeSetTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
+
     def __init__(self):
         super().__init__(name="Character Time Setter",pref_name="character_time_setter",
                          description="Set the MTOA Time Constant to the StandIn", button_text="Set")
         self.__selection = []
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
         Retrieve the selection
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__selection.clear()
-        for sl in pm.ls(selection=True, type="transform"):
-            standin = pm.listRelatives(sl, type="aiStandIn")
-            if len(standin) > 0:
-                self.__selection.extend(standin)
+        self.__selection = snapshot.get_standins()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def __refresh_btn(self):
@@ -51,6 +51,6 @@ class CharacterTimeSetTool(ActionTool):
         :return: layout
         """
         layout = super(CharacterTimeSetTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
\ No newline at end of file
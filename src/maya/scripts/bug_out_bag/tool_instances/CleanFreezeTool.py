@@ -1,19 +1,19 @@
 from ..tool_models.ActionTool import *
+from common.lock_utils import *
 
 
 class CleanFreezeTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
 
     @staticmethod
-    def __get_transforms_selected():
+    def __get_transforms_selected(snapshot):
         """
         Get all the transform Nodes selected (recursive)
+        :param snapshot: SelectionSnapshot
         :return: transform Nodes selected
         """
-        selection = pm.ls(selection=True, type="transform")
-        selection_arr = []
-        selection_arr.extend(selection)
-        for sel in selection:
-            selection_arr.extend(pm.listRelatives(sel, allDescendents=True, type="transform"))
+        selection_arr = snapshot.get_selected_transforms()
+        selection_arr.extend(snapshot.get_descendant_transforms())
         return selection_arr
 
     def __init__(self):
@@ -27,100 +27,47 @@ class CleanFreezeTool(ActionTool):
         Action that perform the CleanFreeze process
         :return:
         """
-        self.__unlock_selection()
-        self.__delete_history()
-        self.__freeze_transform()
-        self.__center_pivot()
-        self.__lock_selection()
+        lock_snapshot = LockSnapshot(self.__selection)
+        lock_snapshot.unlock()
+        try:
+            self.__delete_history()
+            self.__freeze_transform()
+            self.__center_pivot()
+        finally:
+            # Relock the attributes even if the freeze failed
+            lock_snapshot.restore()
 
     def __freeze_transform(self):
         """
         Freeze all the transform selected
         :return:
         """
-        for item in self.__selection:
-            pm.makeIdentity(item["transform"], apply=True)
+        for transform in self.__selection:
+            pm.makeIdentity(transform, apply=True)
 
     def __center_pivot(self):
         """
         Center the pivot of all transform selected
         :return:
         """
-        for item in self.__selection:
-            pm.xform(item["transform"], pivots=(0, 0, 0), worldSpace=True)
+        for transform in self.__selection:
+            pm.xform(transform, pivots=(0, 0, 0), worldSpace=True)
 
     def __delete_history(self):
         """
         Delete the history of all the transform selected
         :return:
         """
-        for item in self.__selection:
-            pm.delete(item["transform"], constructionHistory=True)
+        for transform in self.__selection:
+            pm.delete(transform, constructionHistory=True)
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
-        Retrieve all the values of transform Nodes selected
+        Retrieve all the transform Nodes selected
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        selection = CleanFreezeTool.__get_transforms_selected()
-        self.__selection.clear()
-        for transform in selection:
-            item = {
-                "transform": transform,
-                "translate": transform.translate.isLocked(),
-                "translateX": transform.translateX.isLocked(),
-                "translateY": transform.translateY.isLocked(),
-                "translateZ": transform.translateZ.isLocked(),
-                "rotate": transform.rotate.isLocked(),
-                "rotateX": transform.rotateX.isLocked(),
-                "rotateY": transform.rotateY.isLocked(),
-                "rotateZ": transform.rotateZ.isLocked(),
-                "scale": transform.scale.isLocked(),
-                "scaleX": transform.scaleX.isLocked(),
-                "scaleY": transform.scaleY.isLocked(),
-                "scaleZ": transform.scaleZ.isLocked(),
-            }
-            self.__selection.append(item)
-
-    def __unlock_selection(self):
-        """
-        Unlock all the nodes selected
-        :return:
-        """
-        for item in self.__selection:
-            transform = item["transform"]
-            if item["translate"]: transform.translate.unlock()
-            if item["translateX"]: transform.translateX.unlock()
-            if item["translateY"]: transform.translateY.unlock()
-            if item["translateZ"]: transform.translateZ.unlock()
-            if item["rotate"]: transform.rotate.unlock()
-            if item["rotateX"]: transform.rotateX.unlock()
-            if item["rotateY"]: transform.rotateY.unlock()
-            if item["rotateZ"]: transform.rotateZ.unlock()
-            if item["scale"]: transform.scale.unlock()
-            if item["scaleX"]: transform.scaleX.unlock()
-            if item["scaleY"]: transform.scaleY.unlock()
-            if item["scaleZ"]: transform.scaleZ.unlock()
-
-    def __lock_selection(self):
-        """
-        Lock all the nodes selected
-        :return:
-        """
-        for item in self.__selection:
-            transform = item["transform"]
-            if item["translate"]: transform.translate.lock()
-            if item["translateX"]: transform.translateX.lock()
-            if item["translateY"]: transform.translateY.lock()
-            if item["translateZ"]: transform.translateZ.lock()
-            if item["rotate"]: transform.rotate.lock()
-            if item["rotateX"]: transform.rotateX.lock()
-            if item["rotateY"]: transform.rotateY.lock()
-            if item["rotateZ"]: transform.rotateZ.lock()
-            if item["scale"]: transform.scale.lock()
-            if item["scaleX"]: transform.scaleX.lock()
-            if item["scaleY"]: transform.scaleY.lock()
-            if item["scaleZ"]: transform.scaleZ.lock()
+        self.__selection = CleanFreezeTool.__get_transforms_selected(snapshot)
 
     def __refresh_btn(self):
         """
@@ -129,12 +76,13 @@ class CleanFreezeTool(ActionTool):
         """
         self._action_btn.setEnabled(len(self.__selection) > 0)
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -143,6 +91,6 @@ class CleanFreezeTool(ActionTool):
         :return: layout
         """
         layout = super(CleanFreezeTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
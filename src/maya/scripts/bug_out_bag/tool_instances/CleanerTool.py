@@ -2,6 +2,8 @@ from ..tool_models.RoutineTool import *
 
 
 class CleanerTool(RoutineTool):
+    # Works on the whole scene when run so no scene event is followed
+    _scene_dependencies = []
 
     def __init__(self):
         steps = {
@@ -2,6 +2,8 @@ from ..tool_models.ActionTool import *
 
 
 class DeleteOrigTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
+
     def __init__(self):
         super().__init__(name="Delete Orig", pref_name="delete_orig_tool",
                          description="Delete orig objects of the selected objects", button_text="Delete")
@@ -29,20 +31,21 @@ class DeleteOrigTool(ActionTool):
         """
         self._action_btn.setEnabled(len(self.__selection) > 0)
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
         Retrieve all the shapes selected
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        selection = pm.ls(sl=True)
-        self.__selection = pm.listRelatives(selection, shapes=True, allDescendents=True, type="mesh")
+        self.__selection = snapshot.get_descendant_meshes()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -51,6 +54,6 @@ class DeleteOrigTool(ActionTool):
         :return:
         """
         layout = super(DeleteOrigTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
@@ -1,5 +1,3 @@
-import re
-
 from shiboken2 import wrapInstance
 from functools import partial
 
@@ -7,6 +5,7 @@ import maya.OpenMayaUI as omui
 
 from ..tool_models.ActionTool import *
 from common.utils import *
+import common.hierarchy_diff as hierarchy_diff
 
 
 class HierarchyCheckVisualizeer(QDialog):
@@ -16,8 +15,8 @@ class HierarchyCheckVisualizeer(QDialog):
         :param tool
         :param sel_1: object selected 1
         :param sel_2: object selected 1
-        :param object_diff_data_1: differences in hierarchies from object 2
-        :param object_diff_data_2: differences in hierarchies from object 2
+        :param object_diff_data_1: differences in hierarchies from object 1 (list of (full path, reason))
+        :param object_diff_data_2: differences in hierarchies from object 2 (list of (full path, reason))
         """
         super(HierarchyCheckVisualizeer, self).__init__(wrapInstance(int(omui.MQtUtil.mainWindow()), QWidget))
         self.__tool = tool
@@ -102,11 +101,11 @@ class HierarchyCheckVisualizeer(QDialog):
         self.__ui_list_view_1.clear()
         self.__ui_list_view_2.clear()
         for obj_diff in self.__object_diff_data_1:
-            item = QListWidgetItem(obj_diff[0].name(long=True)+"   ["+obj_diff[1]+"]")
+            item = QListWidgetItem(obj_diff[0]+"   ["+obj_diff[1]+"]")
             item.setData(Qt.UserRole, obj_diff[0])
             self.__ui_list_view_1.addItem(item)
         for obj_diff in self.__object_diff_data_2:
-            item = QListWidgetItem(obj_diff[0].name(long=True)+"   ["+obj_diff[1]+"]")
+            item = QListWidgetItem(obj_diff[0]+"   ["+obj_diff[1]+"]")
             item.setData(Qt.UserRole, obj_diff[0])
             self.__ui_list_view_2.addItem(item)
 
@@ -124,6 +123,7 @@ class HierarchyCheckVisualizeer(QDialog):
 
 
 class HierarchyCheckTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
 
     def __init__(self):
         tooltip = "Select 2 objects then click Check"
@@ -133,82 +133,17 @@ class HierarchyCheckTool(ActionTool):
         self.__selection = []
         self.__hierarchy_visualizer = None
 
-    @staticmethod
-    def trim_name(name):
-        """
-        Get only the end of a name of an object
-        :param name:
-        :return:
-        """
-        return re.match("^(?:.*:)?(?:.*\|)?(\w+)$",name).group(1)
-
     def _action(self):
         """
         Check that hierarchies are the same
         :return:
         """
-        def check_if_same_objects(obj_1, obj_2):
-            obj_diff_1 = []
-            obj_diff_2 = []
-            children_data_1 = {HierarchyCheckTool.trim_name(child_1.name()): child_1 for child_1 in
-                               pm.listRelatives(obj_1, children=True)}
-            children_data_2 = {HierarchyCheckTool.trim_name(child_2.name()): child_2 for child_2 in
-                               pm.listRelatives(obj_2, children=True)}
-            children_name_1 = list(children_data_1.keys())
-            children_name_1_copy = children_name_1.copy()
-            children_name_2 = list(children_data_2.keys())
-            corresp = []
-            # Check Correspondences objects1 --> objects2
-            for child_name_1 in children_name_1:
-                child_1 = children_data_1[child_name_1]
-                if child_name_1 in children_name_2:
-                    child_2 = children_data_2[child_name_1]
-                    child_1_type = child_1.nodeType()
-                    child_2_type = child_2.nodeType()
-                    processed = False
-                    if child_1_type != child_2_type:
-                        # Type Different
-                        obj_diff_1.append((child_1, "type"))
-                        obj_diff_2.append((child_2, "type"))
-                        processed = True
-                    elif child_1_type == "mesh":
-                        child_1_nb_vertices = len(child_1.vtx)
-                        child_2_nb_vertices = len(child_2.vtx)
-                        if child_1_nb_vertices != child_2_nb_vertices:
-                            # If count vertices different
-                            obj_diff_1.append((child_1, "mesh"))
-                            obj_diff_2.append((child_2, "mesh"))
-                            processed = True
-                    if not processed:
-                        # Corresp found
-                        corresp.append((child_1, child_2))
-                    children_name_2.remove(child_name_1)
-                    children_name_1_copy.remove(child_name_1)
-                else:
-                    obj_diff_1.append((child_1, "name"))
-
-            # Check Correspondences objects2 --> objects1
-            for child_name_2 in children_name_2:
-                if child_name_2 in children_name_1_copy:
-                    corresp.append((children_data_1[child_name_2], children_data_2[child_name_2]))
-                else:
-                    obj_diff_2.append((children_data_2[child_name_2], "name"))
-
-            # Recursive Check
-            for corresp_data in corresp:
-                res1, res2 = check_if_same_objects(corresp_data[0], corresp_data[1])
-                for object_data_diff in res1:
-                    if object_data_diff[0] not in obj_diff_1:
-                        obj_diff_1.append(object_data_diff)
-                for object_data_diff in res2:
-                    if object_data_diff[0] not in obj_diff_2:
-                        obj_diff_2.append(object_data_diff)
-            return obj_diff_1, obj_diff_2
-
         if len(self.__selection) >= 2:
             sel_1 = self.__selection[0]
             sel_2 = self.__selection[1]
-            objects_diff_data_1, objects_diff_data_2 = check_if_same_objects(sel_1, sel_2)
+            diff = hierarchy_diff.diff_hierarchies(sel_1, sel_2)
+            objects_diff_data_1 = diff["only_1"]
+            objects_diff_data_2 = diff["only_2"]
 
             if len(objects_diff_data_1) == 0 and len(objects_diff_data_2) == 0:
                 msg = QMessageBox()
@@ -242,19 +177,21 @@ class HierarchyCheckTool(ActionTool):
         """
         self._action_btn.setEnabled(len(self.__selection) >= 2)
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
         Reieve the selection
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__selection = pm.ls(sl=True)
+        self.__selection = snapshot.get_selection()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -263,6 +200,6 @@ class HierarchyCheckTool(ActionTool):
         :return:
         """
         layout = super(HierarchyCheckTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
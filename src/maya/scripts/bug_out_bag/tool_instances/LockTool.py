@@ -1,7 +1,9 @@
 from ..tool_models.MultipleActionTool import *
+from common.lock_utils import *
 
 
 class LockTool(MultipleActionTool):
+    _scene_dependencies = [BobTool.SELECTION, BobTool.DAG]
 
     def __init__(self):
         actions = {
@@ -30,19 +32,20 @@ class LockTool(MultipleActionTool):
         self.__refresh_ui()
         return layout
 
-    def __get_transforms_selected(self):
+    def __get_transforms_selected(self, snapshot=None):
         """
         Get the selected transform nodes (recursive)
+        :param snapshot: SelectionSnapshot (the current selection if None)
         :return: transforms
         """
-        selection = pm.ls(selection=True, type="transform")
+        if snapshot is None:
+            snapshot = SelectionSnapshot()
         if self.__ignore_root:
             transforms = []
         else:
-            transforms = selection
+            transforms = snapshot.get_selected_transforms()
         if self.__select_children:
-            for sel in selection:
-                transforms.extend(pm.listRelatives(sel, allDescendents=True, type="transform"))
+            transforms.extend(snapshot.get_descendant_transforms())
         return transforms
 
     def __lock_selection(self):
@@ -50,11 +53,7 @@ class LockTool(MultipleActionTool):
         Lock all the transform nodes selected
         :return:
         """
-        selection = self.__get_transforms_selected()
-        for transform in selection:
-            transform.translate.lock()
-            transform.rotate.lock()
-            transform.scale.lock()
+        set_locked(self.__get_transforms_selected(), True, TRS_COMPOUND_ATTRIBUTES)
         self.__refresh_ui()
 
     def __unlock_selection(self):
@@ -62,61 +61,28 @@ class LockTool(MultipleActionTool):
         Unlock all the transform nodes selected
         :return:
         """
-        selection = self.__get_transforms_selected()
-        for transform in selection:
-            transform.translate.unlock()
-            transform.translateX.unlock()
-            transform.translateY.unlock()
-            transform.translateZ.unlock()
-            transform.rotate.unlock()
-            transform.rotateX.unlock()
-            transform.rotateY.unlock()
-            transform.rotateZ.unlock()
-            transform.scale.unlock()
-            transform.scaleX.unlock()
-            transform.scaleY.unlock()
-            transform.scaleZ.unlock()
+        set_locked(self.__get_transforms_selected(), False)
         self.__refresh_ui()
 
-    def __refresh_ui(self):
+    def __refresh_ui(self, snapshot=None):
         """
         Refresh the UI
+        :param snapshot: SelectionSnapshot (the current selection if None)
         :return:
         """
-        selection = self.__get_transforms_selected()
-        unlocked = False
-        locked = False
-        for transform in selection:
-            t_locked = transform.translate.isLocked()
-            tx_locked = transform.translateX.isLocked()
-            ty_locked = transform.translateY.isLocked()
-            tz_locked = transform.translateZ.isLocked()
-            r_locked = transform.rotate.isLocked()
-            rx_locked = transform.rotateX.isLocked()
-            ry_locked = transform.rotateY.isLocked()
-            rz_locked = transform.rotateZ.isLocked()
-            s_locked = transform.scale.isLocked()
-            sx_locked = transform.scaleX.isLocked()
-            sy_locked = transform.scaleY.isLocked()
-            sz_locked = transform.scaleZ.isLocked()
-            unlocked |= t_locked or tx_locked or ty_locked or tz_locked or \
-                        r_locked or rx_locked or ry_locked or rz_locked or \
-                        s_locked or sx_locked or sy_locked or sz_locked
-            locked |= not t_locked or not tx_locked or not ty_locked or not tz_locked or \
-                      not r_locked or not rx_locked or not ry_locked or not rz_locked or \
-                      not s_locked or not sx_locked or not sy_locked or not sz_locked
-            if locked and unlocked: break
+        lock_snapshot = LockSnapshot(self.__get_transforms_selected(snapshot))
         if "button" in self._actions["lock"]:
-            self._actions["lock"]["button"].setEnabled(locked)
+            self._actions["lock"]["button"].setEnabled(lock_snapshot.has_unlocked())
         if "button" in self._actions["unlock"]:
-            self._actions["unlock"]["button"].setEnabled(unlocked)
+            self._actions["unlock"]["button"].setEnabled(lock_snapshot.has_locked())
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the UI on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__refresh_ui()
+        self.__refresh_ui(snapshot)
 
     def on_dag_changed(self):
         """
@@ -4,6 +4,9 @@ from common.utils import *
 
 
 class OverrideKillerTool(ActionTool):
+    # Works on the whole scene when run so no scene event is followed
+    _scene_dependencies = []
+
     def __init__(self):
         super().__init__(name="Override Killer", pref_name="override_killer",
                          description="Disable all the \"Enable Overrides\" in the scene", button_text="Run")
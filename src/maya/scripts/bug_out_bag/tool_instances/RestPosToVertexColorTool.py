@@ -1,101 +1,260 @@
-import maya.OpenMaya as OpenMaya
-from ..tool_models.ActionTool import *
+import os
+
+import maya.api.OpenMaya as om2
+from ..tool_models.MultipleActionTool import *
 from common.utils import *
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_COLOR_SET_NAME = "Pref"
+
+BAKE_POSITIONS = "positions"
+BAKE_VELOCITIES = "velocities"
 
-class RestPosToVertexColorTool(ActionTool):
+
+class RestPosToVertexColorTool(MultipleActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
 
     @staticmethod
-    def store_rest(shape):
+    def __points_to_colors(points):
         """
-        Store the rest pos to the color vertex of the shape
-        :param shape
-        :return:
+        Convert points to colors (x, y, z to r, g, b)
+        :param points: om2.MPointArray
+        :return: om2.MColorArray
         """
-        print(shape)
-        color_set_name = "Pref"
-
-        mobj = shape.__apimobject__()
-        dag_path = shape.__apimdagpath__()
-        mesh_fn = OpenMaya.MFnMesh(mobj)
-
-        # Check if the color set exists and create it if it doesn't
-        existing_color_sets = pm.polyColorSet(shape, query=True, allColorSets=True) or []
+        if numpy is None:
+            return om2.MColorArray([(point.x, point.y, point.z) for point in points])
+        # One contiguous copy of the points, one slice of their xyz columns then one call to build the colors
+        rgb = numpy.array(points, dtype=numpy.float64).reshape(-1, 4)[:, :3]
+        return om2.MColorArray(rgb.tolist())
 
-        if color_set_name not in existing_color_sets:
-            pm.polyColorSet(shape, create=True, colorSet=color_set_name, clamped=False, rpt="RGB")
+    @staticmethod
+    def __vertex_indices(nb_vertices):
+        """
+        Get the indices of all the vertices of a mesh
+        :param nb_vertices
+        :return: om2.MIntArray
+        """
+        if numpy is None:
+            return om2.MIntArray(range(nb_vertices))
+        return om2.MIntArray(numpy.arange(nb_vertices, dtype=numpy.int32).tolist())
 
-        # Set "Pref" as the current color set
-        mesh_fn.setCurrentColorSetName(color_set_name)
+    @staticmethod
+    def store_rest_batch(shapes):
+        """
+        Store the rest pos to the color vertex of many shapes
+        :param shapes
+        :return:
+        """
+        if len(shapes) == 0:
+            return
+        # Create the missing color sets
+        for shape in shapes:
+            existing_color_sets = pm.polyColorSet(shape, query=True, allColorSets=True) or []
+            if _COLOR_SET_NAME not in existing_color_sets:
+                pm.polyColorSet(shape, create=True, colorSet=_COLOR_SET_NAME, clamped=False, rpt="RGB")
 
-        vertex_color_list = OpenMaya.MColorArray()
-        mesh_fn.getVertexColors(vertex_color_list)
-        len_vertex_list = vertex_color_list.length()
+        sel_list = om2.MSelectionList()
+        for shape in shapes:
+            sel_list.add(str(shape))
+        for i in range(sel_list.length()):
+            mesh_fn = om2.MFnMesh(sel_list.getDagPath(i))
+            # Set "Pref" as the current color set
+            mesh_fn.setCurrentColorSetName(_COLOR_SET_NAME)
+            points = mesh_fn.getPoints(om2.MSpace.kWorld)
+            colors = RestPosToVertexColorTool.__points_to_colors(points)
+            mesh_fn.setVertexColors(colors, RestPosToVertexColorTool.__vertex_indices(len(points)))
 
-        fn_component = OpenMaya.MFnSingleIndexedComponent()
-        fn_component.create(OpenMaya.MFn.kMeshVertComponent)
-        fn_component.setCompleteData(len_vertex_list)
+    @staticmethod
+    def bake_frame_range(shapes, start_frame, end_frame, output_dir, mode=BAKE_POSITIONS):
+        """
+        Bake the world positions (or the velocities in units per frame) of many shapes on a frame range in
+        memory-mapped npy files of shape (frames, vertices, 3). Each frame is evaluated once for all the shapes
+        :param shapes
+        :param start_frame
+        :param end_frame
+        :param output_dir
+        :param mode: BAKE_POSITIONS or BAKE_VELOCITIES
+        :return: dict of shape name to the file baked
+        """
+        if numpy is None:
+            print_warning("numpy is required to bake the positions")
+            return {}
+        start_frame = int(start_frame)
+        end_frame = int(end_frame)
+        if len(shapes) == 0 or end_frame < start_frame:
+            return {}
+        nb_frames = end_frame - start_frame + 1
 
-        vertex_index_list = OpenMaya.MIntArray()
-        fn_component.getElements(vertex_index_list)
+        sel_list = om2.MSelectionList()
+        for shape in shapes:
+            sel_list.add(str(shape))
+        bakes = []
+        try:
+            for i in range(sel_list.length()):
+                dag_path = sel_list.getDagPath(i)
+                mesh_fn = om2.MFnMesh(dag_path)
+                shape_name = dag_path.partialPathName()
+                file_name = shape_name.replace("|", "_").replace(":", "_") + "_" + mode + ".npy"
+                file_path = os.path.join(output_dir, file_name).replace("\\", "/")
+                # Written to a temporary file renamed once the bake is complete
+                temp_path = file_path + ".tmp"
+                # The memory map is only referenced by the bake so that it can be closed
+                bakes.append({"name": shape_name, "mesh_fn": mesh_fn, "path": file_path, "temp_path": temp_path,
+                              "cache": numpy.lib.format.open_memmap(temp_path, mode="w+", dtype=numpy.float32,
+                                                                    shape=(nb_frames, mesh_fn.numVertices, 3)),
+                              "previous": None})
 
-        # Get the vertex positions using the provided code
-        in_mesh_m_point_array = OpenMaya.MPointArray()
-        current_in_mesh_m_fn_mesh = OpenMaya.MFnMesh(dag_path)
-        current_in_mesh_m_fn_mesh.getPoints(in_mesh_m_point_array, OpenMaya.MSpace.kWorld)
+            current_time = pm.currentTime(query=True)
+            pm.refresh(suspend=True)
+            try:
+                for frame_index in range(nb_frames):
+                    pm.currentTime(start_frame + frame_index, update=True)
+                    for bake in bakes[:]:
+                        points = numpy.array(bake["mesh_fn"].getPoints(om2.MSpace.kWorld),
+                                             dtype=numpy.float32)[:, :3]
+                        if points.shape[0] != bake["cache"].shape[1]:
+                            print_warning("Topology of " + bake["name"] + " changes over time, bake skipped")
+                            bakes.remove(bake)
+                            RestPosToVertexColorTool.__discard_bake(bake)
+                            continue
+                        if mode == BAKE_VELOCITIES:
+                            previous = bake["previous"]
+                            if previous is not None:
+                                bake["cache"][frame_index] = points - previous
+                                if frame_index == 1:
+                                    # No frame before the first one so use the forward difference
+                                    bake["cache"][0] = bake["cache"][1]
+                            bake["previous"] = points
+                        else:
+                            bake["cache"][frame_index] = points
+            finally:
+                pm.currentTime(current_time, update=True)
+                pm.refresh(suspend=False)
 
-        point_list = []
-        for i in range(in_mesh_m_point_array.length()):
-            point_list.append([in_mesh_m_point_array[i][0], in_mesh_m_point_array[i][1], in_mesh_m_point_array[i][2]])
+            files = {}
+            while len(bakes) > 0:
+                bake = bakes[0]
+                bake["cache"].flush()
+                # Release the memory map before renaming its file
+                bake["cache"] = None
+                os.replace(bake["temp_path"], bake["path"])
+                bakes.pop(0)
+                files[bake["name"]] = bake["path"]
+            return files
+        finally:
+            # Bakes not completed because of an error
+            for bake in bakes:
+                RestPosToVertexColorTool.__discard_bake(bake)
 
-        # Set the vertex colors using the vertex positions
-        for k in range(len_vertex_list):
-            vertex_color_list[k].r = point_list[k][0]
-            vertex_color_list[k].g = point_list[k][1]
-            vertex_color_list[k].b = point_list[k][2]
+    @staticmethod
+    def __discard_bake(bake):
+        """
+        Close the memory map of an incomplete bake and delete its file
+        :param bake
+        :return:
+        """
+        # The file can't be deleted while it is mapped on Windows
+        bake["cache"] = None
+        try:
+            os.remove(bake["temp_path"])
+        except OSError:
+            pass
 
-        mesh_fn.setVertexColors(vertex_color_list, vertex_index_list, None)
+    @staticmethod
+    def store_rest(shape):
+        """
+        Store the rest pos to the color vertex of the shape
+        :param shape
+        :return:
+        """
+        RestPosToVertexColorTool.store_rest_batch([shape])
 
     def __init__(self):
+        actions = {
+            "store": {
+                "text": "Store rest",
+                "action": self.__store,
+                "row": 0
+            },
+            "bake_positions": {
+                "text": "Bake positions",
+                "action": lambda: self.__bake(BAKE_POSITIONS),
+                "row": 1
+            },
+            "bake_velocities": {
+                "text": "Bake velocities",
+                "action": lambda: self.__bake(BAKE_VELOCITIES),
+                "row": 1
+            }
+        }
+        tooltip = "Store rest position to the vertex color or bake the positions/velocities " \
+                  "of the playback range to npy files"
         super().__init__(name="Rest Pos to Vertex Color", pref_name="rest_pos_to_vertex_color_tool",
-                         description="Store rest position to the vertex color", button_text="Store")
+                         actions=actions, stretch=1, tooltip=tooltip)
         self.__selection = []
 
-    def _action(self):
+    def __store(self):
         """
         Rest pos to Color Vertex on all selected transforms and shapes
         :return:
         """
-        selection = self.__selection
-        for elem in selection:
-            RestPosToVertexColorTool.store_rest(elem)
-        pm.select(selection)
+        pm.undoInfo(openChunk=True)
+        try:
+            selection = self.__selection
+            RestPosToVertexColorTool.store_rest_batch(selection)
+            pm.select(selection)
+        finally:
+            pm.undoInfo(closeChunk=True)
+
+    def __bake(self, mode):
+        """
+        Bake the selected shapes on the playback range in a folder chosen by the user
+        :param mode: BAKE_POSITIONS or BAKE_VELOCITIES
+        :return:
+        """
+        output_dir = QFileDialog.getExistingDirectory(None, "Select Bake Directory", os.path.dirname(pm.sceneName()))
+        if len(output_dir) == 0:
+            return
+        start_frame = pm.playbackOptions(query=True, minTime=True)
+        end_frame = pm.playbackOptions(query=True, maxTime=True)
+        files = RestPosToVertexColorTool.bake_frame_range(self.__selection, start_frame, end_frame, output_dir, mode)
+        for file_path in files.values():
+            print("Baked : " + file_path)
 
     def __refresh_btn(self):
         """
-        Refresh the button
+        Refresh the buttons
         :return:
         """
-        self._action_btn.setEnabled(len(self.__selection) > 0)
+        enabled = len(self.__selection) > 0
+        for action in self._actions.values():
+            if "button" in action:
+                action["button"].setEnabled(enabled)
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
         Retrieve the selected transforms and shapes
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        transform = pm.ls(sl=True)
-        shapes = pm.ls(sl=True, shapes=True)
-        self.__selection = pm.listRelatives(transform, ad=True, type="mesh")
-        for shape in shapes:
-            if shape not in self.__selection:
+        self.__selection = snapshot.get_descendant_meshes()
+        selection_set = set(self.__selection)
+        for shape in snapshot.get_selected_shapes():
+            if shape not in selection_set:
+                selection_set.add(shape)
                 self.__selection.append(shape)
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -104,6 +263,6 @@ class RestPosToVertexColorTool(ActionTool):
         :return:
         """
         layout = super(RestPosToVertexColorTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
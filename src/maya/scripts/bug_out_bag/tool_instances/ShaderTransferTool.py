@@ -1,8 +1,12 @@
+import maya.api.OpenMaya as om2
+
 from ..tool_models.ActionTool import *
 from common.utils import *
+from common.hierarchy_diff import trim_name
 
 
 class ShaderTransferTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
 
     def __init__(self):
         tooltip = "Select 2 objects (first is the source and second is the target) then click Transfer"
@@ -11,6 +15,139 @@ class ShaderTransferTool(ActionTool):
                          button_text="Transfer", tooltip=tooltip)
         self.__selection = []
 
+    @staticmethod
+    def __index_meshes(meshes):
+        """
+        Index meshes by trimmed name (the ShapeOrig are ignored)
+        :param meshes
+        :return: dict of trimmed name to list of om2.MDagPath
+        """
+        sel_list = om2.MSelectionList()
+        for mesh in meshes:
+            sel_list.add(str(mesh))
+        index = {}
+        for i in range(sel_list.length()):
+            dag_path = sel_list.getDagPath(i)
+            name = trim_name(dag_path.partialPathName())
+            if "ShapeOrig" in name:
+                continue
+            index.setdefault(name, []).append(dag_path)
+        return index
+
+    @staticmethod
+    def match_meshes(meshes_source, meshes_target):
+        """
+        Match the source meshes with the target meshes by trimmed name in a single pass
+        :param meshes_source
+        :param meshes_target
+        :return: list of (source om2.MDagPath, target om2.MDagPath), unmatched names, ambiguous names
+        """
+        index_source = ShaderTransferTool.__index_meshes(meshes_source)
+        index_target = ShaderTransferTool.__index_meshes(meshes_target)
+        matches = []
+        unmatched = []
+        ambiguous = []
+        for name, paths_source in index_source.items():
+            paths_target = index_target.get(name)
+            if paths_target is None:
+                unmatched.append(name)
+            elif len(paths_source) > 1 or len(paths_target) > 1:
+                ambiguous.append(name)
+            else:
+                matches.append((paths_source[0], paths_target[0]))
+        for name in index_target.keys():
+            if name not in index_source:
+                unmatched.append(name)
+        return matches, sorted(unmatched), sorted(ambiguous)
+
+    @staticmethod
+    def __is_same_topology(mesh_fn_source, mesh_fn_target):
+        """
+        Check that two meshes have the same faces (same vertices in the same order)
+        :param mesh_fn_source
+        :param mesh_fn_target
+        :return: boolean
+        """
+        if mesh_fn_source.numVertices != mesh_fn_target.numVertices or \
+                mesh_fn_source.numEdges != mesh_fn_target.numEdges or \
+                mesh_fn_source.numPolygons != mesh_fn_target.numPolygons:
+            return False
+        counts_source, connects_source = mesh_fn_source.getVertices()
+        counts_target, connects_target = mesh_fn_target.getVertices()
+        return list(counts_source) == list(counts_target) and list(connects_source) == list(connects_target)
+
+    @staticmethod
+    def __face_ranges(face_ids):
+        """
+        Compress sorted face indices to ranges
+        :param face_ids
+        :return: list of (first, last)
+        """
+        ranges = []
+        for face_id in face_ids:
+            if len(ranges) > 0 and ranges[-1][1] == face_id - 1:
+                ranges[-1][1] = face_id
+            else:
+                ranges.append([face_id, face_id])
+        return ranges
+
+    @staticmethod
+    def __add_shading_members(shading_members, path_source, path_target):
+        """
+        Add the target faces to the shading groups of the matching source faces
+        :param shading_members: dict of shading group to members
+        :param path_source
+        :param path_target
+        :return:
+        """
+        shaders, face_shader_ids = om2.MFnMesh(path_source).getConnectedShaders(path_source.instanceNumber())
+        target_name = path_target.fullPathName()
+        faces_by_shader = {}
+        for face_id, shader_id in enumerate(face_shader_ids):
+            if shader_id >= 0:
+                faces_by_shader.setdefault(shader_id, []).append(face_id)
+        for shader_id, face_ids in faces_by_shader.items():
+            shading_group = om2.MFnDependencyNode(shaders[shader_id]).name()
+            members = shading_members.setdefault(shading_group, [])
+            if len(face_ids) == len(face_shader_ids):
+                # Whole object assignment
+                members.append(target_name)
+            else:
+                for first, last in ShaderTransferTool.__face_ranges(face_ids):
+                    members.append(target_name + ".f[" + str(first) + ":" + str(last) + "]")
+
+    @staticmethod
+    def transfer(meshes_source, meshes_target):
+        """
+        Transfer the shading groups of source meshes to the target meshes with the same trimmed name.
+        The membership is copied directly between meshes with the same topology and with transferShadingSets otherwise
+        :param meshes_source
+        :param meshes_target
+        :return: dict with the matched, unmatched and ambiguous names and the number of direct transfers
+        """
+        matches, unmatched, ambiguous = ShaderTransferTool.match_meshes(meshes_source, meshes_target)
+        shading_members = {}
+        different_topologies = []
+        for path_source, path_target in matches:
+            if ShaderTransferTool.__is_same_topology(om2.MFnMesh(path_source), om2.MFnMesh(path_target)):
+                ShaderTransferTool.__add_shading_members(shading_members, path_source, path_target)
+            else:
+                different_topologies.append((path_source, path_target))
+
+        # One call by shading group for all the meshes with the same topology
+        for shading_group, members in shading_members.items():
+            pm.sets(shading_group, forceElement=members)
+        for path_source, path_target in different_topologies:
+            pm.select([path_source.fullPathName(), path_target.fullPathName()], replace=True)
+            pm.transferShadingSets(sampleSpace=0, searchMethod=3)
+
+        return {
+            "matched": sorted(trim_name(path.partialPathName()) for path, _ in matches),
+            "unmatched": unmatched,
+            "ambiguous": ambiguous,
+            "nb_direct": len(matches) - len(different_topologies)
+        }
+
     def _action(self):
         """
         Transfer shader from first selection to second selection
@@ -20,15 +157,38 @@ class ShaderTransferTool(ActionTool):
             meshes_source = pm.listRelatives(self.__selection[0], allDescendents=True, type="mesh")
             meshes_target = pm.listRelatives(self.__selection[1], allDescendents=True, type="mesh")
 
-            for mesh_s in meshes_source:
-                if "ShapeOrig" not in mesh_s.name():
-                    mesh_s_name = mesh_s.name(long=None)
-                    for mesh_t in meshes_target:
-                        mesh_t_name = mesh_t.name(long=None)
-                        if mesh_s_name == mesh_t_name:
-                            pm.select(mesh_s, r=True)
-                            pm.select(mesh_t, tgl=True)
-                            pm.transferShadingSets(sampleSpace=0, searchMethod=3)
+            pm.undoInfo(openChunk=True)
+            try:
+                report = ShaderTransferTool.transfer(meshes_source, meshes_target)
+                pm.select(self.__selection)
+            finally:
+                pm.undoInfo(closeChunk=True)
+
+            self.__show_report(report)
+
+    @staticmethod
+    def __show_report(report):
+        """
+        Show the report of a transfer in a message box
+        :param report: dict returned by transfer
+        :return:
+        """
+        msg = QMessageBox()
+        msg.setWindowTitle("Shader Transfer")
+        msg.setText(str(len(report["matched"])) + " matched (" + str(report["nb_direct"]) +
+                    " with the same topology), " + str(len(report["unmatched"])) + " unmatched, " +
+                    str(len(report["ambiguous"])) + " ambiguous")
+        details = []
+        if len(report["unmatched"]) > 0:
+            details.append("Unmatched : " + ", ".join(report["unmatched"]))
+        if len(report["ambiguous"]) > 0:
+            details.append("Ambiguous names not transferred : " + ", ".join(report["ambiguous"]))
+        if len(details) > 0:
+            msg.setIcon(QMessageBox.Warning)
+            msg.setDetailedText("\n".join(details))
+        else:
+            msg.setIcon(QMessageBox.Information)
+        msg.exec_()
 
     def __refresh_btn(self):
         """
@@ -37,19 +197,21 @@ class ShaderTransferTool(ActionTool):
         """
         self._action_btn.setEnabled(len(self.__selection) >= 2)
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
         Retrieve the selection
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__selection = pm.ls(sl=True)
+        self.__selection = snapshot.get_selection()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -58,6 +220,6 @@ class ShaderTransferTool(ActionTool):
         :return:
         """
         layout = super(ShaderTransferTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
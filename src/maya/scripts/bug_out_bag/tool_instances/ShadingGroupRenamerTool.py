@@ -2,6 +2,9 @@ from ..tool_models.ActionTool import *
 
 
 class ShadingGroupRenamerTool(ActionTool):
+    # Works on the whole scene when run so no scene event is followed
+    _scene_dependencies = []
+
     def __init__(self):
         super().__init__(name="Shading Group Renamer",pref_name="shading_group_renamer",
                          description="Rename Shading Group from Surface Shader", button_text="Rename")
@@ -2,6 +2,8 @@ from ..tool_models.ActionTool import *
 from common.utils import *
 
 class ShapeRenamerTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
+
     def __init__(self):
         super().__init__(name="Shape Renamer", pref_name="shape_renamer_tool",
                          description="Rename the shapes of selection", button_text="Rename")
@@ -15,13 +17,14 @@ class ShapeRenamerTool(ActionTool):
         for data in self.__selection:
             pm.rename(data["shapes"][0],data["transform"].name()+"Shape")
 
-    def __retrieve_selection(self):
+    def __retrieve_selection(self, snapshot):
         """
         Retrieve the selected shapes with their transforms
+        :param snapshot: SelectionSnapshot
         :return:
         """
         self.__selection = []
-        for sl in pm.ls(selection=True, type="transform"):
+        for sl in snapshot.get_selected_transforms():
             shapes = pm.listRelatives(sl, shapes=True)
             if len(shapes) > 0:
                 self.__selection.append({"transform": sl, "shapes": shapes})
@@ -33,12 +36,13 @@ class ShapeRenamerTool(ActionTool):
         """
         self._action_btn.setEnabled(len(self.__selection) > 0)
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_selection()
+        self.__retrieve_selection(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -47,6 +51,6 @@ class ShapeRenamerTool(ActionTool):
         :return:
         """
         layout = super(ShapeRenamerTool, self).populate()
-        self.__retrieve_selection()
+        self.__retrieve_selection(SelectionSnapshot())
         self.__refresh_btn()
         return layout
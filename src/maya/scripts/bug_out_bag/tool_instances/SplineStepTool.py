@@ -3,6 +3,8 @@ from common.utils import *
 
 
 class SplineStepTool(MultipleActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
+
     def __init__(self):
         actions = {
             "spline": {
@@ -82,20 +84,22 @@ class SplineStepTool(MultipleActionTool):
         if "button" in self._actions["keyframe_spline"]:
             self._actions["keyframe_spline"]["button"].setEnabled(keys_btn_enabled)
 
-    def __retrieve_datas(self):
+    def __retrieve_datas(self, snapshot):
         """
         Retrieve all the transforms selected (recursive)
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__selected = pm.ls(selection=True)
-        self.__selected.extend(pm.listRelatives(allDescendents=True, type="transform"))
+        self.__selected = snapshot.get_selection()
+        self.__selected.extend(snapshot.get_descendant_transforms())
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Retrieve datas and refresh buttons on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_datas()
+        self.__retrieve_datas(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -104,6 +108,6 @@ class SplineStepTool(MultipleActionTool):
         :return:
         """
         layout = super(SplineStepTool, self).populate()
-        self.__retrieve_datas()
+        self.__retrieve_datas(SelectionSnapshot())
         self.__refresh_btn()
         return layout
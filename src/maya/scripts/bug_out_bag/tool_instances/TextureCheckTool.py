@@ -54,6 +54,15 @@ _KNOWN_COLORSPACE = [
     }
 ]
 
+# Regexps of the known colorspaces compiled once
+_KNOWN_COLORSPACE_COMPILED = [
+    {
+        "name": colorspace_data["name"],
+        "name_regexp": re.compile(colorspace_data["name_regexp"], re.IGNORECASE),
+        "regexp": [(re.compile(regexp, re.IGNORECASE), cs_imp) for regexp, cs_imp in colorspace_data["regexp"].items()]
+    } for colorspace_data in _KNOWN_COLORSPACE
+]
+
 _STYLESHEET_FOUND = {
     "enabled": ".QPushButton{background-color:rgb(137,137,255);color:black}",
     "disabled": ".QPushButton{background-color:rgb(40,40,100);color:gray}",
@@ -69,6 +78,8 @@ _STYLESHEET_COLORSPACE_NOT_FOUND = {
 
 
 class TextureCheckTool(ActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
+
     def __init__(self):
 
         tooltip = "Check if File Nodes with same file have different colorspaces or" \
@@ -117,9 +128,10 @@ class TextureCheckTool(ActionTool):
         """
         self._action_btn.setEnabled(not self.__dialog_opened and len(pm.ls(type="file")) > 0)
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
         self.__refresh_btn()
@@ -135,10 +147,23 @@ class TextureCheckDialog(QDialog):
 
         # Model attributes
         self.__known_cs = _KNOWN_COLORSPACE
+        # Cache of the known colorspace matching a colorspace of a file node
+        self.__known_cs_by_colorspace = {}
         self.__bad_cs_tex = {}
-        self.__script_jobs = []
         self.__opened = False
 
+        # File nodes watched by hash of their MObjectHandle : {"handle", "filepath", "callback"}
+        self.__file_nodes = {}
+        # Hashes of the file nodes by filepath
+        self.__file_nodes_by_path = {}
+        self.__node_created_callback = None
+        self.__node_deleted_callback = None
+        # Filepaths to audit again (the changes are coalesced until the next event loop)
+        self.__pending_paths = set()
+        self.__audit_timer = QTimer(self)
+        self.__audit_timer.setSingleShot(True)
+        self.__audit_timer.timeout.connect(self.__audit_pending_paths)
+
         # UI attributes
         self.__ui_width = 700
         self.__ui_height = 400
@@ -159,35 +184,152 @@ class TextureCheckDialog(QDialog):
         self.__create_ui()
         self.refresh_ui()
 
-    def __on_node_changed(self, filepath):
+    @staticmethod
+    def __read_file_node(mobj):
+        """
+        Read the name, the filepath and the colorspace of a file node
+        :param mobj: MObject of the file node
+        :return: name, filepath, colorspace
+        """
+        fn_node = OpenMaya.MFnDependencyNode(mobj)
+        return fn_node.name(), fn_node.findPlug("fileTextureName", False).asString(), \
+            fn_node.findPlug("colorSpace", False).asString()
+
+    def __watch_file_node(self, mobj):
+        """
+        Index a file node and route its attribute changes to the dispatcher
+        :param mobj: MObject of the file node
+        :return: filepath of the file node
+        """
+        handle = OpenMaya.MObjectHandle(mobj)
+        filepath = self.__read_file_node(mobj)[1]
+        callback = OpenMaya.MNodeMessage.addAttributeChangedCallback(mobj, self.__on_attribute_changed)
+        self.__file_nodes[handle.hashCode()] = {"handle": handle, "filepath": filepath, "callback": callback}
+        self.__file_nodes_by_path.setdefault(filepath, set()).add(handle.hashCode())
+        return filepath
+
+    def __unwatch_file_node(self, node_hash):
+        """
+        Remove a file node from the index and remove its callback
+        :param node_hash: hash of the MObjectHandle of the file node
+        :return: filepath of the file node
+        """
+        file_node = self.__file_nodes.pop(node_hash)
+        OpenMaya.MMessage.removeCallback(file_node["callback"])
+        self.__file_nodes_by_path[file_node["filepath"]].discard(node_hash)
+        if len(self.__file_nodes_by_path[file_node["filepath"]]) == 0:
+            self.__file_nodes_by_path.pop(file_node["filepath"])
+        return file_node["filepath"]
+
+    def __unwatch_all(self):
+        """
+        Remove all the file nodes from the index and remove their callbacks
+        :return:
+        """
+        for node_hash in list(self.__file_nodes.keys()):
+            self.__unwatch_file_node(node_hash)
+        self.__pending_paths.clear()
+
+    def __request_audit(self, filepath):
+        """
+        Ask to audit again a filepath on the next event loop
+        :param filepath
+        :return:
+        """
+        self.__pending_paths.add(filepath)
+        self.__audit_timer.start(0)
+
+    def __audit_pending_paths(self):
         """
-        Refresh the datas and the ui of the filepath corresponding
-        :param filepath:
+        Audit again the filepaths modified and refresh the ui
         :return:
         """
-        self.__clear_script_jobs()
-        if filepath in self.__bad_cs_tex:
-            self.__bad_cs_tex.pop(filepath)
-        self.build_bad_cs_tex(self.__bad_cs_tex, filepath)
+        if not self.__opened:
+            return
+        for filepath in self.__pending_paths:
+            self.__audit_filepath(filepath)
+        self.__pending_paths.clear()
         self.refresh_ui()
 
+    def __get_indexed_file_nodes(self, filepath):
+        """
+        Get the file nodes of a filepath from the index
+        :param filepath
+        :return: list of (MObjectHandle of the file node, colorspace)
+        """
+        file_nodes = []
+        for node_hash in self.__file_nodes_by_path.get(filepath, []):
+            handle = self.__file_nodes[node_hash]["handle"]
+            if handle.isValid():
+                colorspace = OpenMaya.MFnDependencyNode(handle.object()).findPlug("colorSpace", False).asString()
+                file_nodes.append((handle, colorspace))
+        return file_nodes
+
+    @staticmethod
+    def __get_file_node_names(handles):
+        """
+        Get the current names of file nodes (they can have been renamed since they were indexed)
+        :param handles: MObjectHandles of the file nodes
+        :return: names of the file nodes still existing
+        """
+        return [OpenMaya.MFnDependencyNode(handle.object()).name() for handle in handles if handle.isValid()]
+
+    def __audit_filepath(self, filepath):
+        """
+        Refresh the datas of a filepath
+        :param filepath
+        :return:
+        """
+        self.__bad_cs_tex.pop(filepath, None)
+        file_nodes = self.__get_indexed_file_nodes(filepath)
+        if len(file_nodes) > 0:
+            self.__build_bad_cs_tex_from_nodes(self.__bad_cs_tex, filepath, file_nodes)
+
+    def __on_attribute_changed(self, msg, plug, other_plug, client_data):
+        """
+        Dispatcher of the attribute changes of the file nodes. Audit again only the filepaths concerned
+        :param msg
+        :param plug
+        :param other_plug
+        :param client_data
+        :return:
+        """
+        if not msg & OpenMaya.MNodeMessage.kAttributeSet:
+            return
+        attribute_name = OpenMaya.MFnAttribute(plug.attribute()).name()
+        if attribute_name not in ["fileTextureName", "colorSpace"]:
+            return
+        node_hash = OpenMaya.MObjectHandle(plug.node()).hashCode()
+        if node_hash not in self.__file_nodes:
+            return
+        file_node = self.__file_nodes[node_hash]
+        old_filepath = file_node["filepath"]
+        self.__request_audit(old_filepath)
+        if attribute_name == "fileTextureName":
+            new_filepath = plug.asString()
+            if new_filepath != old_filepath:
+                self.__file_nodes_by_path[old_filepath].discard(node_hash)
+                if len(self.__file_nodes_by_path[old_filepath]) == 0:
+                    self.__file_nodes_by_path.pop(old_filepath)
+                self.__file_nodes_by_path.setdefault(new_filepath, set()).add(node_hash)
+                file_node["filepath"] = new_filepath
+                self.__request_audit(new_filepath)
+
     def __on_file_created(self, *args, **kwargs):
         """
         On file node created refresh the datas and the ui of its filepath
         :return:
         """
-        pm.select(OpenMaya.MFnDependencyNode(args[0]).name())
-        filepath = pm.ls(selection=True)[0].fileTextureName.get()
-        self.__on_node_changed(filepath)
+        self.__request_audit(self.__watch_file_node(args[0]))
 
     def __on_file_deleted(self, *args, **kwargs):
         """
         On file node deleted refresh the datas and the ui of its filepath
         :return:
         """
-        pm.select(OpenMaya.MFnDependencyNode(args[0]).name())
-        filepath = pm.ls(selection=True)[0].fileTextureName.get()
-        self.__on_node_changed(filepath)
+        node_hash = OpenMaya.MObjectHandle(args[0]).hashCode()
+        if node_hash in self.__file_nodes:
+            self.__request_audit(self.__unwatch_file_node(node_hash))
 
     def __create_callback(self):
         """
@@ -216,7 +358,8 @@ class TextureCheckDialog(QDialog):
         OpenMaya.MMessage.removeCallback(self.__node_deleted_callback)
         self.__tool.set_opened(False)
         self.__opened = False
-        self.__clear_script_jobs()
+        self.__audit_timer.stop()
+        self.__unwatch_all()
 
     def __get_detected_colorspace(self, filename, colorspaces=None):
         """
@@ -228,93 +371,77 @@ class TextureCheckDialog(QDialog):
         match = None
         importance = -1
 
-        for colorspace_data in self.__known_cs:
+        for colorspace_data in _KNOWN_COLORSPACE_COMPILED:
             if colorspaces is None or colorspace_data["name"] in colorspaces:
-                for regexp, cs_imp in colorspace_data["regexp"].items():
-                    if re.match(regexp, filename, re.IGNORECASE):
+                for regexp, cs_imp in colorspace_data["regexp"]:
+                    if regexp.match(filename):
                         if importance < 0 or importance > cs_imp:
                             match = colorspace_data["name"]
                             importance = cs_imp
         return match
 
-    def build_bad_cs(self, test_call=False):
+    def __get_known_colorspace(self, colorspace):
         """
-        Build datas of bad textures
-        :param test_call
-        :return:
+        Get the known colorspace matching the colorspace of a file node
+        :param colorspace
+        :return: name of the known colorspace or None if unknown
         """
-        bad_cs_tex = {}
-        textures_file = pm.ls(type="file")
-        distinct_filepath = []
-        for tex in textures_file:
-            filepath = tex.fileTextureName.get()
-            if filepath not in distinct_filepath:
-                distinct_filepath.append(filepath)
+        if colorspace not in self.__known_cs_by_colorspace:
+            known_colorspace = None
+            for colorspace_data in _KNOWN_COLORSPACE_COMPILED:
+                if colorspace_data["name_regexp"].match(colorspace):
+                    known_colorspace = colorspace_data["name"]
+                    break
+            self.__known_cs_by_colorspace[colorspace] = known_colorspace
+        return self.__known_cs_by_colorspace[colorspace]
 
-        for filepath in distinct_filepath:
-            self.build_bad_cs_tex(bad_cs_tex, filepath, test_call)
+    def build_bad_cs(self):
+        """
+        Index the file nodes of the scene and build datas of bad textures
+        :return:
+        """
+        self.__unwatch_all()
+        node_it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kFileTexture)
+        while not node_it.isDone():
+            self.__watch_file_node(node_it.thisNode())
+            node_it.next()
 
+        bad_cs_tex = {}
+        for filepath in self.__file_nodes_by_path.keys():
+            self.__build_bad_cs_tex_from_nodes(bad_cs_tex, filepath, self.__get_indexed_file_nodes(filepath))
         return bad_cs_tex
 
-    def build_bad_cs_tex(self, bad_cs_tex, filepath, test_call=False):
+    def __build_bad_cs_tex_from_nodes(self, bad_cs_tex, filepath, file_nodes):
         """
-        Build datas of bad textures for a filepath
+        Build datas of bad textures for a filepath from its file nodes
         :param bad_cs_tex
         :param filepath
-        :param test_call: If not test call then scriptJob must be created
+        :param file_nodes: list of (MObjectHandle of the file node, colorspace)
         :return:
         """
-        textures_file = pm.ls(type="file")
-
         # Initiate all the known colorspaces fields in the dict
         bad_cs_tex[filepath] = {"colorspaces": {}, "unknown_colorspaces": {}}
         for cs in self.__known_cs:
             bad_cs_tex[filepath]["colorspaces"][cs["name"]] = \
                 {"textures": [], "found": False, "button": None, }
 
-        for tex in textures_file:
-            retrieved_filepath = tex.fileTextureName.get()
-            if filepath == retrieved_filepath:
-                if not test_call:
-                    self.__script_jobs.append(pm.scriptJob(
-                        attributeChange=[tex + ".fileTextureName", partial(self.__on_node_changed, filepath)]))
-                    self.__script_jobs.append(pm.scriptJob(
-                        attributeChange=[tex + ".colorSpace", partial(self.__on_node_changed, filepath)]))
-
-                # Get the colorspace of the file node
-                colorspace = tex.colorSpace.get()
-                colorspace_known = False
-                for colorspace_data in self.__known_cs:
-                    if re.match(colorspace_data["name_regexp"], colorspace, re.IGNORECASE):
-                        colorspace_known = True
-                        colorspace = colorspace_data["name"]
-                        break
-
-                # Determine if the colorspace is known or not
-                if not colorspace_known:
-                    if colorspace not in bad_cs_tex[filepath]["unknown_colorspaces"]:
-                        bad_cs_tex[filepath]["unknown_colorspaces"][colorspace] = []
-                    bad_cs_tex[filepath]["unknown_colorspaces"][colorspace].append(tex)
-                else:
-                    bad_cs_tex[filepath]["colorspaces"][colorspace]["textures"].append(tex)
-                    bad_cs_tex[filepath]["colorspaces"][colorspace]["found"] = True
-
-        if filepath in bad_cs_tex:
-            length_unknown = len(bad_cs_tex[filepath]["unknown_colorspaces"])
-            nb_different_cs = 0
-            for cs_tex_data in bad_cs_tex[filepath]["colorspaces"].values():
-                nb_different_cs += min(1,len(cs_tex_data["textures"]))
-            if nb_different_cs < 2 and length_unknown < 1:
-                bad_cs_tex.pop(filepath)
-
-    def __clear_script_jobs(self):
-        """
-        Clear all script jobs linked to filenode
-        :return:
-        """
-        for sj in self.__script_jobs:
-            pm.evalDeferred(partial(pm.scriptJob, kill=sj, force=True))
-        self.__script_jobs.clear()
+        for tex, colorspace in file_nodes:
+            # Determine if the colorspace of the file node is known or not
+            known_colorspace = self.__get_known_colorspace(colorspace)
+            if known_colorspace is None:
+                if colorspace not in bad_cs_tex[filepath]["unknown_colorspaces"]:
+                    bad_cs_tex[filepath]["unknown_colorspaces"][colorspace] = []
+                bad_cs_tex[filepath]["unknown_colorspaces"][colorspace].append(tex)
+            else:
+                bad_cs_tex[filepath]["colorspaces"][known_colorspace]["textures"].append(tex)
+                bad_cs_tex[filepath]["colorspaces"][known_colorspace]["found"] = True
+
+        length_unknown = len(bad_cs_tex[filepath]["unknown_colorspaces"])
+        nb_different_cs = 0
+        for cs_tex_data in bad_cs_tex[filepath]["colorspaces"].values():
+            nb_different_cs += min(1,len(cs_tex_data["textures"]))
+        if nb_different_cs < 2 and length_unknown < 1:
+            bad_cs_tex.pop(filepath)
 
     def __on_selection_table_changed(self):
         """
@@ -323,7 +450,7 @@ class TextureCheckDialog(QDialog):
         """
         selection = []
         for s in self.__ui_file_cs_table.selectionModel().selectedRows():
-            selection.extend(self.__ui_file_cs_table.item(s.row(), 0).data(Qt.UserRole))
+            selection.extend(self.__get_file_node_names(self.__ui_file_cs_table.item(s.row(), 0).data(Qt.UserRole)))
         pm.select(selection)
 
     def __create_ui(self):
@@ -475,13 +602,17 @@ class TextureCheckDialog(QDialog):
                     colorspace = cs
                     break
             if colorspace is not None:
+                handles = []
                 for cs_tex_data in cs_tex_datas["colorspaces"].values():
-                    for tex in cs_tex_data["textures"]:
-                        tex.colorSpace.set(colorspace)
+                    handles.extend(cs_tex_data["textures"])
                 for textures in cs_tex_datas["unknown_colorspaces"].values():
-                    for tex in textures:
-                        tex.colorSpace.set(colorspace)
+                    handles.extend(textures)
+                # The names are resolved now as the file nodes can have been renamed
+                for tex in self.__get_file_node_names(handles):
+                    pm.setAttr(tex + ".colorSpace", colorspace, type="string")
                 filepath_data_to_build.append(filepath)
+        # The attribute changes have been sent to the dispatcher
+        self.__pending_paths.difference_update(filepath_data_to_build)
         for filepath in filepath_data_to_build:
-            self.build_bad_cs_tex(self.__bad_cs_tex, filepath)
+            self.__audit_filepath(filepath)
         self.refresh_ui()
@@ -2,6 +2,9 @@ from ..tool_models.MultipleActionTool import *
 
 
 class TraceSetTool(MultipleActionTool):
+    # The selection is read when a button is clicked so no scene event is followed
+    _scene_dependencies = []
+
     def __init__(self):
         actions = {
             "action_1": {
@@ -2,6 +2,7 @@ from ..tool_models.MultipleActionTool import *
 
 
 class UVCopierTool(MultipleActionTool):
+    _scene_dependencies = [BobTool.SELECTION]
 
     def __init__(self):
         actions = {
@@ -75,20 +76,21 @@ class UVCopierTool(MultipleActionTool):
         if "button" in self._actions["merge"]:
             self._actions["merge"]["button"].setEnabled(enabled)
 
-    def __retrieve_datas(self):
+    def __retrieve_datas(self, snapshot):
         """
         Retrieve the selected shapes (recursive)
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        selection = pm.ls(selection=True)
-        self.__selected_shapes = pm.listRelatives(selection, allDescendents=True, shapes=True)
+        self.__selected_shapes = snapshot.get_descendant_shapes()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, snapshot):
         """
         Refresh the button on selection changed
+        :param snapshot: SelectionSnapshot
         :return:
         """
-        self.__retrieve_datas()
+        self.__retrieve_datas(snapshot)
         self.__refresh_btn()
 
     def populate(self):
@@ -97,6 +99,6 @@ class UVCopierTool(MultipleActionTool):
         :return:
         """
         layout = super(UVCopierTool, self).populate()
-        self.__retrieve_datas()
+        self.__retrieve_datas(SelectionSnapshot())
         self.__refresh_btn()
         return layout
@@ -2,6 +2,10 @@ from tool_models.ActionTool import *
 
 
 class ActionTemplateTool(ActionTool):
+    # TODO Declare the scene states followed by the tool (BobTool.SELECTION and/or BobTool.DAG) to receive
+    #  on_selection_changed and on_dag_changed
+    _scene_dependencies = []
+
     def __init__(self):
         # TODO Modify fields as you want (pref_name should be unique)
         super().__init__(name="Action Tool",pref_name="action_template",
@@ -2,6 +2,10 @@ from tool_models.MultipleActionTool import *
 
 
 class MultipleActionTemplateTool(MultipleActionTool):
+    # TODO Declare the scene states followed by the tool (BobTool.SELECTION and/or BobTool.DAG) to receive
+    #  on_selection_changed and on_dag_changed
+    _scene_dependencies = []
+
     def __init__(self):
         # TODO modify fields as you want (pref_name should be unique)
         actions = {
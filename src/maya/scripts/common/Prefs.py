@@ -1,98 +1,275 @@
+import atexit
 import json
 import os
 import ctypes
 import sys
+import tempfile
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 # ######################################################################################################################
 
 _FOLDER_PREFS = ".illogic_prefs"
 _COMMON_FILE = "common"
 
+# Marker of a key popped in memory but not flushed yet
+_DELETED = object()
+
+# On Windows the prefs file can't be replaced while another Maya session reads it
+_REPLACE_RETRIES = 10
+_REPLACE_RETRY_DELAY = 0.05
+
+# Prefs with modifications, flushed when Maya exits if nobody did it before
+_prefs_to_flush = weakref.WeakSet()
+
 # ######################################################################################################################
 
 
+def get_folder_prefs():
+    """
+    Get the folder containing all the prefs
+    :return: folder path
+    """
+    return os.path.expanduser("~") + "/" + _FOLDER_PREFS
+
+
+def create_folder_prefs(path_prefs):
+    """
+    Create the hidden folder of the prefs if it doesn't exist
+    :param path_prefs
+    :return:
+    """
+    if not os.path.exists(path_prefs):
+        os.makedirs(path_prefs)
+        hide_folder(path_prefs)
+
+
+def hide_folder(path):
+    """
+    Hide a folder. On Windows set the hidden attribute, elsewhere the leading "." of the name already hides it
+    :param path
+    :return:
+    """
+    if sys.platform == "win32":
+        ctypes.windll.kernel32.SetFileAttributesW(path, 0x02)
+
+
+def _flush_all_prefs():
+    """
+    Flush the prefs modified outside a "with" block and never flushed
+    :return:
+    """
+    for prefs in list(_prefs_to_flush):
+        try:
+            prefs.flush()
+        except Exception:
+            # Nothing more can be done when Maya exits
+            pass
+
+
+atexit.register(_flush_all_prefs)
+
+
 class PrefsNotInitialized(Exception):
     # Raised when the prefs file doesn't exist
     pass
 
 
+class _FileLock:
+    """
+    Advisory lock shared between processes on a lock file next to the prefs file.
+    Uses fcntl on Linux, msvcrt on Windows and does nothing if none of them is available
+    """
+    def __init__(self, lock_path):
+        self.__lock_path = lock_path
+        self.__fd = None
+
+    def __enter__(self):
+        self.__fd = os.open(self.__lock_path, os.O_RDWR | os.O_CREAT)
+        if fcntl is not None:
+            fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            os.lseek(self.__fd, 0, os.SEEK_SET)
+            # LK_LOCK only retries for 10 seconds so loop until we get it
+            while True:
+                try:
+                    msvcrt.locking(self.__fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if fcntl is not None:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            os.lseek(self.__fd, 0, os.SEEK_SET)
+            msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+        os.close(self.__fd)
+        self.__fd = None
+        return False
+
+
 class Prefs:
+    """
+    Preferences of a tool stored in a json file. The file is loaded once in memory and reloaded only when its
+    modification time changes (another Maya session wrote it). Modifications are kept in memory until flush() is
+    called or until the end of a "with prefs:" block. The flush holds a lock shared by all the Maya sessions, merges
+    the modified keys over the file content and replaces the file atomically.
+    A caller writing outside a "with" block must call flush() itself to persist its keys right away, otherwise they
+    are only written when Maya exits.
+    """
     def __init__(self, file_name=_COMMON_FILE):
         if type(file_name) != str:
             raise TypeError("Project name must be a string")
 
-        path_home = os.path.expanduser("~")
-        self.__path_prefs = path_home + "/" + _FOLDER_PREFS
+        self.__path_prefs = get_folder_prefs()
         self.__file_path = self.__path_prefs + "/" + file_name
 
+        self.__datas = {}
+        self.__dirty = {}
+        self.__file_stamp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+        return False
+
     def __create_folder_prefs(self):
-        if not os.path.exists(self.__path_prefs):
-            os.makedirs(self.__path_prefs)
-            ctypes.windll.kernel32.SetFileAttributesW(self.__path_prefs, 0x02)
+        create_folder_prefs(self.__path_prefs)
 
-    def __create_project_file(self):
-        if not os.path.exists(self.__file_path):
-            f = open(self.__file_path, "x")
-            f.close()
+    def __get_file_stamp(self):
+        """
+        Get the stamp (modification time and size) of the prefs file
+        :return: stamp or None if the file doesn't exist
+        """
+        try:
+            stat = os.stat(self.__file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def __get_datas(self):
         f = open(self.__file_path, "r")
         content = f.read()
         f.close()
 
-        if len(content) == 0:
+        try:
+            datas = json.loads(content) if len(content) > 0 else {}
+        except ValueError:
+            # File corrupted by a previous crash, start again from scratch
             datas = {}
-        else:
-            datas = json.loads(content)
         return datas
 
+    def __replace_file(self, tmp_path):
+        """
+        Replace the prefs file with the temporary file. Retry for a while if the prefs file is opened by another
+        process (PermissionError on Windows)
+        :param tmp_path
+        :return:
+        """
+        for retry in range(_REPLACE_RETRIES):
+            try:
+                os.replace(tmp_path, self.__file_path)
+                return
+            except PermissionError:
+                if retry == _REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(_REPLACE_RETRY_DELAY)
+
+    def __write_datas(self):
+        """
+        Write the datas in a temporary file and replace the prefs file with it so that a reader never sees a
+        half-written file
+        :return:
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.__path_prefs, prefix=os.path.basename(self.__file_path) + ".",
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(self.__datas, indent=1))
+                f.flush()
+                os.fsync(f.fileno())
+            self.__replace_file(tmp_path)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def __refresh(self):
+        """
+        Reload the datas from the file if it has been modified since the last load, keeping the dirty keys
+        :return:
+        """
+        file_stamp = self.__get_file_stamp()
+        if file_stamp == self.__file_stamp:
+            return
+        datas = {} if file_stamp is None else self.__get_datas()
+        for index, item in self.__dirty.items():
+            if item is _DELETED:
+                datas.pop(index, None)
+            else:
+                datas[index] = item
+        self.__datas = datas
+        self.__file_stamp = file_stamp
+
     def __contains__(self, item):
-        if not os.path.exists(self.__file_path):
-            return False
-        return item in self.__get_datas()
+        self.__refresh()
+        return item in self.__datas
 
     def __getitem__(self, index):
         index = str(index)
-        if not os.path.exists(self.__file_path):
+        self.__refresh()
+        if not index in self.__datas:
             raise IndexError(index + " doesn't exists in prefs")
-        datas = self.__get_datas()
-        if not index in datas:
-            raise IndexError(index + " doesn't exists in prefs")
-        return self.__get_datas()[index]
+        return self.__datas[index]
 
     def __setitem__(self, index, item):
-        self.__create_folder_prefs()
-        self.__create_project_file()
-
-        f = open(self.__file_path, "r+")
-        content = f.read()
-        if len(content) == 0:
-            datas = {}
-        else:
-            datas = json.loads(content)
-        datas[str(index)] = item
-        f.seek(0)
-        f.truncate()
-        f.write(json.dumps(datas, indent=1))
-        f.close()
+        index = str(index)
+        self.__refresh()
+        self.__datas[index] = item
+        self.__dirty[index] = item
+        _prefs_to_flush.add(self)
 
     def pop(self, index):
-        self.__create_folder_prefs()
-        self.__create_project_file()
-
-        f = open(self.__file_path, "r+")
-
-        content = f.read()
-        if len(content) == 0:
-            datas = {}
-        else:
-            datas = json.loads(content)
-
+        self.__refresh()
         item = None
-        if index in datas:
-            item = datas.pop(index)
-            f.seek(0)
-            f.truncate()
-            f.write(json.dumps(datas, indent=1))
-        f.close()
+        if index in self.__datas:
+            item = self.__datas.pop(index)
+            self.__dirty[index] = _DELETED
+            _prefs_to_flush.add(self)
         return item
+
+    def flush(self):
+        """
+        Write the modified keys in the prefs file. If the file stays locked by another process the keys are kept
+        modified for the next flush
+        :return: whether the modified keys have been written or not
+        """
+        if len(self.__dirty) == 0:
+            return True
+        self.__create_folder_prefs()
+
+        with _FileLock(self.__file_path + ".lock"):
+            # Reload the file to merge our keys with the ones written by other sessions
+            self.__file_stamp = None
+            self.__refresh()
+            try:
+                self.__write_datas()
+            except PermissionError:
+                print("Prefs " + self.__file_path + " locked by another process, it will be written later")
+                return False
+            self.__dirty.clear()
+            self.__file_stamp = self.__get_file_stamp()
+        return True
@@ -0,0 +1,113 @@
+import json
+import os
+import sqlite3
+
+from common.Prefs import _COMMON_FILE, get_folder_prefs, create_folder_prefs
+
+# ######################################################################################################################
+
+_DB_FILE = "prefs.db"
+
+# Seconds to wait for another Maya session to release the database
+_DB_TIMEOUT = 10
+
+# ######################################################################################################################
+
+
+class SqlitePrefs:
+    """
+    Preferences of a tool stored in a single SQLite database shared by all the tools. Same API as Prefs but each
+    key is read and written on its own. The json file of the tool is imported the first time the namespace is used.
+    A "with prefs:" block groups all the modifications in one transaction.
+    """
+    def __init__(self, file_name=_COMMON_FILE):
+        if type(file_name) != str:
+            raise TypeError("Project name must be a string")
+
+        self.__namespace = file_name
+        self.__path_prefs = get_folder_prefs()
+        create_folder_prefs(self.__path_prefs)
+        self.__connection = sqlite3.connect(self.__path_prefs + "/" + _DB_FILE, timeout=_DB_TIMEOUT,
+                                            isolation_level=None)
+        self.__batch_depth = 0
+
+        self.__create_tables()
+        self.__migrate_json_file()
+
+    def __enter__(self):
+        if self.__batch_depth == 0:
+            self.__connection.execute("BEGIN IMMEDIATE")
+        self.__batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.__batch_depth -= 1
+        if self.__batch_depth == 0:
+            self.__connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+    def __create_tables(self):
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS prefs ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (namespace, key))")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS migrated (namespace TEXT PRIMARY KEY)")
+
+    def __migrate_json_file(self):
+        """
+        Import the json file of the namespace in the database if it has never been done
+        :return:
+        """
+        with self:
+            if self.__connection.execute("SELECT 1 FROM migrated WHERE namespace = ?",
+                                         (self.__namespace,)).fetchone() is not None:
+                return
+            file_path = self.__path_prefs + "/" + self.__namespace
+            datas = {}
+            if os.path.isfile(file_path):
+                try:
+                    with open(file_path, "r") as f:
+                        content = f.read()
+                    datas = json.loads(content) if len(content) > 0 else {}
+                except ValueError:
+                    datas = {}
+            self.__connection.executemany(
+                "INSERT OR IGNORE INTO prefs (namespace, key, value) VALUES (?, ?, ?)",
+                [(self.__namespace, str(key), json.dumps(item)) for key, item in datas.items()])
+            self.__connection.execute("INSERT INTO migrated (namespace) VALUES (?)", (self.__namespace,))
+
+    def __contains__(self, item):
+        return self.__connection.execute("SELECT 1 FROM prefs WHERE namespace = ? AND key = ?",
+                                         (self.__namespace, item)).fetchone() is not None
+
+    def __getitem__(self, index):
+        index = str(index)
+        row = self.__connection.execute("SELECT value FROM prefs WHERE namespace = ? AND key = ?",
+                                        (self.__namespace, index)).fetchone()
+        if row is None:
+            raise IndexError(index + " doesn't exists in prefs")
+        return json.loads(row[0])
+
+    def __setitem__(self, index, item):
+        self.__connection.execute("INSERT OR REPLACE INTO prefs (namespace, key, value) VALUES (?, ?, ?)",
+                                  (self.__namespace, str(index), json.dumps(item)))
+
+    def pop(self, index):
+        with self:
+            item = self[index] if index in self else None
+            self.__connection.execute("DELETE FROM prefs WHERE namespace = ? AND key = ?",
+                                      (self.__namespace, index))
+        return item
+
+    def flush(self):
+        """
+        Nothing to do, every modification outside a "with" block is already committed
+        :return: True as Prefs.flush when everything is written
+        """
+        return True
+
+    def close(self):
+        """
+        Close the connection to the database
+        :return:
+        """
+        self.__connection.close()
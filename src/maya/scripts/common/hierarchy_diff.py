@@ -0,0 +1,134 @@
+import array
+import hashlib
+
+try:
+    import maya.api.OpenMaya as om2
+except:
+    # Maya not found
+    pass
+
+# Reasons of the differences
+DIFF_NAME = "name"
+DIFF_TYPE = "type"
+DIFF_MESH = "mesh"
+
+
+def trim_name(name):
+    """
+    Get the name of an object without its path and its namespaces
+    :param name
+    :return: trimmed name
+    """
+    return name.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+
+
+def get_mesh_fingerprint(dag_path, with_topology_hash=False):
+    """
+    Get the fingerprint of a mesh through the API
+    :param dag_path: om2.MDagPath of the mesh
+    :param with_topology_hash: whether a hash of the face-vertex topology is added or not
+    :return: tuple (vertex count, edge count, face count[, topology hash])
+    """
+    mesh_fn = om2.MFnMesh(dag_path)
+    fingerprint = (mesh_fn.numVertices, mesh_fn.numEdges, mesh_fn.numPolygons)
+    if with_topology_hash:
+        counts, connects = mesh_fn.getVertices()
+        topology_hash = hashlib.md5()
+        topology_hash.update(array.array("i", counts).tobytes())
+        topology_hash.update(array.array("i", connects).tobytes())
+        fingerprint += (topology_hash.hexdigest(),)
+    return fingerprint
+
+
+def flatten_hierarchy(root, with_topology_hash=False):
+    """
+    Flatten the hierarchy under a root in one DAG iteration. The objects are keyed by their path relative to the root
+    made of trimmed names (so that two hierarchies with different namespaces or roots can be compared)
+    :param root: name of the root object
+    :param with_topology_hash: whether the mesh fingerprints have a topology hash or not
+    :return: dict (in breadth first order) of relative path to {"path", "type", "fingerprint"}
+    """
+    sel_list = om2.MSelectionList()
+    sel_list.add(str(root))
+    root_path = sel_list.getDagPath(0)
+    root_full_path = root_path.fullPathName()
+
+    keys_by_full_path = {root_full_path: ""}
+    hierarchy = {}
+    dag_it = om2.MItDag(om2.MItDag.kBreadthFirst)
+    dag_it.reset(root_path, om2.MItDag.kBreadthFirst, om2.MFn.kInvalid)
+    # Skip the root
+    dag_it.next()
+    while not dag_it.isDone():
+        dag_path = dag_it.getPath()
+        full_path = dag_path.fullPathName()
+        parent_key = keys_by_full_path.get(full_path.rsplit("|", 1)[0])
+        if parent_key is not None:
+            key = parent_key + "/" + trim_name(full_path)
+            keys_by_full_path[full_path] = key
+            node_type = om2.MFnDagNode(dag_path).typeName
+            fingerprint = get_mesh_fingerprint(dag_path, with_topology_hash) if node_type == "mesh" else None
+            hierarchy[key] = {"path": full_path, "type": node_type, "fingerprint": fingerprint}
+        dag_it.next()
+    return hierarchy
+
+
+def diff_flat_hierarchies(hierarchy_1, hierarchy_2):
+    """
+    Compare two flattened hierarchies in linear time. An object that differs is reported without its descendants
+    :param hierarchy_1: result of flatten_hierarchy
+    :param hierarchy_2: result of flatten_hierarchy
+    :return: dict with "only_1" and "only_2" lists of (full path, reason)
+    """
+    only_1 = []
+    only_2 = []
+    reported = set()
+
+    def is_under_reported(key):
+        parent_key = key.rsplit("/", 1)[0]
+        return parent_key in reported
+
+    for key, obj_1 in hierarchy_1.items():
+        if is_under_reported(key):
+            reported.add(key)
+            continue
+        obj_2 = hierarchy_2.get(key)
+        reason = None
+        if obj_2 is None:
+            only_1.append((obj_1["path"], DIFF_NAME))
+        elif obj_1["type"] != obj_2["type"]:
+            reason = DIFF_TYPE
+        elif obj_1["fingerprint"] != obj_2["fingerprint"]:
+            reason = DIFF_MESH
+        else:
+            continue
+        if reason is not None:
+            only_1.append((obj_1["path"], reason))
+            only_2.append((obj_2["path"], reason))
+        reported.add(key)
+
+    for key, obj_2 in hierarchy_2.items():
+        if key in hierarchy_1:
+            continue
+        if is_under_reported(key):
+            reported.add(key)
+            continue
+        only_2.append((obj_2["path"], DIFF_NAME))
+        reported.add(key)
+    return {"only_1": only_1, "only_2": only_2}
+
+
+def diff_hierarchies(root_1, root_2, with_topology_hash=False):
+    """
+    Compare the hierarchies under two roots (usable headless from a batch script)
+    Example :
+    diff = diff_hierarchies("asset_GRP", "asset_v002:asset_GRP")
+    for path, reason in diff["only_1"]:
+        print(path, reason)
+    :param root_1
+    :param root_2
+    :param with_topology_hash: whether the meshes compare their face-vertex topology or only their counts
+    :return: dict with "only_1" and "only_2" lists of (full path, reason)
+    """
+    return diff_flat_hierarchies(flatten_hierarchy(root_1, with_topology_hash),
+                                 flatten_hierarchy(root_2, with_topology_hash))
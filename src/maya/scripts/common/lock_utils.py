@@ -0,0 +1,149 @@
+try:
+    import pymel.core as pm
+    import maya.OpenMaya as OpenMaya
+except:
+    # Maya not found
+    pass
+
+# Lock flags of the transforms (compound attributes first)
+TRS_LOCK_ATTRIBUTES = [
+    "translate", "translateX", "translateY", "translateZ",
+    "rotate", "rotateX", "rotateY", "rotateZ",
+    "scale", "scaleX", "scaleY", "scaleZ",
+]
+
+TRS_COMPOUND_ATTRIBUTES = ["translate", "rotate", "scale"]
+
+
+def _get_node_paths_and_fns(nodes):
+    """
+    Get the path name and the function set of nodes with a single selection list
+    :param nodes
+    :return: list of (path name, MFnDependencyNode)
+    """
+    sel_list = OpenMaya.MSelectionList()
+    for node in nodes:
+        sel_list.add(str(node))
+    paths_and_fns = []
+    for i in range(sel_list.length()):
+        mobj = OpenMaya.MObject()
+        sel_list.getDependNode(i, mobj)
+        if mobj.hasFn(OpenMaya.MFn.kDagNode):
+            dag_path = OpenMaya.MDagPath()
+            sel_list.getDagPath(i, dag_path)
+            path_name = dag_path.partialPathName()
+        else:
+            path_name = OpenMaya.MFnDependencyNode(mobj).name()
+        paths_and_fns.append((path_name, OpenMaya.MFnDependencyNode(mobj)))
+    return paths_and_fns
+
+
+def get_lock_states(nodes, attributes=None):
+    """
+    Read the lock flags of the attributes of many nodes in one pass through the API
+    :param nodes
+    :param attributes: attributes read (TRS_LOCK_ATTRIBUTES by default)
+    :return: list of (path name, {attribute: locked})
+    """
+    if attributes is None:
+        attributes = TRS_LOCK_ATTRIBUTES
+    states = []
+    for path_name, fn_node in _get_node_paths_and_fns(nodes):
+        node_states = {}
+        for attribute in attributes:
+            node_states[attribute] = fn_node.findPlug(attribute, False).isLocked()
+        states.append((path_name, node_states))
+    return states
+
+
+def _apply_lock_states(plug_states):
+    """
+    Set the lock flags of plugs with a single MEL call (undoable contrary to MPlug.setLocked)
+    :param plug_states: list of (plug name, locked)
+    :return:
+    """
+    if len(plug_states) == 0:
+        return
+    pm.mel.eval("".join(
+        "setAttr -lock " + ("1" if locked else "0") + " \"" + plug_name + "\";" for plug_name, locked in plug_states))
+
+
+def set_locked(nodes, locked, attributes=None):
+    """
+    Lock or unlock the attributes of many nodes. Only the flags that change are written
+    :param nodes
+    :param locked
+    :param attributes: attributes modified (TRS_LOCK_ATTRIBUTES by default)
+    :return: number of flags modified
+    """
+    if attributes is None:
+        attributes = TRS_LOCK_ATTRIBUTES
+    plug_states = []
+    for path_name, node_states in get_lock_states(nodes, attributes):
+        for attribute, attribute_locked in node_states.items():
+            if attribute_locked != locked:
+                plug_states.append((path_name + "." + attribute, locked))
+    _apply_lock_states(plug_states)
+    return len(plug_states)
+
+
+class LockSnapshot:
+    """
+    Lock flags of many nodes at a given time. Allows to unlock all of them and to restore them afterwards
+    Example :
+    snapshot = LockSnapshot(transforms)
+    snapshot.unlock()
+    pm.makeIdentity(transforms, apply=True)
+    snapshot.restore()
+    """
+    def __init__(self, nodes, attributes=None):
+        """
+        Constructor
+        :param nodes
+        :param attributes: attributes read (TRS_LOCK_ATTRIBUTES by default)
+        """
+        self.__states = get_lock_states(nodes, attributes)
+
+    def get_states(self):
+        """
+        Getter of the states
+        :return: list of (path name, {attribute: locked})
+        """
+        return self.__states
+
+    def has_locked(self):
+        """
+        Getter of whether at least one attribute is locked or not
+        :return: boolean
+        """
+        return any(any(node_states.values()) for _, node_states in self.__states)
+
+    def has_unlocked(self):
+        """
+        Getter of whether at least one attribute is unlocked or not
+        :return: boolean
+        """
+        return any(not all(node_states.values()) for _, node_states in self.__states)
+
+    def __get_locked_plugs(self):
+        """
+        Get the names of the plugs locked in the snapshot
+        :return: plug names
+        """
+        return [path_name + "." + attribute
+                for path_name, node_states in self.__states
+                for attribute, locked in node_states.items() if locked]
+
+    def unlock(self):
+        """
+        Unlock all the attributes locked in the snapshot
+        :return:
+        """
+        _apply_lock_states([(plug_name, False) for plug_name in self.__get_locked_plugs()])
+
+    def restore(self):
+        """
+        Lock again the attributes locked in the snapshot
+        :return:
+        """
+        _apply_lock_states([(plug_name, True) for plug_name in self.__get_locked_plugs()])
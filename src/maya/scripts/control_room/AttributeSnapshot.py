@@ -0,0 +1,80 @@
+import maya.OpenMaya as OpenMaya
+import pymel.core as pm
+
+
+class AttributeSnapshot:
+    def __init__(self):
+        # Value and settable state of the watched plugs by plug name
+        self.__values = {}
+        self.__settables = {}
+        # Plugs to read again on the next query
+        self.__dirty = set()
+
+    # Watch a plug ("node.attribute"). It is read with the next batch
+    def watch(self, plug_name):
+        if plug_name in self.__values:
+            return
+        self.__values[plug_name] = None
+        self.__settables[plug_name] = False
+        self.__dirty.add(plug_name)
+
+    # Mark a plug (or all the plugs) to be read again (called by the callback registry of Control Room)
+    def mark_dirty(self, plug_name=None):
+        if plug_name is None:
+            self.__dirty.update(self.__values.keys())
+        elif plug_name in self.__values:
+            self.__dirty.add(plug_name)
+
+    # Read a plug value
+    @staticmethod
+    def __read_plug(plug):
+        if plug.isCompound():
+            return tuple(AttributeSnapshot.__read_plug(plug.child(i)) for i in range(plug.numChildren()))
+        attribute = plug.attribute()
+        if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+            unit_type = OpenMaya.MFnNumericAttribute(attribute).unitType()
+            if unit_type == OpenMaya.MFnNumericData.kBoolean:
+                return plug.asBool()
+            if unit_type in [OpenMaya.MFnNumericData.kFloat, OpenMaya.MFnNumericData.kDouble]:
+                return plug.asDouble()
+            return plug.asInt()
+        if attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+            return plug.asShort()
+        if attribute.hasFn(OpenMaya.MFn.kUnitAttribute):
+            return plug.asDouble()
+        if attribute.hasFn(OpenMaya.MFn.kTypedAttribute):
+            return plug.asString()
+        return pm.getAttr(plug.name())
+
+    # Read all the dirty plugs in one batch
+    def __refresh(self):
+        if len(self.__dirty) == 0:
+            return
+        sel_list = OpenMaya.MSelectionList()
+        plug_names = []
+        for plug_name in self.__dirty:
+            try:
+                sel_list.add(plug_name)
+                plug_names.append(plug_name)
+            except RuntimeError:
+                # The plug doesn't exist (anymore)
+                self.__values[plug_name] = None
+                self.__settables[plug_name] = False
+        for i, plug_name in enumerate(plug_names):
+            plug = OpenMaya.MPlug()
+            sel_list.getPlug(i, plug)
+            self.__values[plug_name] = AttributeSnapshot.__read_plug(plug)
+            self.__settables[plug_name] = not plug.isLocked() and not plug.isConnected()
+        self.__dirty.clear()
+
+    # Getter of the value of a plug (read-only view, the dirty plugs are read again in one batch)
+    def get(self, plug_name):
+        self.watch(plug_name)
+        self.__refresh()
+        return self.__values[plug_name]
+
+    # Getter of whether a plug can be set (not locked and not connected)
+    def is_settable(self, plug_name):
+        self.watch(plug_name)
+        self.__refresh()
+        return self.__settables[plug_name]
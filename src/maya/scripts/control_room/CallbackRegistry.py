@@ -0,0 +1,127 @@
+import maya.OpenMaya as OpenMaya
+import pymel.core as pm
+
+from PySide2.QtCore import QTimer
+
+# Attribute changes sent to the callbacks (value, lock and connection changes)
+_ATTRIBUTE_MESSAGES = OpenMaya.MNodeMessage.kAttributeSet | OpenMaya.MNodeMessage.kAttributeLocked | \
+                      OpenMaya.MNodeMessage.kAttributeUnlocked | OpenMaya.MNodeMessage.kConnectionMade | \
+                      OpenMaya.MNodeMessage.kConnectionBroken
+
+
+class CallbackRegistry:
+    def __init__(self):
+        # Callbacks by node name, attribute name : {"plug", "callbacks"}
+        self.__attribute_callbacks = {}
+        self.__layer_callbacks = []
+        # Functions called immediately with the plug name changed (None for all plugs) to mark the datas outdated
+        self.__dirty_listeners = []
+        # Maya callbacks
+        self.__node_callbacks = {}
+        self.__layer_script_job = None
+        self.__active = False
+        self.__suspended = 0
+        # Callbacks to call on the next event loop (dict as an ordered set)
+        self.__pending = {}
+        self.__timer = QTimer()
+        self.__timer.setSingleShot(True)
+        self.__timer.timeout.connect(self.__flush)
+
+    # Add a callback called when an attribute ("node.attribute") changes
+    def add_attribute_callback(self, plug_name, callback):
+        node_name, attr_name = plug_name.split(".", 1)
+        attributes = self.__attribute_callbacks.setdefault(node_name, {})
+        entry = attributes.setdefault(attr_name, {"plug": plug_name, "callbacks": []})
+        if callback not in entry["callbacks"]:
+            entry["callbacks"].append(callback)
+        if self.__active and node_name not in self.__node_callbacks:
+            self.__add_node_callback(node_name)
+
+    # Add a callback called when the visible render layer changes
+    def add_layer_callback(self, callback):
+        if callback not in self.__layer_callbacks:
+            self.__layer_callbacks.append(callback)
+
+    # Add a function called immediately on each change
+    def add_dirty_listener(self, listener):
+        self.__dirty_listeners.append(listener)
+
+    # Queue callbacks for the next event loop
+    def __queue(self, callbacks):
+        if self.__suspended > 0:
+            return
+        for callback in callbacks:
+            self.__pending[callback] = None
+        self.__timer.start(0)
+
+    # Call once each callback queued
+    def __flush(self):
+        pending = list(self.__pending.keys())
+        self.__pending.clear()
+        for callback in pending:
+            callback()
+
+    # On attribute of a watched node changed
+    def __on_attribute_changed(self, msg, plug, other_plug, node_name):
+        if not msg & _ATTRIBUTE_MESSAGES:
+            return
+        attributes = self.__attribute_callbacks.get(node_name, {})
+        while True:
+            entry = attributes.get(plug.partialName(False, False, False, False, False, True))
+            if entry is not None:
+                for listener in self.__dirty_listeners:
+                    listener(entry["plug"])
+                self.__queue(entry["callbacks"])
+            if not plug.isChild():
+                break
+            # The compound parent changes too
+            plug = plug.parent()
+
+    # On visible render layer changed
+    def __on_layer_changed(self):
+        for listener in self.__dirty_listeners:
+            listener(None)
+        self.__queue(self.__layer_callbacks)
+
+    # Add the callback of a watched node
+    def __add_node_callback(self, node_name):
+        sel_list = OpenMaya.MSelectionList()
+        try:
+            sel_list.add(node_name)
+        except RuntimeError:
+            return
+        mobj = OpenMaya.MObject()
+        sel_list.getDependNode(0, mobj)
+        self.__node_callbacks[node_name] = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+            mobj, self.__on_attribute_changed, node_name)
+
+    # Create one attribute callback by watched node and the render layer callback
+    def start(self):
+        if self.__active:
+            return
+        self.__active = True
+        for node_name in self.__attribute_callbacks.keys():
+            self.__add_node_callback(node_name)
+        self.__layer_script_job = pm.scriptJob(event=["renderLayerManagerChange", self.__on_layer_changed])
+
+    # Remove all the callbacks and forget the registered ones
+    def stop(self):
+        self.__timer.stop()
+        self.__pending.clear()
+        for callback in self.__node_callbacks.values():
+            OpenMaya.MMessage.removeCallback(callback)
+        self.__node_callbacks.clear()
+        if self.__layer_script_job is not None:
+            pm.scriptJob(kill=self.__layer_script_job)
+            self.__layer_script_job = None
+        self.__attribute_callbacks.clear()
+        self.__layer_callbacks.clear()
+        self.__active = False
+
+    # Stop queuing the callbacks (the dirty listeners are still called)
+    def suspend(self):
+        self.__suspended += 1
+
+    # Queue the callbacks again
+    def resume(self):
+        self.__suspended = max(0, self.__suspended - 1)
@@ -22,6 +22,9 @@ from common.Prefs import *
 import maya.OpenMaya as OpenMaya
 
 from .PresetManager import *
+from .OverrideIndex import *
+from .AttributeSnapshot import *
+from .CallbackRegistry import *
 
 import maya.mel as mel
 import maya.app.renderSetup.model.override as maya_override
@@ -45,6 +48,13 @@ OVERRIDE_LABEL_COLOR = "rgb(230,115,60)"
 PRESET_CONTAINS_LABEL_COLOR = "rgb(151, 154, 206)"
 PRESET_CONTAINS_AND_DIFFERENT_LABEL_COLOR = "rgb(53, 200, 223)"
 
+_STYLESHEET_COLOR_OVERRIDE = "color:" + OVERRIDE_LABEL_COLOR
+_STYLESHEET_COLOR_PRESET_CONTAINS = "color:" + PRESET_CONTAINS_LABEL_COLOR
+_STYLESHEET_COLOR_PRESET_CONTAINS_AND_DIFFERENT = "color:" + PRESET_CONTAINS_AND_DIFFERENT_LABEL_COLOR
+
+# Tolerance to consider two float values equal
+_FLOAT_TOLERANCE = 1e-6
+
 
 # ######################################################################################################################
 
@@ -64,14 +74,15 @@ class ControlRoom(QDialog):
         if override is not None:
             maya_override.delete(override)
 
-    # Generic function that retrieve an override for an attribute of an object
+    # Generic function that retrieve an override for an attribute of an object (through the override index)
     @staticmethod
     def retrieve_override(obj_name, attr_name):
-        visible_layer = render_setup.instance().getVisibleRenderLayer()
-        for override in render_setup_utils.getOverridesRecursive(visible_layer):
-            if override.typeName() == "absUniqueOverride" and obj_name == override.targetNodeName() and attr_name == override.attributeName():
-                return override
-        return None
+        return OverrideIndex.get_instance().get(obj_name, attr_name)
+
+    # Generic function that check if the visible render layer is the default one
+    @staticmethod
+    def is_default_layer():
+        return OverrideIndex.get_instance().get_visible_layer().name() == "defaultRenderLayer"
 
     def __init__(self, prnt=wrapInstance(int(omui.MQtUtil.mainWindow()), QWidget)):
         super(ControlRoom, self).__init__(prnt)
@@ -83,6 +94,15 @@ class ControlRoom(QDialog):
 
         asset_path = os.path.dirname(__file__) + "/assets"
 
+        # Keep the override index current while Control Room is opened (the parts query it at construction)
+        self.__override_index = OverrideIndex.get_instance()
+        self.__override_index.add_callbacks()
+        # Values of the attributes watched by the parts
+        self.__snapshot = AttributeSnapshot()
+        # Callbacks of the parts (one attribute callback by node, the snapshot is marked dirty on each change)
+        self.__callback_registry = CallbackRegistry()
+        self.__callback_registry.add_dirty_listener(self.__snapshot.mark_dirty)
+
         # Model attributes
         self.__parts = [
             FeatureOverridesPart(self, "feature_overrides"),
@@ -94,7 +114,11 @@ class ControlRoom(QDialog):
         ]
         self.__preset_part = PresetsPart(self, asset_path, "assets")
         self.__hovered_preset = None
+        # Stylesheets generated by selector and content
+        self.__stylesheets = {}
         self.__new_scene_callback = None
+        # Number of attributes modified by set_attr
+        self.__nb_attr_changed = 0
 
         # UI attributes
         self.__ui_width = 550
@@ -117,6 +141,7 @@ class ControlRoom(QDialog):
             self.__refresh_ui()
             self.__add_callbacks()
         else:
+            self.__override_index.remove_callbacks()
             self.close()
 
     # Test if Arnold is loaded and display a warning popup if it is not
@@ -135,10 +160,11 @@ class ControlRoom(QDialog):
 
     # Save preferences
     def __save_prefs(self):
-        size = self.size()
-        self.__prefs["window_size"] = {"width": size.width()}
-        pos = self.pos()
-        self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
+        with self.__prefs:
+            size = self.size()
+            self.__prefs["window_size"] = {"width": size.width()}
+            pos = self.pos()
+            self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
 
     # Retrieve preferences
     def __retrieve_prefs(self):
@@ -152,6 +178,7 @@ class ControlRoom(QDialog):
     # Remove callbacks and save preferences
     def hideEvent(self, arg__1: QCloseEvent) -> None:
         self.__remove_callbacks()
+        self.__override_index.remove_callbacks()
         self.__save_prefs()
 
     # Create the ui
@@ -186,26 +213,97 @@ class ControlRoom(QDialog):
             part.refresh_ui()
         self.__preset_part.refresh_ui()
 
+    # Get the fields of each part whose display changes from a hovered preset to another one
+    @staticmethod
+    def __get_hover_diff(previous_preset, preset):
+        fields_by_part = {}
+        for preset_hovered, other_preset in [(previous_preset, preset), (preset, previous_preset)]:
+            if preset_hovered is None:
+                continue
+            for part_name, fields in preset_hovered.items():
+                for field_name, value in fields.items():
+                    # Same value displayed with the same style
+                    if other_preset is not None and other_preset.contains(part_name, field_name) and \
+                            other_preset.get(part_name, field_name) == value:
+                        continue
+                    fields_by_part.setdefault(part_name, set()).add(field_name)
+        return fields_by_part
+
     def set_hovered_preset(self, preset):
+        previous_preset = self.__hovered_preset
         self.__hovered_preset = preset
+        fields_by_part = ControlRoom.__get_hover_diff(previous_preset, preset)
         for part in self.__parts:
-            part.refresh_ui()
+            if part.get_part_name() in fields_by_part:
+                part.refresh_fields(fields_by_part[part.get_part_name()])
 
     def get_hovered_preset(self):
         return self.__hovered_preset
 
+    # Watch an attribute to read it with the others in the snapshot
+    def watch_attr(self, plug_name):
+        self.__snapshot.watch(plug_name)
+
+    # Getter of the value of an attribute from the snapshot
+    def get_attr(self, plug_name):
+        return self.__snapshot.get(plug_name)
+
+    # Getter of whether an attribute can be set (not locked and not connected) from the snapshot
+    def is_attr_settable(self, plug_name):
+        return self.__snapshot.is_settable(plug_name)
+
+    # Test if a value read in the snapshot is equal to a value to set
+    @staticmethod
+    def __is_same_value(current, value):
+        if current is None:
+            return False
+        if isinstance(current, tuple) or isinstance(value, (tuple, list)):
+            if not isinstance(current, tuple) or not isinstance(value, (tuple, list)) or len(current) != len(value):
+                return False
+            return all(ControlRoom.__is_same_value(c, v) for c, v in zip(current, value))
+        if isinstance(current, float) or isinstance(value, float):
+            return abs(float(current) - float(value)) <= _FLOAT_TOLERANCE
+        return current == value
+
+    # Set an attribute if its value is different. Return whether it has been modified
+    def set_attr(self, plug_name, value):
+        if ControlRoom.__is_same_value(self.__snapshot.get(plug_name), value):
+            return False
+        pm.setAttr(plug_name, value)
+        self.__snapshot.mark_dirty(plug_name)
+        self.__nb_attr_changed += 1
+        return True
+
+    # Add a callback called when an attribute changes (coalesced with the other changes of the event loop)
+    def add_attribute_callback(self, plug_name, callback):
+        self.__snapshot.watch(plug_name)
+        self.__callback_registry.add_attribute_callback(plug_name, callback)
+
+    # Add a callback called when the visible render layer changes
+    def add_layer_callback(self, callback):
+        self.__callback_registry.add_layer_callback(callback)
+
     def get_stylesheet_color_for_field(self, part_name, field_name, val, override=None):
         if self.__hovered_preset and self.__hovered_preset.contains(part_name, field_name):
             if self.__hovered_preset.get(part_name, field_name) != val:
-                ss_color = "color:" + cr.PRESET_CONTAINS_AND_DIFFERENT_LABEL_COLOR
+                ss_color = _STYLESHEET_COLOR_PRESET_CONTAINS_AND_DIFFERENT
             else:
-                ss_color = "color:" + cr.PRESET_CONTAINS_LABEL_COLOR
+                ss_color = _STYLESHEET_COLOR_PRESET_CONTAINS
         elif override is not None:
-            ss_color = "color:" + cr.OVERRIDE_LABEL_COLOR
+            ss_color = _STYLESHEET_COLOR_OVERRIDE
         else:
             ss_color = ""
         return ss_color
 
+    # Set the stylesheet "selector{content}" on a widget only if it changes (setStyleSheet repolishes the widget)
+    def set_widget_stylesheet(self, widget, selector, content):
+        key = (selector, content)
+        if key not in self.__stylesheets:
+            self.__stylesheets[key] = selector + "{" + content + "}"
+        stylesheet = self.__stylesheets[key]
+        if widget.styleSheet() != stylesheet:
+            widget.setStyleSheet(stylesheet)
+
     def on_new_scene(self):
         self.hide()
         self.close()
@@ -216,9 +314,13 @@ class ControlRoom(QDialog):
         for part in self.__parts:
             part.add_callbacks()
         self.__preset_part.add_callbacks()
+        self.__callback_registry.start()
+        # Nothing kept the snapshot current before
+        self.__snapshot.mark_dirty()
 
     # Remove the callbacks of all parts
     def __remove_callbacks(self):
+        self.__callback_registry.stop()
         for part in self.__parts:
             part.remove_callbacks()
         self.__preset_part.remove_callbacks()
@@ -235,9 +337,18 @@ class ControlRoom(QDialog):
             preset_manager.add_preset(preset)
             preset_manager.save_presets()
 
-    # Apply a preset to all parts
+    # Apply a preset to all parts in one undo chunk. The callbacks are suspended and the UI is refreshed once
     def apply_preset(self, preset):
-        for part in self.__parts:
-            part.apply(preset)
-        self.__preset_part.apply(preset)
-        self.__refresh_ui()
+        self.__nb_attr_changed = 0
+        pm.undoInfo(openChunk=True, chunkName="Apply preset " + preset.get_name())
+        self.__callback_registry.suspend()
+        try:
+            for part in self.__parts:
+                part.apply(preset)
+            self.__preset_part.apply(preset)
+        finally:
+            self.__callback_registry.resume()
+            pm.undoInfo(closeChunk=True)
+            self.__snapshot.mark_dirty()
+            self.__refresh_ui()
+        print("Preset " + preset.get_name() + " applied : " + str(self.__nb_attr_changed) + " attribute(s) changed")
@@ -43,6 +43,14 @@ class ControlRoomPart(ABC):
     def refresh_ui(self):
         pass
 
+    # Refresh only the UI of some fields of the part (all the UI by default)
+    def refresh_fields(self, fields):
+        self.refresh_ui()
+
+    # Getter of the part name
+    def get_part_name(self):
+        return self._part_name
+
     # Add the part's callbacks
     @abstractmethod
     def add_callbacks(self):
@@ -31,8 +31,6 @@ class FormSlider:
         self.__max = max
         self.__mmax = mmax if mmax is not None else max
         self.__mult = 1000 if self.__type == FormSliderType.FloatSlider else 1
-        self.__callback = None
-        self.__layer_callback = None
         self.__override = None
         self.__action_add_override = QAction(text="Add Override")
         self.__action_add_override.triggered.connect(self.__create_override)
@@ -44,6 +42,7 @@ class FormSlider:
         self.__ui_lbl_widget = None
         self.__ui_background_widget = None
         self.__preset_hovered = False
+        self.__control_room.watch_attr(self.__field_name)
         self.__retrieve_override()
 
     # Create an override for the field of the slider
@@ -69,7 +68,7 @@ class FormSlider:
             value = value / self.__mult
         self.__ui_value_line_edit.setText(str(value))
         if not self.__preset_hovered:
-            pm.setAttr(self.__field_name, value)
+            self.__control_room.set_attr(self.__field_name, value)
 
     # On value of line edit changed
     def __on_edit_value_changed(self):
@@ -77,7 +76,7 @@ class FormSlider:
         value = float(str_value)
         self.__ui_slider.setValue(value)
         if not self.__preset_hovered:
-            pm.setAttr(self.__field_name, value)
+            self.__control_room.set_attr(self.__field_name, value)
 
     # Generate the UI for the slider
     def generate_ui(self):
@@ -122,7 +121,7 @@ class FormSlider:
     # Refresh the UI
     def refresh_ui(self):
         try:
-            val = pm.getAttr(self.__field_name)
+            val = self.__control_room.get_attr(self.__field_name)
             if val >= self.__max:
                 self.__ui_slider.setMaximum(val * self.__mult)
 
@@ -137,29 +136,28 @@ class FormSlider:
                 self.__ui_slider.setValue(val * self.__mult)
                 self.__ui_value_line_edit.setText(str(round(val,3)))
 
-            visible_layer = render_setup.instance().getVisibleRenderLayer()
-            is_default_layer = visible_layer.name() == "defaultRenderLayer"
+            is_default_layer = cr.ControlRoom.is_default_layer()
             self.__action_add_override.setEnabled(not is_default_layer and self.__override is None)
             self.__action_remove_override.setEnabled(not is_default_layer and self.__override is not None)
 
             stylesheet_bg = "background-color:" + cr.OVERRIDE_BG_COLOR if self.__override is not None else ""
             stylesheet_lbl = self.__control_room.get_stylesheet_color_for_field(
                 self.__part_name, self.__key_preset, val, self.__override)
-            self.__ui_background_widget.setStyleSheet("QWidget#widget_form_slider{" + stylesheet_bg + "}")
-            self.__ui_lbl_widget.setStyleSheet("QLabel{" + stylesheet_lbl + "}")
+            self.__control_room.set_widget_stylesheet(
+                self.__ui_background_widget, "QWidget#widget_form_slider", stylesheet_bg)
+            self.__control_room.set_widget_stylesheet(self.__ui_lbl_widget, "QLabel", stylesheet_lbl)
             self.__retrieve_override()
         except:
             pass
 
     # Add callbacks
     def add_callbacks(self):
-        self.__callback = pm.scriptJob(attributeChange=[self.__field_name, self.refresh_ui])
-        self.__layer_callback = pm.scriptJob(event=["renderLayerManagerChange", self.refresh_ui])
+        self.__control_room.add_attribute_callback(self.__field_name, self.refresh_ui)
+        self.__control_room.add_layer_callback(self.refresh_ui)
 
-    # remove callbacks
+    # remove callbacks (the callback registry of Control Room removes them all)
     def remove_callbacks(self):
-        pm.scriptJob(kill=self.__callback)
-        pm.scriptJob(kill=self.__layer_callback)
+        pass
 
     # Getter of the key preset and the field name
     def get_key_preset_and_field(self):
@@ -0,0 +1,146 @@
+import maya.OpenMaya as OpenMaya
+import maya.app.renderSetup.model.renderSetup as render_setup
+import maya.app.renderSetup.model.utils as render_setup_utils
+
+# Render setup node types whose creation, deletion or attribute and connection changes invalidate the indexes
+_WATCHED_NODE_TYPES = ["absUniqueOverride", "renderSetupLayer", "collection", "renderSettingsCollection",
+                       "simpleSelector", "basicSelector"]
+# Attributes of the overrides that define their target (the changes of the others don't matter to the indexes)
+_OVERRIDE_TARGET_ATTRIBUTES = ["attribute", "targetNodeName"]
+_ATTRIBUTE_MESSAGES = OpenMaya.MNodeMessage.kAttributeSet | OpenMaya.MNodeMessage.kConnectionMade | \
+                      OpenMaya.MNodeMessage.kConnectionBroken
+
+
+class OverrideIndex:
+    # ################################################### Singleton ####################################################
+    __instance = None
+
+    # Getter of the instance for the Singleton pattern
+    @staticmethod
+    def get_instance():
+        if OverrideIndex.__instance is None:
+            OverrideIndex.__instance = OverrideIndex()
+        return OverrideIndex.__instance
+
+    # ################################################### Singleton ####################################################
+
+    def __init__(self):
+        # Overrides by (node, attribute) for each render layer already indexed
+        self.__indexes = {}
+        self.__visible_layer = None
+        self.__callbacks = []
+        # Attribute changed callbacks of the render setup nodes by hash of their MObjectHandle
+        self.__node_callbacks = {}
+        self.__observing = False
+
+    # Clear the indexes (they are rebuilt on the next query)
+    def invalidate(self):
+        self.__indexes.clear()
+        self.__visible_layer = None
+
+    # Getter of the visible render layer (cached while the callbacks keep it current)
+    def get_visible_layer(self):
+        if self.__visible_layer is None or not self.__observing:
+            self.__visible_layer = render_setup.instance().getVisibleRenderLayer()
+        return self.__visible_layer
+
+    # Build the index of the overrides of a render layer
+    @staticmethod
+    def __build_index(layer):
+        index = {}
+        for override in render_setup_utils.getOverridesRecursive(layer):
+            if override.typeName() == "absUniqueOverride":
+                key = (override.targetNodeName(), override.attributeName())
+                # Keep the first one found as the previous linear search
+                if key not in index:
+                    index[key] = override
+        return index
+
+    # Getter of the override of an attribute in the visible render layer
+    def get(self, obj_name, attr_name):
+        layer = self.get_visible_layer()
+        if not self.__observing:
+            # Nothing keeps the index current so don't keep it
+            return OverrideIndex.__build_index(layer).get((obj_name, attr_name))
+        layer_name = layer.name()
+        if layer_name not in self.__indexes:
+            self.__indexes[layer_name] = OverrideIndex.__build_index(layer)
+        return self.__indexes[layer_name].get((obj_name, attr_name))
+
+    # Clear the index of the render layer of a render setup node (all of them if the layer is not found)
+    def __invalidate_layer_of(self, mobj):
+        user_node = render_setup_utils.nameToUserNode(OpenMaya.MFnDependencyNode(mobj).name())
+        while user_node is not None and user_node.typeName() != "renderSetupLayer":
+            get_parent = getattr(user_node, "parent", None)
+            user_node = get_parent() if get_parent is not None else None
+        if user_node is None:
+            self.invalidate()
+        else:
+            self.__indexes.pop(user_node.name(), None)
+
+    # On render setup node created
+    def __on_node_added(self, *args, **kwargs):
+        self.__observe_node(args[0])
+        self.invalidate()
+
+    # On render setup node deleted
+    def __on_node_removed(self, *args, **kwargs):
+        callback = self.__node_callbacks.pop(OpenMaya.MObjectHandle(args[0]).hashCode(), None)
+        if callback is not None:
+            OpenMaya.MMessage.removeCallback(callback)
+        self.invalidate()
+
+    # On attribute or connection changed on a render setup node (target of an override, selector, members...)
+    def __on_node_attribute_changed(self, msg, plug, other_plug, client_data):
+        if not msg & _ATTRIBUTE_MESSAGES:
+            return
+        mobj = plug.node()
+        if not msg & (OpenMaya.MNodeMessage.kConnectionMade | OpenMaya.MNodeMessage.kConnectionBroken) and \
+                OpenMaya.MFnDependencyNode(mobj).typeName() == "absUniqueOverride" and \
+                OpenMaya.MFnAttribute(plug.attribute()).name() not in _OVERRIDE_TARGET_ATTRIBUTES:
+            # The value of the override changed, not its target
+            return
+        self.__invalidate_layer_of(mobj)
+
+    # Add the attribute changed callback of a render setup node
+    def __observe_node(self, mobj):
+        node_hash = OpenMaya.MObjectHandle(mobj).hashCode()
+        if node_hash not in self.__node_callbacks:
+            self.__node_callbacks[node_hash] = \
+                OpenMaya.MNodeMessage.addAttributeChangedCallback(mobj, self.__on_node_attribute_changed)
+
+    # On visible render layer changed
+    def __on_active_layer_changed(self, *args, **kwargs):
+        self.__visible_layer = None
+
+    # Add the callbacks that keep the indexes current
+    def add_callbacks(self):
+        if self.__observing:
+            return
+        self.invalidate()
+        for node_type in _WATCHED_NODE_TYPES:
+            self.__callbacks.append(OpenMaya.MDGMessage.addNodeAddedCallback(self.__on_node_added, node_type))
+            self.__callbacks.append(OpenMaya.MDGMessage.addNodeRemovedCallback(self.__on_node_removed, node_type))
+        # The render setup nodes are plugin nodes
+        node_it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kPluginDependNode)
+        while not node_it.isDone():
+            mobj = node_it.thisNode()
+            if OpenMaya.MFnDependencyNode(mobj).typeName() in _WATCHED_NODE_TYPES:
+                self.__observe_node(mobj)
+            node_it.next()
+        render_setup.instance().addActiveLayerObserver(self.__on_active_layer_changed)
+        self.__observing = True
+
+    # Remove the callbacks
+    def remove_callbacks(self):
+        if not self.__observing:
+            return
+        for callback in self.__callbacks:
+            OpenMaya.MMessage.removeCallback(callback)
+        self.__callbacks.clear()
+        for callback in self.__node_callbacks.values():
+            OpenMaya.MMessage.removeCallback(callback)
+        self.__node_callbacks.clear()
+        render_setup.instance().removeActiveLayerObserver(self.__on_active_layer_changed)
+        self.__observing = False
+        self.invalidate()
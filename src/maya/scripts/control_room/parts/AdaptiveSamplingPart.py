@@ -13,14 +13,13 @@ class AdaptiveSamplingPart(ControlRoomPart):
                        "defaultArnoldRenderOptions.AAAdaptiveThreshold", "adaptive_treshold", 0, 1),
         ]
         self.__ui_enable_cb = None
-        self.__enable_callback = None
-        self.__layer_callback = None
         self.__adaptive_sampling_override = None
         self.__action_add_adaptive_sampling_override = QAction(text="Add Override")
         self.__action_add_adaptive_sampling_override.triggered.connect(self.__create_adaptive_sampling_override)
         self.__action_remove_adaptive_sampling_override = QAction(text="Remove Override")
         self.__action_remove_adaptive_sampling_override.triggered.connect(self.__remove_adaptive_sampling_override)
 
+        self._control_room.watch_attr("defaultArnoldRenderOptions.enableAdaptiveSampling")
         self.__retrieve_adaptive_sampling_override()
 
     # Create an override for the adaptive sampling field
@@ -59,13 +58,23 @@ class AdaptiveSamplingPart(ControlRoomPart):
         return content
 
     def refresh_ui(self):
-        try:
-            adaptive_sampling_enabled = pm.getAttr("defaultArnoldRenderOptions.enableAdaptiveSampling")
-            for fs in self.__form_sliders:
+        self.__refresh_adaptive_sampling()
+        for fs in self.__form_sliders:
+            fs.refresh_ui()
+
+    def refresh_fields(self, fields):
+        if "enable_adaptive_sampling" in fields:
+            self.__refresh_adaptive_sampling()
+        for fs in self.__form_sliders:
+            if fs.get_key_preset_and_field()[0] in fields:
                 fs.refresh_ui()
 
-            visible_layer = render_setup.instance().getVisibleRenderLayer()
-            is_default_layer = visible_layer.name() == "defaultRenderLayer"
+    # Refresh the adaptive sampling checkbox
+    def __refresh_adaptive_sampling(self):
+        try:
+            adaptive_sampling_enabled = self._control_room.get_attr(
+                "defaultArnoldRenderOptions.enableAdaptiveSampling")
+            is_default_layer = cr.ControlRoom.is_default_layer()
             self.__action_add_adaptive_sampling_override.setEnabled(
                 not is_default_layer and self.__adaptive_sampling_override is None)
             self.__action_remove_adaptive_sampling_override.setEnabled(
@@ -83,7 +92,7 @@ class AdaptiveSamplingPart(ControlRoomPart):
             else:
                 self.__ui_enable_cb.setChecked(adaptive_sampling_enabled)
 
-            self.__ui_enable_cb.setStyleSheet("QCheckBox{" + stylesheet_lbl + "}")
+            self._control_room.set_widget_stylesheet(self.__ui_enable_cb, "QCheckBox", stylesheet_lbl)
             self.__retrieve_adaptive_sampling_override()
         except:
             pass
@@ -93,18 +102,17 @@ class AdaptiveSamplingPart(ControlRoomPart):
         if not self._preset_hovered:
             pm.setAttr("defaultArnoldRenderOptions.enableAdaptiveSampling", state == 2)
 
+    # The sliders refresh themselves
     def add_callbacks(self):
-        self.__enable_callback = pm.scriptJob(
-            attributeChange=["defaultArnoldRenderOptions.enableAdaptiveSampling", self.refresh_ui])
+        self._control_room.add_attribute_callback(
+            "defaultArnoldRenderOptions.enableAdaptiveSampling", self.__refresh_adaptive_sampling)
         for fs in self.__form_sliders:
             fs.add_callbacks()
-        self.__layer_callback = pm.scriptJob(event=["renderLayerManagerChange", self.refresh_ui])
+        self._control_room.add_layer_callback(self.__refresh_adaptive_sampling)
 
+    # The callback registry of Control Room removes the callbacks
     def remove_callbacks(self):
-        pm.scriptJob(kill=self.__enable_callback)
-        for fs in self.__form_sliders:
-            fs.remove_callbacks()
-        pm.scriptJob(kill=self.__layer_callback)
+        pass
 
     def add_to_preset(self, preset):
         preset.set(self._part_name, "enable_adaptive_sampling", pm.getAttr("defaultArnoldRenderOptions.enableAdaptiveSampling"))
@@ -114,8 +122,9 @@ class AdaptiveSamplingPart(ControlRoomPart):
 
     def apply(self, preset):
         if preset.contains(self._part_name, "enable_adaptive_sampling"):
-            pm.setAttr("defaultArnoldRenderOptions.enableAdaptiveSampling", preset.get(self._part_name, "enable_adaptive_sampling"))
+            self._control_room.set_attr("defaultArnoldRenderOptions.enableAdaptiveSampling",
+                                        preset.get(self._part_name, "enable_adaptive_sampling"))
         for fs in self.__form_sliders:
             key, field = fs.get_key_preset_and_field()
             if preset.contains(self._part_name, key):
-                pm.setAttr(field, preset.get(self._part_name, key))
+                self._control_room.set_attr(field, preset.get(self._part_name, key))
@@ -15,9 +15,6 @@ class DepthOfFieldPart(ControlRoomPart):
         self.__ui_dof_cb = None
         self.__ui_lbl_fstop = None
         self.__ui_line_edit_fstop = None
-        self.__camera_dof_callback = None
-        self.__camera_fstop_callback = None
-        if self.__cam is not None : self.add_dynamic_callbacks()
 
     def populate(self):
         content = QHBoxLayout()
@@ -45,11 +42,11 @@ class DepthOfFieldPart(ControlRoomPart):
         try:
             dof_checked = False
             if self.__cam is not None and not self.__no_refresh:
-                dof_checked = self.__cam.depthOfField.get()
+                dof_checked = self._control_room.get_attr(self.__cam + ".depthOfField")
 
                 stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                     self._part_name, "depth_of_field", dof_checked)
-                self.__ui_dof_cb.setStyleSheet("QCheckBox{" + stylesheet_lbl + "}")
+                self._control_room.set_widget_stylesheet(self.__ui_dof_cb, "QCheckBox", stylesheet_lbl)
 
                 hovered_preset = self._control_room.get_hovered_preset()
                 if hovered_preset and hovered_preset.contains(self._part_name, "depth_of_field"):
@@ -59,10 +56,10 @@ class DepthOfFieldPart(ControlRoomPart):
                 else:
                     self.__ui_dof_cb.setChecked(dof_checked)
 
-                f_stop = round(self.__cam.fStop.get(), 3)
+                f_stop = round(self._control_room.get_attr(self.__cam + ".fStop"), 3)
                 stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                     self._part_name, "f_stop", f_stop)
-                self.__ui_lbl_fstop.setStyleSheet("QLabel{" + stylesheet_lbl + "}")
+                self._control_room.set_widget_stylesheet(self.__ui_lbl_fstop, "QLabel", stylesheet_lbl)
                 self.__ui_line_edit_fstop.setEnabled(dof_checked)
 
                 if hovered_preset and hovered_preset.contains(self._part_name, "f_stop"):
@@ -71,11 +68,10 @@ class DepthOfFieldPart(ControlRoomPart):
                     self._preset_hovered = False
                 else:
                     self.__ui_line_edit_fstop.setText(str(f_stop))
-            self.__ui_dof_cb.setEnabled(self.__cam is not None and not self.__cam.depthOfField.isLocked()
-                                        and not self.__cam.depthOfField.isConnected())
-            self.__ui_line_edit_fstop.setEnabled(self.__cam is not None and dof_checked
-                                                 and not self.__cam.fStop.isLocked()
-                                                 and not self.__cam.fStop.isConnected())
+            self.__ui_dof_cb.setEnabled(self.__cam is not None and
+                                        self._control_room.is_attr_settable(self.__cam + ".depthOfField"))
+            self.__ui_line_edit_fstop.setEnabled(self.__cam is not None and dof_checked and
+                                                 self._control_room.is_attr_settable(self.__cam + ".fStop"))
         except:
             pass
 
@@ -93,26 +89,15 @@ class DepthOfFieldPart(ControlRoomPart):
             self.__cam.fStop.set(float(self.__ui_line_edit_fstop.text()))
             self.__no_refresh = False
 
-    def add_callbacks(self):
-        # Nothing
-        pass
-
     # Add callbacks to the current camera
-    def add_dynamic_callbacks(self):
+    def add_callbacks(self):
         if self.__cam is not None:
-            self.__camera_dof_callback = pm.scriptJob(
-                attributeChange=[self.__cam + '.depthOfField', self.refresh_ui])
-            self.__camera_fstop_callback = pm.scriptJob(
-                attributeChange=[self.__cam + '.fStop', self.refresh_ui])
+            self._control_room.add_attribute_callback(self.__cam + '.depthOfField', self.refresh_ui)
+            self._control_room.add_attribute_callback(self.__cam + '.fStop', self.refresh_ui)
 
-    # Remove the callbacks from the current camera
+    # The callback registry of Control Room removes the callbacks
     def remove_callbacks(self):
-        if self.__camera_dof_callback is not None:
-            pm.scriptJob(kill=self.__camera_dof_callback)
-            self.__camera_dof_callback = None
-        if self.__camera_fstop_callback is not None:
-            pm.scriptJob(kill=self.__camera_fstop_callback)
-            self.__camera_fstop_callback = None
+        pass
 
     def add_to_preset(self, preset):
         if self.__cam is not None:
@@ -122,6 +107,6 @@ class DepthOfFieldPart(ControlRoomPart):
     def apply(self, preset):
         if self.__cam is not None:
             if preset.contains(self._part_name, "depth_of_field"):
-                self.__cam.depthOfField.set(preset.get(self._part_name, "depth_of_field"))
+                self._control_room.set_attr(self.__cam + ".depthOfField", preset.get(self._part_name, "depth_of_field"))
             if preset.contains(self._part_name, "f_stop"):
-                self.__cam.fStop.set(preset.get(self._part_name, "f_stop"))
+                self._control_room.set_attr(self.__cam + ".fStop", preset.get(self._part_name, "f_stop"))
@@ -12,14 +12,13 @@ class IgnoreFields:
         self.__field_name = field_name
         self.__key_preset = key_preset
         self.__checkbox = None
-        self.__callback = None
-        self.__layer_callback = None
         self.__override = None
         self.__preset_hovered = False
         self.__action_add_override = QAction(text="Add Override")
         self.__action_add_override.triggered.connect(self.__create_override)
         self.__action_remove_override = QAction(text="Remove Override")
         self.__action_remove_override.triggered.connect(self.__remove_override)
+        self.__control_room.watch_attr(self.__field_name)
         self.__retrieve_override()
 
     # Create an override for the field of the checkbox
@@ -40,7 +39,7 @@ class IgnoreFields:
     # On checkbox changed
     def __on_state_changed(self, state):
         if not self.__preset_hovered:
-            pm.setAttr(self.__field_name, state == 2)
+            self.__control_room.set_attr(self.__field_name, state == 2)
 
     # Getter of the key preset and the field
     def get_key_preset_and_field(self):
@@ -58,9 +57,8 @@ class IgnoreFields:
     # Refresh the checkbox
     def refresh_checkbox(self):
         try:
-            visible_layer = render_setup.instance().getVisibleRenderLayer()
-            is_default_layer = visible_layer.name() == "defaultRenderLayer"
-            val = pm.getAttr(self.__field_name)
+            is_default_layer = cr.ControlRoom.is_default_layer()
+            val = self.__control_room.get_attr(self.__field_name)
 
             hovered_preset = self.__control_room.get_hovered_preset()
             if hovered_preset and hovered_preset.contains(self.__part_name, self.__key_preset):
@@ -74,19 +72,15 @@ class IgnoreFields:
             self.__action_remove_override.setEnabled(not is_default_layer and self.__override is not None)
 
             stylesheet_lbl = self.__control_room.get_stylesheet_color_for_field(self.__part_name, self.__key_preset, val, self.__override)
-            self.__checkbox.setStyleSheet("QCheckBox{" + stylesheet_lbl + "}")
+            self.__control_room.set_widget_stylesheet(self.__checkbox, "QCheckBox", stylesheet_lbl)
 
             self.__retrieve_override()
         except:
             pass
 
     def add_callback(self):
-        self.__callback = pm.scriptJob(attributeChange=[self.__field_name, self.refresh_checkbox])
-        self.__layer_callback = pm.scriptJob(event=["renderLayerManagerChange", self.refresh_checkbox])
-
-    def remove_callback(self):
-        pm.scriptJob(kill=self.__callback)
-        pm.scriptJob(kill=self.__layer_callback)
+        self.__control_room.add_attribute_callback(self.__field_name, self.refresh_checkbox)
+        self.__control_room.add_layer_callback(self.refresh_checkbox)
 
 
 class FeatureOverridesPart(ControlRoomPart):
@@ -109,7 +103,7 @@ class FeatureOverridesPart(ControlRoomPart):
         self.__ui_ignore_aovs_cb = None
         self.__ui_output_denoising_aovs_cb = None
 
-        self.__arnold_render_callback = None
+        self._control_room.watch_attr("defaultArnoldRenderOptions.outputVarianceAOVs")
 
     def populate(self):
         content = QHBoxLayout()
@@ -147,6 +141,18 @@ class FeatureOverridesPart(ControlRoomPart):
         except:
             pass
 
+    def refresh_fields(self, fields):
+        try:
+            for ign_field in self.__ignore_fields:
+                if ign_field.get_key_preset_and_field()[0] in fields:
+                    ign_field.refresh_checkbox()
+            if "ignore_aovs" in fields:
+                self.__refresh_ignore_aov()
+            if "output_denoising" in fields:
+                self.__refresh_output_denoising_aov()
+        except:
+            pass
+
     # Refresh all the ignore fields
     def __refresh_ignore_fields(self):
         for ign_field in self.__ignore_fields:
@@ -156,7 +162,7 @@ class FeatureOverridesPart(ControlRoomPart):
     def __refresh_ignore_aov(self):
         stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
             self._part_name, "ignore_aovs", self.__ignore_aovs)
-        self.__ui_ignore_aovs_cb.setStyleSheet("QCheckBox{" + stylesheet_lbl + "}")
+        self._control_room.set_widget_stylesheet(self.__ui_ignore_aovs_cb, "QCheckBox", stylesheet_lbl)
         hovered_preset = self._control_room.get_hovered_preset()
         if hovered_preset and hovered_preset.contains(self._part_name, "ignore_aovs"):
             self._preset_hovered = True
@@ -167,10 +173,10 @@ class FeatureOverridesPart(ControlRoomPart):
 
     # Refresh the output denoising aov field
     def __refresh_output_denoising_aov(self):
-        checked = pm.ls("defaultArnoldRenderOptions")[0].outputVarianceAOVs.get()
+        checked = self._control_room.get_attr("defaultArnoldRenderOptions.outputVarianceAOVs")
         stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
             self._part_name, "output_denoising", checked)
-        self.__ui_output_denoising_aovs_cb.setStyleSheet("QCheckBox{" + stylesheet_lbl + "}")
+        self._control_room.set_widget_stylesheet(self.__ui_output_denoising_aovs_cb, "QCheckBox", stylesheet_lbl)
 
         hovered_preset = self._control_room.get_hovered_preset()
         if hovered_preset and hovered_preset.contains(self._part_name, "output_denoising"):
@@ -208,16 +214,14 @@ class FeatureOverridesPart(ControlRoomPart):
             self.__refresh_output_denoising_aov()
 
     def add_callbacks(self):
-        self.__arnold_render_callback = pm.scriptJob(
-            attributeChange=['defaultArnoldRenderOptions.outputVarianceAOVs', self.__refresh_output_denoising_aov])
+        self._control_room.add_attribute_callback(
+            "defaultArnoldRenderOptions.outputVarianceAOVs", self.__refresh_output_denoising_aov)
         for ign_field in self.__ignore_fields:
             ign_field.add_callback()
 
+    # The callback registry of Control Room removes the callbacks
     def remove_callbacks(self):
-        pm.scriptJob(kill=self.__arnold_render_callback)
-
-        for ign_field in self.__ignore_fields:
-            ign_field.remove_callback()
+        pass
 
     def add_to_preset(self, preset):
         for ign_field in self.__ignore_fields:
@@ -231,9 +235,10 @@ class FeatureOverridesPart(ControlRoomPart):
         for ign_field in self.__ignore_fields:
             key, field = ign_field.get_key_preset_and_field()
             if key and preset.contains(self._part_name, key):
-                pm.setAttr(field, preset.get(self._part_name, key))
+                self._control_room.set_attr(field, preset.get(self._part_name, key))
         if preset.contains(self._part_name, "ignore_aovs"):
             self.__ignore_aovs = preset.get(self._part_name, "ignore_aovs")
-            pm.setAttr("defaultArnoldRenderOptions.aovMode", 2 if self.__ignore_aovs else 1)
+            self._control_room.set_attr("defaultArnoldRenderOptions.aovMode", 2 if self.__ignore_aovs else 1)
         if preset.contains(self._part_name, "output_denoising"):
-            pm.setAttr("defaultArnoldRenderOptions.outputVarianceAOVs", preset.get(self._part_name, "output_denoising"))
+            self._control_room.set_attr("defaultArnoldRenderOptions.outputVarianceAOVs",
+                                        preset.get(self._part_name, "output_denoising"))
@@ -22,10 +22,6 @@ class ImageSizePart(ControlRoomPart):
             if cam.renderable.get():
                 self.__cam = cam
                 break
-        self.__width_callback = None
-        self.__height_callback = None
-        self.__aspect_ratio_callback = None
-        self.__overscan_callback = None
         self.__ratio_selected = None
         self.__is_gate_opaque = False
         self.__is_gate_enabled = False
@@ -44,7 +40,6 @@ class ImageSizePart(ControlRoomPart):
         self.__ui_enable_gate_cb = None
 
         self.__retrieve_aspect_ratio()
-        if self.__cam is not None : self.add_dynamic_callbacks()
 
     def populate(self):
         content = QVBoxLayout()
@@ -125,7 +120,7 @@ class ImageSizePart(ControlRoomPart):
 
     # On slider Overscan changed
     def __on_slider_overscan_changed(self, value):
-        if self.__cam is not None and not self.__cam.overscan.isLocked() and not self.__cam.overscan.isConnected():
+        if self.__cam is not None and self._control_room.is_attr_settable(self.__cam + ".overscan"):
             value = value / 1000
             if value > 0:
                 self.__ui_overscan_line_edit.setText(str(value))
@@ -166,7 +161,7 @@ class ImageSizePart(ControlRoomPart):
     # Retrieve the aspect ratio
     def __retrieve_aspect_ratio(self):
         self.__ratio_selected = None
-        aspect_ratio = pm.getAttr("defaultResolution.deviceAspectRatio")
+        aspect_ratio = self._control_room.get_attr("defaultResolution.deviceAspectRatio")
         for name, aspect_ratio_datas in _AspectRatios.items():
             if abs(aspect_ratio - aspect_ratio_datas["ratio"]) < 0.001:
                 self.__ratio_selected = name
@@ -175,17 +170,18 @@ class ImageSizePart(ControlRoomPart):
     # Update the gate attributes
     def __update_gate_attr(self):
         if self.__cam is not None:
-            self.__cam.displayGateMaskOpacity.set(1.0 if self.__is_gate_opaque else 0.7)
-            self.__cam.displayGateMaskColor.set((0, 0, 0) if self.__is_gate_opaque else (0.5, 0.5, 0.5))
-            self.__cam.displayResolution.set(self.__is_gate_enabled)
+            self._control_room.set_attr(self.__cam + ".displayGateMaskOpacity", 1.0 if self.__is_gate_opaque else 0.7)
+            self._control_room.set_attr(self.__cam + ".displayGateMaskColor",
+                                        (0, 0, 0) if self.__is_gate_opaque else (0.5, 0.5, 0.5))
+            self._control_room.set_attr(self.__cam + ".displayResolution", self.__is_gate_enabled)
 
     def refresh_ui(self):
         try:
-            width_retrieved = pm.getAttr("defaultResolution.width")
+            width_retrieved = self._control_room.get_attr("defaultResolution.width")
             stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "width", width_retrieved)
 
-            self.__ui_lbl_width.setStyleSheet("QLabel{"+stylesheet_lbl+"}")
+            self._control_room.set_widget_stylesheet(self.__ui_lbl_width, "QLabel", stylesheet_lbl)
 
             hovered_preset = self._control_room.get_hovered_preset()
             if hovered_preset and hovered_preset.contains(self._part_name, "width"):
@@ -197,10 +193,10 @@ class ImageSizePart(ControlRoomPart):
                 width_displayed = width_retrieved
                 self.__ui_width_edit.setText(str(width_retrieved))
 
-            height_retrieved = pm.getAttr("defaultResolution.height")
+            height_retrieved = self._control_room.get_attr("defaultResolution.height")
             stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "height", height_retrieved)
-            self.__ui_lbl_height.setStyleSheet("QLabel{"+stylesheet_lbl+"}")
+            self._control_room.set_widget_stylesheet(self.__ui_lbl_height, "QLabel", stylesheet_lbl)
             if hovered_preset and hovered_preset.contains(self._part_name, "height"):
                 self._preset_hovered = True
                 height_displayed = hovered_preset.get(self._part_name, "height")
@@ -229,10 +225,10 @@ class ImageSizePart(ControlRoomPart):
             self.__ui_sd_format_btn.setStyleSheet(stylesheet_selected if sd_selected else "")
             self.__ui_hd_format_btn.setStyleSheet(stylesheet_selected if hd_selected else "")
             if self.__cam is not None:
-                overscan = self.__cam.overscan.get()
+                overscan = self._control_room.get_attr(self.__cam + ".overscan")
                 stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                     self._part_name, "overscan", overscan)
-                self.__ui_lbl_overscan.setStyleSheet("QLabel{"+stylesheet_lbl+"}")
+                self._control_room.set_widget_stylesheet(self.__ui_lbl_overscan, "QLabel", stylesheet_lbl)
 
                 if hovered_preset and hovered_preset.contains(self._part_name, "overscan"):
                     self._preset_hovered = True
@@ -242,20 +238,20 @@ class ImageSizePart(ControlRoomPart):
                 else:
                     self.__ui_overscan_slider.setValue(overscan * 1000)
 
-            self.__ui_overscan_slider.setEnabled(self.__cam is not None and not self.__cam.overscan.isLocked()
-                                                 and not self.__cam.overscan.isConnected())
-            self.__ui_overscan_line_edit.setEnabled(self.__cam is not None and not self.__cam.overscan.isLocked()
-                                                 and not self.__cam.overscan.isConnected())
-            self.__ui_enable_gate_cb.setEnabled(self.__cam is not None and not self.__cam.displayResolution.isLocked()
-                                                and not self.__cam.displayResolution.isConnected())
+            overscan_settable = self.__cam is not None and \
+                self._control_room.is_attr_settable(self.__cam + ".overscan")
+            self.__ui_overscan_slider.setEnabled(overscan_settable)
+            self.__ui_overscan_line_edit.setEnabled(overscan_settable)
+            self.__ui_enable_gate_cb.setEnabled(
+                self.__cam is not None and self._control_room.is_attr_settable(self.__cam + ".displayResolution"))
             self.__ui_opaque_gate_cb.setEnabled(
-                self.__cam is not None and not self.__cam.displayGateMaskOpacity.isLocked()
-                and not self.__cam.displayGateMaskOpacity.isConnected()
-                and not self.__cam.displayGateMaskColor.isConnected())
+                self.__cam is not None
+                and self._control_room.is_attr_settable(self.__cam + ".displayGateMaskOpacity")
+                and self._control_room.is_attr_settable(self.__cam + ".displayGateMaskColor"))
 
             stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "enable_gate", self.__is_gate_enabled)
-            self.__ui_enable_gate_cb.setStyleSheet("QCheckBox{"+stylesheet_lbl+"}")
+            self._control_room.set_widget_stylesheet(self.__ui_enable_gate_cb, "QCheckBox", stylesheet_lbl)
             if hovered_preset and hovered_preset.contains(self._part_name, "enable_gate"):
                 self._preset_hovered = True
                 self.__ui_enable_gate_cb.setChecked(hovered_preset.get(self._part_name, "enable_gate"))
@@ -265,7 +261,7 @@ class ImageSizePart(ControlRoomPart):
 
             stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "opaque_gate", self.__is_gate_opaque)
-            self.__ui_opaque_gate_cb.setStyleSheet("QCheckBox{"+stylesheet_lbl+"}")
+            self._control_room.set_widget_stylesheet(self.__ui_opaque_gate_cb, "QCheckBox", stylesheet_lbl)
             if hovered_preset and hovered_preset.contains(self._part_name, "opaque_gate"):
                 self._preset_hovered = True
                 self.__ui_opaque_gate_cb.setChecked(hovered_preset.get(self._part_name, "opaque_gate"))
@@ -304,31 +300,17 @@ class ImageSizePart(ControlRoomPart):
         self.__retrieve_aspect_ratio()
         self.refresh_ui()
 
+    # A change of the width and the height together refreshes the UI once
     def add_callbacks(self):
-        self.__width_callback = pm.scriptJob(
-            attributeChange=["defaultResolution.width", self.__callback])
-        self.__height_callback = pm.scriptJob(
-            attributeChange=["defaultResolution.height", self.__callback])
-        self.__aspect_ratio_callback = pm.scriptJob(
-            attributeChange=["defaultResolution.deviceAspectRatio", self.__callback])
-
-    # Add dynamic callback for the camera
-    def add_dynamic_callbacks(self):
+        self._control_room.add_attribute_callback("defaultResolution.width", self.__callback)
+        self._control_room.add_attribute_callback("defaultResolution.height", self.__callback)
+        self._control_room.add_attribute_callback("defaultResolution.deviceAspectRatio", self.__callback)
         if self.__cam is not None:
-            self.__overscan_callback = pm.scriptJob(
-                attributeChange=[self.__cam + '.overscan', self.__callback])
+            self._control_room.add_attribute_callback(self.__cam + '.overscan', self.__callback)
 
+    # The callback registry of Control Room removes the callbacks
     def remove_callbacks(self):
-        pm.scriptJob(kill=self.__width_callback)
-        pm.scriptJob(kill=self.__height_callback)
-        pm.scriptJob(kill=self.__aspect_ratio_callback)
-        self.remove_dynamic_callbacks()
-
-    # Remove dynamic callback for the camera
-    def remove_dynamic_callbacks(self):
-        if self.__overscan_callback is not None:
-            pm.scriptJob(kill=self.__overscan_callback)
-            self.__overscan_callback = None
+        pass
 
     # retrieve the gate attributes
     def __retrieve_gate_attr(self):
@@ -347,16 +329,17 @@ class ImageSizePart(ControlRoomPart):
     def apply(self, preset):
         if preset.contains(self._part_name, "width"):
             width = preset.get(self._part_name, "width")
-            pm.setAttr("defaultResolution.width", width)
+            self._control_room.set_attr("defaultResolution.width", width)
         if preset.contains(self._part_name, "height"):
             height = preset.get(self._part_name, "height")
-            pm.setAttr("defaultResolution.height", height)
-        pm.setAttr("defaultResolution.deviceAspectRatio",
-                   pm.getAttr("defaultResolution.width") / pm.getAttr("defaultResolution.height"))
+            self._control_room.set_attr("defaultResolution.height", height)
+        self._control_room.set_attr("defaultResolution.deviceAspectRatio",
+                                    self._control_room.get_attr("defaultResolution.width") /
+                                    self._control_room.get_attr("defaultResolution.height"))
         self.__retrieve_aspect_ratio()
         if self.__cam is not None:
             if preset.contains(self._part_name, "overscan"):
-                self.__cam.overscan.set(preset.get(self._part_name, "overscan"))
+                self._control_room.set_attr(self.__cam + ".overscan", preset.get(self._part_name, "overscan"))
             if preset.contains(self._part_name, "opaque_gate"):
                 self.__is_gate_opaque = preset.get(self._part_name, "opaque_gate") == 1
             if preset.contains(self._part_name, "enable_gate"):
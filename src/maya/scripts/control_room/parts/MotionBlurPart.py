@@ -14,9 +14,6 @@ class MotionBlurPart(ControlRoomPart):
         ]
         self.__ui_motion_blur_cb = None
         self.__ui_instant_shutter_cb = None
-        self.__motion_blur_callback = None
-        self.__instant_shutter_callback = None
-        self.__layer_callback = None
         self.__motion_blur_override = None
         self.__instant_shutter_override = None
         self.__action_add_motion_blur_override = QAction(text="Add Override")
@@ -29,6 +26,8 @@ class MotionBlurPart(ControlRoomPart):
         self.__action_remove_instant_shutter_override = QAction(text="Remove Override")
         self.__action_remove_instant_shutter_override.triggered.connect(self.__remove_instant_shutter_override)
 
+        self._control_room.watch_attr("defaultArnoldRenderOptions.motion_blur_enable")
+        self._control_room.watch_attr("defaultArnoldRenderOptions.ignoreMotionBlur")
         self.__retrieve_motion_blur_override()
         self.__retrieve_instant_shutter_override()
 
@@ -90,9 +89,22 @@ class MotionBlurPart(ControlRoomPart):
         return content
 
     def refresh_ui(self):
+        self.__refresh_checkboxes()
+        for fs in self.__form_sliders:
+            fs.refresh_ui()
+
+    def refresh_fields(self, fields):
+        if "enable_motion_blur" in fields or "instant_shutter" in fields:
+            self.__refresh_checkboxes()
+        for fs in self.__form_sliders:
+            if fs.get_key_preset_and_field()[0] in fields:
+                fs.refresh_ui()
+
+    # Refresh the motion blur and instant shutter checkboxes
+    def __refresh_checkboxes(self):
         try:
-            motion_blur_enable  = pm.getAttr("defaultArnoldRenderOptions.motion_blur_enable")
-            ignore_motion_blur = pm.getAttr("defaultArnoldRenderOptions.ignoreMotionBlur")
+            motion_blur_enable = self._control_room.get_attr("defaultArnoldRenderOptions.motion_blur_enable")
+            ignore_motion_blur = self._control_room.get_attr("defaultArnoldRenderOptions.ignoreMotionBlur")
 
             hovered_preset = self._control_room.get_hovered_preset()
             if hovered_preset and hovered_preset.contains(self._part_name, "enable_motion_blur"):
@@ -109,11 +121,7 @@ class MotionBlurPart(ControlRoomPart):
             else:
                 self.__ui_instant_shutter_cb.setChecked(ignore_motion_blur)
 
-            for fs in self.__form_sliders:
-                fs.refresh_ui()
-
-            visible_layer = render_setup.instance().getVisibleRenderLayer()
-            is_default_layer = visible_layer.name() == "defaultRenderLayer"
+            is_default_layer = cr.ControlRoom.is_default_layer()
             self.__action_add_motion_blur_override.setEnabled(
                 not is_default_layer and self.__motion_blur_override is None)
             self.__action_remove_motion_blur_override.setEnabled(
@@ -125,11 +133,12 @@ class MotionBlurPart(ControlRoomPart):
 
             motion_blur_stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "enable_motion_blur", motion_blur_enable, self.__motion_blur_override)
-            self.__ui_motion_blur_cb.setStyleSheet("QCheckBox{" + motion_blur_stylesheet_lbl + "}")
+            self._control_room.set_widget_stylesheet(self.__ui_motion_blur_cb, "QCheckBox", motion_blur_stylesheet_lbl)
 
             instant_shutter_stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "instant_shutter", ignore_motion_blur, self.__instant_shutter_override)
-            self.__ui_instant_shutter_cb.setStyleSheet("QCheckBox{" + instant_shutter_stylesheet_lbl + "}")
+            self._control_room.set_widget_stylesheet(
+                self.__ui_instant_shutter_cb, "QCheckBox", instant_shutter_stylesheet_lbl)
             self.__retrieve_motion_blur_override()
             self.__retrieve_instant_shutter_override()
         except:
@@ -145,21 +154,19 @@ class MotionBlurPart(ControlRoomPart):
         if not self._preset_hovered:
             pm.setAttr("defaultArnoldRenderOptions.ignoreMotionBlur", state == 2)
 
+    # The sliders refresh themselves
     def add_callbacks(self):
-        self.__motion_blur_callback = pm.scriptJob(
-            attributeChange=["defaultArnoldRenderOptions.motion_blur_enable", self.refresh_ui])
-        self.__instant_shutter_callback = pm.scriptJob(
-            attributeChange=["defaultArnoldRenderOptions.ignoreMotionBlur", self.refresh_ui])
+        self._control_room.add_attribute_callback(
+            "defaultArnoldRenderOptions.motion_blur_enable", self.__refresh_checkboxes)
+        self._control_room.add_attribute_callback(
+            "defaultArnoldRenderOptions.ignoreMotionBlur", self.__refresh_checkboxes)
         for fs in self.__form_sliders:
             fs.add_callbacks()
-        self.__layer_callback = pm.scriptJob(event=["renderLayerManagerChange", self.refresh_ui])
+        self._control_room.add_layer_callback(self.__refresh_checkboxes)
 
+    # The callback registry of Control Room removes the callbacks
     def remove_callbacks(self):
-        pm.scriptJob(kill=self.__motion_blur_callback)
-        pm.scriptJob(kill=self.__instant_shutter_callback)
-        for fs in self.__form_sliders:
-            fs.remove_callbacks()
-        pm.scriptJob(kill=self.__layer_callback)
+        pass
 
     def add_to_preset(self, preset):
         preset.set(self._part_name, "enable_motion_blur", pm.getAttr("defaultArnoldRenderOptions.motion_blur_enable"))
@@ -170,10 +177,12 @@ class MotionBlurPart(ControlRoomPart):
 
     def apply(self, preset):
         if preset.contains(self._part_name, "enable_motion_blur"):
-            pm.setAttr("defaultArnoldRenderOptions.motion_blur_enable", preset.get(self._part_name, "enable_motion_blur"))
+            self._control_room.set_attr("defaultArnoldRenderOptions.motion_blur_enable",
+                                        preset.get(self._part_name, "enable_motion_blur"))
         if preset.contains(self._part_name, "instant_shutter"):
-            pm.setAttr("defaultArnoldRenderOptions.ignoreMotionBlur", preset.get(self._part_name, "instant_shutter"))
+            self._control_room.set_attr("defaultArnoldRenderOptions.ignoreMotionBlur",
+                                        preset.get(self._part_name, "instant_shutter"))
         for fs in self.__form_sliders:
             key, field = fs.get_key_preset_and_field()
             if preset.contains(self._part_name, key):
-                pm.setAttr(field, preset.get(self._part_name, key))
+                self._control_room.set_attr(field, preset.get(self._part_name, key))
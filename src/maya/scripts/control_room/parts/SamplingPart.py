@@ -25,8 +25,6 @@ class SamplingPart(ControlRoomPart):
                        "defaultArnoldRenderOptions.GISpecularDepth", "ray_depth_specular", 0, 16, 160),
         ]
         self.__ui_progressive_render_cb = None
-        self.__progressive_render_callback = None
-        self.__layer_callback = None
 
         self.__progressive_render_override = None
         self.__action_add_progressive_render_override = QAction(text="Add Override")
@@ -34,6 +32,7 @@ class SamplingPart(ControlRoomPart):
         self.__action_remove_progressive_render_override = QAction(text="Remove Override")
         self.__action_remove_progressive_render_override.triggered.connect(self.__remove_progressive_render_override)
 
+        self._control_room.watch_attr("defaultArnoldRenderOptions.enableProgressiveRender")
         self.__retrieve_progressive_render_override()
 
     # Create progressive render override
@@ -72,10 +71,23 @@ class SamplingPart(ControlRoomPart):
         return content
 
     def refresh_ui(self):
+        self.__refresh_progressive_render()
+        for fs in self.__form_sliders:
+            fs.refresh_ui()
+
+    def refresh_fields(self, fields):
+        if "enable_progressive_render" in fields:
+            self.__refresh_progressive_render()
+        for fs in self.__form_sliders:
+            if fs.get_key_preset_and_field()[0] in fields:
+                fs.refresh_ui()
+
+    # Refresh the progressive render checkbox
+    def __refresh_progressive_render(self):
         try:
-            visible_layer = render_setup.instance().getVisibleRenderLayer()
-            is_default_layer = visible_layer.name() == "defaultRenderLayer"
-            progressive_render_enabled = pm.getAttr("defaultArnoldRenderOptions.enableProgressiveRender")
+            is_default_layer = cr.ControlRoom.is_default_layer()
+            progressive_render_enabled = self._control_room.get_attr(
+                "defaultArnoldRenderOptions.enableProgressiveRender")
 
             hovered_preset = self._control_room.get_hovered_preset()
             if hovered_preset and hovered_preset.contains(self._part_name, "enable_progressive_render"):
@@ -85,9 +97,6 @@ class SamplingPart(ControlRoomPart):
             else:
                 self.__ui_progressive_render_cb.setChecked(progressive_render_enabled)
 
-            for fs in self.__form_sliders:
-                fs.refresh_ui()
-
             self.__action_add_progressive_render_override.setEnabled(
                 not is_default_layer and self.__progressive_render_override is None)
             self.__action_remove_progressive_render_override.setEnabled(
@@ -96,7 +105,7 @@ class SamplingPart(ControlRoomPart):
             stylesheet_lbl = self._control_room.get_stylesheet_color_for_field(
                 self._part_name, "enable_progressive_render",
                 progressive_render_enabled, self.__progressive_render_override)
-            self.__ui_progressive_render_cb.setStyleSheet("QCheckBox{" + stylesheet_lbl + "}")
+            self._control_room.set_widget_stylesheet(self.__ui_progressive_render_cb, "QCheckBox", stylesheet_lbl)
             self.__retrieve_progressive_render_override()
         except:
             pass
@@ -106,18 +115,17 @@ class SamplingPart(ControlRoomPart):
         if not self._preset_hovered:
             pm.setAttr("defaultArnoldRenderOptions.enableProgressiveRender", state == 2)
 
+    # The sliders refresh themselves
     def add_callbacks(self):
-        self.__progressive_render_callback = pm.scriptJob(
-            attributeChange=["defaultArnoldRenderOptions.enableProgressiveRender", self.refresh_ui])
+        self._control_room.add_attribute_callback(
+            "defaultArnoldRenderOptions.enableProgressiveRender", self.__refresh_progressive_render)
         for fs in self.__form_sliders:
             fs.add_callbacks()
-        self.__layer_callback = pm.scriptJob(event=["renderLayerManagerChange", self.refresh_ui])
+        self._control_room.add_layer_callback(self.__refresh_progressive_render)
 
+    # The callback registry of Control Room removes the callbacks
     def remove_callbacks(self):
-        pm.scriptJob(kill=self.__progressive_render_callback)
-        for fs in self.__form_sliders:
-            fs.remove_callbacks()
-        pm.scriptJob(kill=self.__layer_callback)
+        pass
 
     def add_to_preset(self, preset):
         preset.set(self._part_name, "enable_progressive_render", pm.getAttr("defaultArnoldRenderOptions.enableProgressiveRender"))
@@ -127,8 +135,9 @@ class SamplingPart(ControlRoomPart):
 
     def apply(self, preset):
         if preset.contains(self._part_name, "enable_progressive_render"):
-            pm.setAttr("defaultArnoldRenderOptions.enableProgressiveRender", preset.get(self._part_name, "enable_progressive_render"))
+            self._control_room.set_attr("defaultArnoldRenderOptions.enableProgressiveRender",
+                                        preset.get(self._part_name, "enable_progressive_render"))
         for fs in self.__form_sliders:
             key, field = fs.get_key_preset_and_field()
             if preset.contains(self._part_name, key):
-                pm.setAttr(field, preset.get(self._part_name, key))
+                self._control_room.set_attr(field, preset.get(self._part_name, key))
@@ -0,0 +1,82 @@
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+########################################################################################################################
+
+DEFAULT_MAX_WORKERS = 16
+
+
+########################################################################################################################
+
+
+class FolderScanner:
+    """
+    Scan folders to retrieve their subfolders and texture files. Each folder is read once with os.scandir and the
+    result is cached until the modification time of the folder changes.
+    """
+    def __init__(self, extensions, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Constructor
+        :param extensions: texture extensions supported
+        :param max_workers: number of threads used to scan many folders
+        """
+        self.__texture_regex = re.compile(r".*\.(?:" + "|".join(extensions) + ")", re.IGNORECASE)
+        self.__max_workers = max_workers
+        self.__cache = {}
+        self.__lock = threading.Lock()
+
+    def scan(self, folder_path):
+        """
+        Get the subfolders and the texture files of a folder
+        :param folder_path
+        :return: sorted subfolder names and sorted texture file names
+        """
+        try:
+            mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            return [], []
+
+        with self.__lock:
+            cached = self.__cache.get(folder_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        dir_names = []
+        texture_names = []
+        try:
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        dir_names.append(entry.name)
+                    elif entry.is_file() and self.__texture_regex.match(entry.name):
+                        texture_names.append(entry.name)
+        except OSError:
+            return [], []
+        dir_names.sort()
+        texture_names.sort()
+
+        result = (dir_names, texture_names)
+        with self.__lock:
+            self.__cache[folder_path] = (mtime, result)
+        return result
+
+    def scan_many(self, folder_paths):
+        """
+        Scan many folders in parallel
+        :param folder_paths
+        :return: dict of folder path to its subfolders and texture files
+        """
+        if len(folder_paths) == 0:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.__max_workers, len(folder_paths))) as executor:
+            return dict(zip(folder_paths, executor.map(self.scan, folder_paths)))
+
+    def clear_cache(self):
+        """
+        Forget all the folders scanned
+        :return:
+        """
+        with self.__lock:
+            self.__cache.clear()
@@ -1,20 +1,27 @@
-from os.path import isfile, join
-
 import shader_maker.ShaderMaker as ShaderMaker
 from .ShaderMaker import *
+from .TextureClassifier import TextureClassifier
 
 ########################################################################################################################
 
-SHADER_FIELDS_REGEX = {
-    "base_color": r"(.*)(?:basecolor|albedo|diffuse).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
-    "normal": r"((?:(?!combine).)*)(?:normal)(?:(?!combine).)*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
-    "displacement": r"(.*)(?:height|displacement|disp).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
-    "roughness": r"(.*)(?:roughness).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
-    "metalness": r"(.*)(?:metalness).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
-    "emissive": r"(.*)(?:emissive).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")",
-    "sss": r"(.*)(?:sssamount).*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")"
+SHADER_FIELDS_TOKENS = {
+    "base_color": ["basecolor", "albedo", "diffuse"],
+    "normal": ["normal"],
+    "displacement": ["height", "displacement", "disp"],
+    "roughness": ["roughness"],
+    "metalness": ["metalness"],
+    "emissive": ["emissive"],
+    "sss": ["sssamount"]
+}
+
+SHADER_FIELDS_EXCLUSIONS = {
+    "normal": ["combine"]
 }
 
+# Compiled once for every texture of every shader
+TEXTURE_CLASSIFIER = \
+    TextureClassifier(SHADER_FIELDS_TOKENS, ShaderMaker.FILE_EXTENSION_SUPPORTED, SHADER_FIELDS_EXCLUSIONS)
+
 
 ########################################################################################################################
 
@@ -23,11 +30,7 @@ class ShaderField:
     """
     A Texture field in the shader
     """
-    def __init__(self, rule):
-        """
-        :param rule: regexp that valid the ShaderField
-        """
-        self.__regexp = rule
+    def __init__(self):
         self.__file_name = ""
         self.__enabled = True
 
@@ -46,13 +49,6 @@ class ShaderField:
         """
         self.__file_name = file_name
 
-    def get_regexp(self):
-        """
-        Getter of the regexp
-        :return: regexp
-        """
-        return self.__regexp
-
     def is_found(self):
         """
         Getter of whether the ShaderField has been found or not
@@ -90,8 +86,8 @@ class Shader:
         :param title:
         """
         self.__shader_fields = {}
-        for keyword, rule in SHADER_FIELDS_REGEX.items():
-            self.__shader_fields[keyword] = ShaderField(rule)
+        for keyword in SHADER_FIELDS_TOKENS.keys():
+            self.__shader_fields[keyword] = ShaderField()
         self.__title = title
         self.__dir_path = ""
         self.__image_label = None
@@ -119,24 +115,22 @@ class Shader:
         :return:
         """
         # Get all the texture files of the folder
-        files_name_list = [f for f in os.listdir(folder_path) if
-                           isfile(join(folder_path, f)) and re.match(
-                               r".*\.(?:" + ShaderMaker.FILE_EXTENSION_SUPPORTED_REGEX + ")", f, re.IGNORECASE)]
-        files_name_list.sort(key=str)
+        files_name_list = list(ShaderMaker.FOLDER_SCANNER.scan(folder_path)[1])
         files_name_list.reverse()
         # Sort and store objects according to their prefix to detect if many shaders are in the folder
+        # Classify each file once and keep the files grouped by field to preserve the order of the shaders
+        files_by_keyword = {keyword: [] for keyword in self.__shader_fields.keys()}
+        for file_name in files_name_list:
+            for prefix, keyword in TEXTURE_CLASSIFIER.classify(file_name):
+                files_by_keyword[keyword].append((prefix, file_name))
         field_file_match = {}
-        for keyword, field in self.__shader_fields.items():
-            regexp = field.get_regexp()
-            for file_name in files_name_list:
-                match = re.match(regexp, file_name.lower(), re.IGNORECASE)
-                if match:
-                    prefix = match.groups()[0]
-                    if prefix not in field_file_match:
-                        field_file_match[prefix] = {keyword: []}
-                    elif keyword not in field_file_match[prefix]:
-                        field_file_match[prefix][keyword] = []
-                    field_file_match[prefix][keyword].append(file_name)
+        for keyword, prefix_files in files_by_keyword.items():
+            for prefix, file_name in prefix_files:
+                if prefix not in field_file_match:
+                    field_file_match[prefix] = {keyword: []}
+                elif keyword not in field_file_match[prefix]:
+                    field_file_match[prefix][keyword] = []
+                field_file_match[prefix][keyword].append(file_name)
 
         nb_file_field_match = len(field_file_match)
         # If many shaders, create as much shaders
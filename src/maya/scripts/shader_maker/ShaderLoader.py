@@ -0,0 +1,107 @@
+import os
+
+from PySide2.QtCore import QObject, QRunnable, Signal
+
+import shader_maker.ShaderMaker as ShaderMaker
+from .Shader import Shader
+
+########################################################################################################################
+
+# Number of shader folders loaded before sending the shaders to the UI
+DEFAULT_BATCH_SIZE = 32
+
+
+########################################################################################################################
+
+
+class ShaderLoaderSignals(QObject):
+    """
+    Signals of the ShaderLoader (a QRunnable can't have signals)
+    """
+    # generation, list of shaders
+    shaders_found = Signal(int, object)
+    # generation
+    finished = Signal(int)
+
+
+class ShaderLoader(QRunnable):
+    """
+    Load the shaders of a folder in a thread of a QThreadPool and send them to the UI by batches
+    """
+    def __init__(self, generation, folder_path, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Constructor
+        :param generation: id of the loading, sent back with the signals to ignore the outdated ones
+        :param folder_path
+        :param batch_size
+        """
+        super(ShaderLoader, self).__init__()
+        self.signals = ShaderLoaderSignals()
+        self.__generation = generation
+        self.__folder_path = folder_path
+        self.__batch_size = batch_size
+        self.__cancelled = False
+
+    def cancel(self):
+        """
+        Stop the loading as soon as possible
+        :return:
+        """
+        self.__cancelled = True
+
+    def is_cancelled(self):
+        """
+        Getter of whether the loading has been cancelled or not
+        :return: boolean
+        """
+        return self.__cancelled
+
+    def __send_shaders(self, loaded_shaders):
+        """
+        Send the shaders found with at least one field to the UI
+        :param loaded_shaders: list of (shader, number of fields found)
+        :return:
+        """
+        shaders = [shad for shad, nb in loaded_shaders if nb > 0]
+        if len(shaders) > 0 and not self.__cancelled:
+            self.signals.shaders_found.emit(self.__generation, shaders)
+
+    def run(self):
+        """
+        Load the shaders
+        :return:
+        """
+        try:
+            self.__load()
+        finally:
+            self.signals.finished.emit(self.__generation)
+
+    def __load(self):
+        """
+        Load the shaders of a shader folder or of a folder of shader folders
+        :return:
+        """
+        if not os.path.isdir(self.__folder_path):
+            return
+        list_dir, textures = ShaderMaker.FOLDER_SCANNER.scan(self.__folder_path)
+
+        if len(textures) > 0:
+            # If the folder is a shader folder
+            self.__send_shaders(Shader(os.path.basename(self.__folder_path)).load(self.__folder_path))
+            return
+
+        # If the folder is a folder of shader folder
+        dir_paths = [self.__folder_path + "/" + directory for directory in list_dir]
+        for i in range(0, len(dir_paths), self.__batch_size):
+            if self.__cancelled:
+                return
+            batch_dirs = list_dir[i:i + self.__batch_size]
+            batch_paths = dir_paths[i:i + self.__batch_size]
+            scans = ShaderMaker.FOLDER_SCANNER.scan_many(batch_paths)
+            loaded_shaders = []
+            for directory, dir_path in zip(batch_dirs, batch_paths):
+                if self.__cancelled:
+                    return
+                if len(scans[dir_path][1]) > 0:
+                    loaded_shaders.extend(Shader(directory).load(dir_path))
+            self.__send_shaders(loaded_shaders)
@@ -45,7 +45,18 @@ SHADER_FIELDS = \
 
 FILE_EXTENSION_SUPPORTED_REGEX = "|".join(FILE_EXTENSION_SUPPORTED)
 
+# Split a texture filename into its prefix and its UDIM
+TEXTURE_BASE_REGEX = re.compile(r"(.*)(<UDIM>|[0-9]{4})\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + ")")
+
+from .FolderScanner import FolderScanner
+
+# Shared by all the ShaderMaker windows so that browsing again the same library is instant
+FOLDER_SCANNER = FolderScanner(FILE_EXTENSION_SUPPORTED)
+
 from .Shader import Shader
+from .ShaderLoader import ShaderLoader
+from .ShaderTableModel import ShaderTableModel, CenteredCheckBoxDelegate
+from .TextureVersionIndex import TextureVersionIndex
 
 
 class Assignation(Enum):
@@ -81,9 +92,15 @@ class ShaderMaker(QtWidgets.QDialog):
         self.__cs_folder_path = ""
         self.__cs_shaders = []
         self.__cs_seleted_shaders = []
+        self.__cs_loader = None
+        self.__cs_loading_generation = 0
         self.__assign_cs = Assignation.AutoAssign
         self.__us_folder_path = ""
         self.__us_data = {}
+        self.__us_index = None
+        # Textures of the shading groups and shading groups that depend on a node (by names)
+        self.__us_textures_cache = {}
+        self.__us_node_to_shading_groups = {}
         self.__displacement_scale = DEFAULT_DISPLACEMENT_SCALE
         self.__displacement_mid = DEFAULT_DISPLACEMENT_MID
 
@@ -124,10 +141,11 @@ class ShaderMaker(QtWidgets.QDialog):
         Save preferences
         :return:
         """
-        size = self.size()
-        self.__prefs["window_size"] = {"width": size.width(), "height": size.height()}
-        pos = self.pos()
-        self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
+        with self.__prefs:
+            size = self.size()
+            self.__prefs["window_size"] = {"width": size.width(), "height": size.height()}
+            pos = self.pos()
+            self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
 
     def __retrieve_prefs(self):
         """
@@ -146,6 +164,10 @@ class ShaderMaker(QtWidgets.QDialog):
         """
         self.__us_selection_callback = \
             OpenMaya.MEventMessage.addEventCallback("SelectionChanged", self.on_selection_changed)
+        self.__us_connection_callback = \
+            OpenMaya.MDGMessage.addConnectionCallback(self.__on_connection_changed)
+        self.__us_name_changed_callback = \
+            OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject(), self.__on_name_changed)
 
     def hideEvent(self, arg__1: QtGui.QCloseEvent) -> None:
         """
@@ -153,6 +175,9 @@ class ShaderMaker(QtWidgets.QDialog):
         :return:
         """
         OpenMaya.MMessage.removeCallback(self.__us_selection_callback)
+        OpenMaya.MMessage.removeCallback(self.__us_connection_callback)
+        OpenMaya.MMessage.removeCallback(self.__us_name_changed_callback)
+        self.__cancel_cs_loading()
         self.__save_prefs()
 
     def __browse_cs_folder(self):
@@ -243,21 +268,24 @@ class ShaderMaker(QtWidgets.QDialog):
         folder_cs_lyt.addWidget(browse_cs_btn)
 
         # Layout ML.1.2 : Shaders
-        self.__ui_shaders_cs_list = QTableWidget(0, 8)
+        self.__ui_shaders_cs_model = ShaderTableModel(
+            SHADER_FIELDS,
+            ["Shader name", "Base Color", "Normal", "Displacement", "Roughness", "Metalness", "Emissive", "SSS"], self)
+        self.__ui_shaders_cs_list = QTableView()
+        self.__ui_shaders_cs_list.setModel(self.__ui_shaders_cs_model)
+        self.__ui_shaders_cs_list.setItemDelegate(CenteredCheckBoxDelegate(self.__ui_shaders_cs_list))
         self.__ui_shaders_cs_list.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred)
         self.__ui_shaders_cs_list.verticalHeader().hide()
         self.__ui_shaders_cs_list.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.__ui_shaders_cs_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.__ui_shaders_cs_list.setHorizontalHeaderLabels(
-            ["Shader name", "Base Color", "Normal", "Displacement", "Roughness", "Metalness", "Emissive", "SSS"])
         self.__ui_shaders_cs_list.setShowGrid(False)
         self.__ui_shaders_cs_list.setAlternatingRowColors(True)
         horizontal_header = self.__ui_shaders_cs_list.horizontalHeader()
         horizontal_header.sectionClicked.connect(self.__on_clicked_header_cs_list)
         horizontal_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
         horizontal_header.setSectionResizeMode(0, QHeaderView.Stretch)
-        self.__ui_shaders_cs_list.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.__ui_shaders_cs_list.itemSelectionChanged.connect(self.__on_cs_list_item_selected)
+        self.__ui_shaders_cs_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.__ui_shaders_cs_list.selectionModel().selectionChanged.connect(self.__on_cs_list_item_selected)
         cs_lyt.addWidget(self.__ui_shaders_cs_list,1)
 
         # Layout ML.1.3 : Displacement scale
@@ -362,7 +390,6 @@ class ShaderMaker(QtWidgets.QDialog):
         self.__ui_us_folder_path.setText(self.__us_folder_path)
 
         self.__refresh_btn()
-        self.__refresh_cs_body()
         self.__refresh_us_body()
 
     def __refresh_btn(self):
@@ -379,45 +406,12 @@ class ShaderMaker(QtWidgets.QDialog):
         if self.__assign_cs == Assignation.AssignToSelection and nb_shader_enabled > 1:
             self.__auto_assign_radio.setChecked(True)
 
-    @staticmethod
-    def __generate_field_table_widget(field):
-        """
-        Generate a widget containing a Checkbox according to a shader field
-        :param field
-        :return: widget
-        """
-        cb = QCheckBox()
-        is_found = field.is_found()
-        cb.setEnabled(is_found)
-        cb.setChecked(is_found and field.is_enabled())
-        cb.stateChanged.connect(field.toggle_enabled)
-        widget_wrapper = QWidget()
-        layout = QHBoxLayout()
-        layout.addStretch()
-        layout.addWidget(cb)
-        layout.addStretch()
-        widget_wrapper.setLayout(layout)
-        return widget_wrapper
-
     def __refresh_cs_body(self):
         """
         Refresh the body of the creation part
         :return:
         """
-        self.__ui_shaders_cs_list.setRowCount(0)
-        row_index = 0
-        for shader in self.__cs_shaders:
-            self.__ui_shaders_cs_list.insertRow(row_index)
-            # Title
-            title = shader.get_title()
-            elem_item = QTableWidgetItem(" "+title)
-            elem_item.setData(Qt.UserRole, shader)
-            self.__ui_shaders_cs_list.setItem(row_index, 0, elem_item)
-            # Fields
-            for index, field_keyword in SHADER_FIELDS.items():
-                self.__ui_shaders_cs_list.setCellWidget(
-                    row_index, index, self.__generate_field_table_widget(shader.get_field(field_keyword)))
-            row_index+=1
+        self.__ui_shaders_cs_model.set_shaders(self.__cs_shaders)
 
     def __refresh_us_body(self):
         """
@@ -429,6 +423,7 @@ class ShaderMaker(QtWidgets.QDialog):
 
         self.__ui_tree_us_files.clear()
         update_btn_enabled = False
+        us_index = self.__get_us_index()
         for directory, data in self.__us_data.items():
             textures = data[0]
             shaders = data[1]
@@ -453,15 +448,12 @@ class ShaderMaker(QtWidgets.QDialog):
                 filename = os.path.basename(filepath)
                 child = QtWidgets.QTreeWidgetItem([filename])
 
-                base = re.search(r"(.*)(?:<UDIM>|[0-9]{4})\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + ")", filename)
+                base = TEXTURE_BASE_REGEX.search(filename)
                 if base is None:
                     print_warning("filename \""+filename+"\" not valid as a texture")
                     continue
-                match = base.groups()[0]
-                regex = match.replace(".", "\.") + "((?:[0-9]{0,4})\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + "))"
                 # Get the last version
-                new_file_path = self.__us_find_file_in_directory(
-                    self.__us_folder_path, regex)
+                new_file_path = self.__us_find_last_version(us_index, base)
 
                 child_enabled = new_file_path is not None and new_file_path != filepath
                 update_btn_enabled |= child_enabled
@@ -474,7 +466,7 @@ class ShaderMaker(QtWidgets.QDialog):
             self.__ui_us_submit_btn.setEnabled(
                 len(self.__us_data) > 0 and os.path.isdir(self.__us_folder_path) and update_btn_enabled)
             self.__ui_us_submit_btn.setEnabled(True)
-    def __on_cs_list_item_selected(self):
+    def __on_cs_list_item_selected(self, *args):
         """
         On selection in the table changed retrieve shaders
         :return:
@@ -482,7 +474,7 @@ class ShaderMaker(QtWidgets.QDialog):
         self.__cs_seleted_shaders.clear()
         rows = self.__ui_shaders_cs_list.selectionModel().selectedRows()
         for row in rows:
-            self.__cs_seleted_shaders.append(self.__ui_shaders_cs_list.item(row.row(), 0).data(Qt.UserRole))
+            self.__cs_seleted_shaders.append(self.__ui_shaders_cs_model.get_shader(row.row()))
         self.__refresh_btn()
 
     def __on_clicked_header_cs_list(self, index):
@@ -491,19 +483,7 @@ class ShaderMaker(QtWidgets.QDialog):
         :param index: index column
         :return:
         """
-        print(index)
-        if index != 0:
-            enabled = True
-            keyword = SHADER_FIELDS[index]
-            for shader in self.__cs_shaders:
-                if not shader.get_field(keyword).is_enabled():
-                    enabled = False
-                    break
-            for shader in self.__cs_shaders:
-                field = shader.get_field(keyword)
-                if field.is_found():
-                    field.set_enabled(not enabled)
-            self.__refresh_cs_body()
+        self.__ui_shaders_cs_model.toggle_column(index)
 
     def __on_folder_cs_changed(self):
         """
@@ -512,7 +492,7 @@ class ShaderMaker(QtWidgets.QDialog):
         """
         folder_path = self.__ui_cs_folder_path.text()
         self.__cs_folder_path = folder_path
-        self.__generate_cs_shaders()
+        self.__start_cs_loading()
         self.__refresh_ui()
 
     def __on_folder_us_changed(self):
@@ -533,6 +513,29 @@ class ShaderMaker(QtWidgets.QDialog):
         self.__generate_us_data()
         self.__refresh_us_body()
 
+    def __on_connection_changed(self, src_plug, dst_plug, made, *args):
+        """
+        Forget the textures of the shading groups that depend on the destination node of the connection
+        :param src_plug
+        :param dst_plug
+        :param made
+        :return:
+        """
+        node_name = OpenMaya.MFnDependencyNode(dst_plug.node()).name()
+        shading_groups = self.__us_node_to_shading_groups.pop(node_name, None)
+        if shading_groups is not None:
+            for shading_group in shading_groups:
+                self.__us_textures_cache.pop(shading_group, None)
+
+    def __on_name_changed(self, *args):
+        """
+        Forget all the textures since the cache is indexed by names
+        :return:
+        """
+        if len(self.__us_textures_cache) > 0:
+            self.__us_textures_cache.clear()
+            self.__us_node_to_shading_groups.clear()
+
     def __get_us_shading_groups_and_textures(self):
         """
         Get the textures and the shading groups of the selection
@@ -540,34 +543,48 @@ class ShaderMaker(QtWidgets.QDialog):
         """
         files = []
         selection = pm.ls(sl=True, transforms=True)
-        distinct_shading_groups = []
+        distinct_shading_groups = {}
         for s in selection:
             for shape in s.listRelatives(shapes=True, allDescendents=True):
                 if shape is not None:
                     shading_groups = shape.listConnections(type="shadingEngine")
                     for shading_group in shading_groups:
-                        if shading_group not in distinct_shading_groups:
-                            distinct_shading_groups.append(shading_group)
+                        distinct_shading_groups[shading_group] = None
 
-        for shading_group in distinct_shading_groups:
-            textures = self.__get_textures_recursive(shading_group)
+        for shading_group in distinct_shading_groups.keys():
+            textures = self.__get_shading_group_textures(shading_group)
             for texture in textures:
-                files.append({texture, shading_group})
+                files.append((texture, shading_group))
         return files
 
-    def __get_textures_recursive(self, node):
+    def __get_shading_group_textures(self, shading_group):
         """
-        Get the textures from a node recursively
-        :param node:
+        Get the textures upstream of a shading group. Each node is visited once and the result is cached until a
+        connection of the network changes
+        :param shading_group:
         :return: textures
         """
+        shading_group_name = shading_group.name()
+        if shading_group_name in self.__us_textures_cache:
+            return self.__us_textures_cache[shading_group_name]
+
         textures = []
-        connections = node.listConnections(source=True, destination=False)
-        for connection in connections:
-            if connection.type() == 'file':
-                textures.append(connection)
-            else:
-                textures.extend(self.__get_textures_recursive(connection))
+        visited = {shading_group}
+        to_visit = [shading_group]
+        while len(to_visit) > 0:
+            node = to_visit.pop()
+            for connection in node.listConnections(source=True, destination=False):
+                if connection in visited:
+                    continue
+                visited.add(connection)
+                if connection.type() == 'file':
+                    textures.append(connection)
+                else:
+                    to_visit.append(connection)
+
+        for node in visited:
+            self.__us_node_to_shading_groups.setdefault(node.name(), set()).add(shading_group_name)
+        self.__us_textures_cache[shading_group_name] = textures
         return textures
 
     def __generate_us_data(self):
@@ -576,56 +593,65 @@ class ShaderMaker(QtWidgets.QDialog):
         :return:
         """
         self.__us_data.clear()
+        shading_groups_by_dir = {}
         for texture, shading_group in self.__get_us_shading_groups_and_textures():
             dirname = os.path.dirname(texture.getAttr("fileTextureName"))
             if dirname not in self.__us_data:
                 self.__us_data[dirname] = [[], []]
+                shading_groups_by_dir[dirname] = set()
 
             self.__us_data[dirname][0].append(texture)
 
-            if shading_group not in self.__us_data[dirname][1]:
+            if shading_group not in shading_groups_by_dir[dirname]:
+                shading_groups_by_dir[dirname].add(shading_group)
                 self.__us_data[dirname][1].append(shading_group)
 
-    def __generate_cs_shaders(self):
+    def __cancel_cs_loading(self):
+        """
+        Cancel the loading of the shaders of the creation part if one is running
+        :return:
+        """
+        if self.__cs_loader is not None:
+            self.__cs_loader.cancel()
+            self.__cs_loader = None
+
+    def __start_cs_loading(self):
         """
-        Generate the model data for the creatino part
+        Load the model data for the creation part in background. The shaders are added to the table by batches
         :return:
         """
+        self.__cancel_cs_loading()
         self.__cs_shaders.clear()
+        self.__cs_seleted_shaders.clear()
+        self.__refresh_cs_body()
+        self.__cs_loading_generation += 1
         if not os.path.isdir(self.__cs_folder_path):
             return
-        child_dir = os.listdir(self.__cs_folder_path)
-        list_dir = []
-        has_texture = False
-
-        for child in child_dir:
-            if os.path.isdir(self.__cs_folder_path + "/" + child):
-                list_dir.append(child)
-            else:
-                if re.match(r".*\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + ")", child):
-                    has_texture = True
-
-        if has_texture:
-            # If the folder is a shader folder
-            shaders = Shader(os.path.basename(self.__cs_folder_path)).load(self.__cs_folder_path)
-            for shad, nb in shaders:
-                if nb > 0:
-                    self.__cs_shaders.append(shad)
-        else:
-            # If the folder is a folder of shader folder
-            for directory in list_dir:
-                dir_path = self.__cs_folder_path + "/" + directory
-                has_texture_2 = False
-                child_dir_2 = os.listdir(dir_path)
-                for child in child_dir_2:
-                    if re.match(r".*\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + ")", child):
-                        has_texture_2 = True
-                        break
-                if has_texture_2:
-                    shaders = Shader(directory).load(dir_path)
-                    for shad, nb in shaders:
-                        if nb > 0:
-                            self.__cs_shaders.append(shad)
+        self.__cs_loader = ShaderLoader(self.__cs_loading_generation, self.__cs_folder_path)
+        self.__cs_loader.signals.shaders_found.connect(self.__on_cs_shaders_found)
+        self.__cs_loader.signals.finished.connect(self.__on_cs_loading_finished)
+        QThreadPool.globalInstance().start(self.__cs_loader)
+
+    def __on_cs_shaders_found(self, generation, shaders):
+        """
+        Add the shaders loaded in background if they come from the current loading
+        :param generation
+        :param shaders
+        :return:
+        """
+        if generation != self.__cs_loading_generation:
+            return
+        self.__cs_shaders.extend(shaders)
+        self.__ui_shaders_cs_model.add_shaders(shaders)
+
+    def __on_cs_loading_finished(self, generation):
+        """
+        Forget the loader once the current loading is over
+        :param generation
+        :return:
+        """
+        if generation == self.__cs_loading_generation:
+            self.__cs_loader = None
 
     def __get_shading_values(self):
         """
@@ -730,50 +756,44 @@ class ShaderMaker(QtWidgets.QDialog):
         :return:
         """
         pm.undoInfo(openChunk=True)
+        us_index = self.__get_us_index()
         for directory, data in self.__us_data.items():
             textures = data[0]
             for texture in textures:
                 filepath = texture.getAttr("fileTextureName")
                 filename = os.path.basename(filepath)
 
-                base = re.search("(.*)(?:<UDIM>|[0-9]{4})\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + ")", filename)
-                match = base.groups()[0]
-                regex = match.replace(".", "\.") + "((?:[0-9]{0,4})\.(?:" + FILE_EXTENSION_SUPPORTED_REGEX + "))"
+                base = TEXTURE_BASE_REGEX.search(filename)
+                if base is None:
+                    continue
 
-                new_file_path = self.__us_find_file_in_directory(self.__us_folder_path, regex)
+                new_file_path = self.__us_find_last_version(us_index, base)
                 if new_file_path is not None and new_file_path != filepath:
                     texture.fileTextureName.set(new_file_path)
         self.__generate_us_data()
         self.__refresh_us_body()
         pm.undoInfo(closeChunk=True)
 
-    def __us_find_file_in_directory(self, directory, regex, depth=4):
+    def __get_us_index(self):
+        """
+        Get the index of the textures of the update folder, rebuilt only if the folder changed
+        :return: index
+        """
+        if self.__us_index is None or self.__us_index.get_root() != self.__us_folder_path \
+                or not self.__us_index.is_up_to_date():
+            self.__us_index = TextureVersionIndex(self.__us_folder_path, FILE_EXTENSION_SUPPORTED)
+        return self.__us_index
+
+    @staticmethod
+    def __us_find_last_version(us_index, base):
         """
         Get the last version of a filepath
-        :param directory: base directory
-        :param regex: regex that the filename has to valid
-        :param depth: recursivity depth
+        :param us_index: index of the update folder
+        :param base: match of TEXTURE_BASE_REGEX on the filename
         :return: filepath
         """
-        if depth > 0:
-            filename = None
-            if os.path.isdir(directory):
-                for f in os.listdir(directory):
-                    if os.path.isfile(directory+"/"+f):
-                        match = re.match(regex, f)
-                        if match is not None:
-                            filename = match.group()
-                            break
-            if filename is not None:
-                return directory + "/" + filename
-            else:
-                if os.path.exists(directory):
-                    for d in os.scandir(directory):
-                        if d.is_dir():
-                            filepath = self.__us_find_file_in_directory(d.path.replace('\\', '/'), regex, depth - 1)
-                            if filepath is not None:
-                                return filepath
-        return None
+        prefix, udim = base.groups()
+        return us_index.find(prefix, None if udim == "<UDIM>" else udim)
 
     def set_all_shaders_enabled(self, enabled):
         """
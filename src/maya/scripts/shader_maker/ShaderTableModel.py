@@ -0,0 +1,169 @@
+from PySide2.QtCore import *
+from PySide2.QtGui import *
+from PySide2.QtWidgets import *
+
+
+########################################################################################################################
+
+
+class ShaderTableModel(QAbstractTableModel):
+    """
+    Model of the shaders of the creation part. The first column is the title of the shader and the others are the
+    fields that can be checked
+    """
+    def __init__(self, fields, headers, parent=None):
+        """
+        Constructor
+        :param fields: dict of column index to field keyword
+        :param headers: labels of the columns
+        :param parent
+        """
+        super(ShaderTableModel, self).__init__(parent)
+        self.__fields = fields
+        self.__headers = headers
+        self.__shaders = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__shaders)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.__headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        shader = self.__shaders[index.row()]
+        column = index.column()
+        if role == Qt.UserRole:
+            return shader
+        if column == 0:
+            if role == Qt.DisplayRole:
+                return " " + shader.get_title()
+            return None
+        if role == Qt.CheckStateRole:
+            field = shader.get_field(self.__fields[column])
+            return Qt.Checked if field.is_found() and field.is_enabled() else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() == 0 or role != Qt.CheckStateRole:
+            return False
+        field = self.__shaders[index.row()].get_field(self.__fields[index.column()])
+        if not field.is_found():
+            return False
+        field.set_enabled(value == Qt.Checked)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        field = self.__shaders[index.row()].get_field(self.__fields[index.column()])
+        if not field.is_found():
+            return Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def get_shader(self, row):
+        """
+        Getter of the shader of a row
+        :param row
+        :return: shader
+        """
+        return self.__shaders[row]
+
+    def set_shaders(self, shaders):
+        """
+        Replace all the shaders of the model
+        :param shaders
+        :return:
+        """
+        self.beginResetModel()
+        self.__shaders = list(shaders)
+        self.endResetModel()
+
+    def add_shaders(self, shaders):
+        """
+        Add shaders at the end of the model
+        :param shaders
+        :return:
+        """
+        if len(shaders) == 0:
+            return
+        first_row = len(self.__shaders)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(shaders) - 1)
+        self.__shaders.extend(shaders)
+        self.endInsertRows()
+
+    def toggle_column(self, column):
+        """
+        Toggle the enable state of the fields found of a column. Enable them all unless they are all enabled
+        :param column
+        :return:
+        """
+        if column == 0 or len(self.__shaders) == 0:
+            return
+        keyword = self.__fields[column]
+        enabled = True
+        for shader in self.__shaders:
+            if not shader.get_field(keyword).is_enabled():
+                enabled = False
+                break
+        for shader in self.__shaders:
+            field = shader.get_field(keyword)
+            if field.is_found():
+                field.set_enabled(not enabled)
+        self.dataChanged.emit(self.index(0, column), self.index(len(self.__shaders) - 1, column),
+                              [Qt.CheckStateRole])
+
+
+class CenteredCheckBoxDelegate(QStyledItemDelegate):
+    """
+    Delegate that draws the check state of a cell as a centered checkbox and toggles it on click
+    """
+    def __get_checkbox_rect(self, option):
+        """
+        Get the rect of the checkbox centered in the cell
+        :param option
+        :return: rect
+        """
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        check_option = QStyleOptionButton()
+        check_rect = style.subElementRect(QStyle.SE_CheckBoxIndicator, check_option, option.widget)
+        return QStyle.alignedRect(option.direction, Qt.AlignCenter, check_rect.size(), option.rect)
+
+    def paint(self, painter, option, index):
+        check_state = index.data(Qt.CheckStateRole)
+        if check_state is None:
+            super(CenteredCheckBoxDelegate, self).paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        # Draw the background (selection, alternate colors) without the default checkbox
+        background_option = QStyleOptionViewItem(option)
+        self.initStyleOption(background_option, index)
+        background_option.features &= ~QStyleOptionViewItem.HasCheckIndicator
+        style.drawControl(QStyle.CE_ItemViewItem, background_option, painter, option.widget)
+
+        check_option = QStyleOptionButton()
+        check_option.rect = self.__get_checkbox_rect(option)
+        check_option.state = QStyle.State_On if check_state == Qt.Checked else QStyle.State_Off
+        if index.flags() & Qt.ItemIsEnabled:
+            check_option.state |= QStyle.State_Enabled
+        style.drawControl(QStyle.CE_CheckBox, check_option, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        flags = index.flags()
+        if not (flags & Qt.ItemIsUserCheckable) or not (flags & Qt.ItemIsEnabled):
+            return False
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        if not self.__get_checkbox_rect(option).contains(event.pos()):
+            return False
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
@@ -0,0 +1,83 @@
+import bisect
+import re
+
+
+########################################################################################################################
+
+
+class TextureClassifier:
+    """
+    Classify texture filenames into shader channels in a single pass.
+    A filename belongs to a channel when one of the channel tokens is followed by a supported extension. The prefix
+    is the part of the lowercase filename before the last token found, and no excluded token of the channel can
+    appear before the extension.
+    Example :
+    TextureClassifier({"normal": ["normal"], "roughness": ["roughness"]}, ["exr"], {"normal": ["combine"]})
+    """
+    def __init__(self, channel_tokens, extensions, channel_exclusions=None):
+        """
+        Constructor
+        :param channel_tokens: dict of channel to the tokens that identify it
+        :param extensions: texture extensions supported
+        :param channel_exclusions: dict of channel to the tokens that invalid it
+        """
+        self.__channels = list(channel_tokens.keys())
+        self.__token_channel = {}
+        for channel, tokens in channel_tokens.items():
+            for token in tokens:
+                self.__token_channel[token.lower()] = channel
+        self.__exclusions = {}
+        if channel_exclusions is not None:
+            for channel, tokens in channel_exclusions.items():
+                self.__exclusions[channel] = \
+                    re.compile("(?=(?:" + "|".join(re.escape(t.lower()) for t in tokens) + "))")
+
+        # Longest tokens first so that the alternation returns the whole token
+        sorted_tokens = sorted(self.__token_channel.keys(), key=len, reverse=True)
+        # Lookahead to retrieve every occurrence, even the overlapping ones
+        self.__tokens_regex = re.compile("(?=(" + "|".join(re.escape(t) for t in sorted_tokens) + "))")
+        self.__extension_regex = re.compile(r"\.(?:" + "|".join(extensions) + ")")
+
+    def get_channels(self):
+        """
+        Getter of the channels in their declaration order
+        :return: channels
+        """
+        return self.__channels
+
+    def classify(self, file_name):
+        """
+        Classify a filename
+        :param file_name
+        :return: list of (prefix, channel) in the declaration order of the channels
+        """
+        name = file_name.lower()
+        extension_positions = [match.start() for match in self.__extension_regex.finditer(name)]
+        if len(extension_positions) == 0:
+            return []
+
+        # Positions of the tokens found for each channel
+        channel_positions = {}
+        for match in self.__tokens_regex.finditer(name):
+            token = match.group(1)
+            channel_positions.setdefault(self.__token_channel[token], []).append((match.start(), match.end(1)))
+
+        results = []
+        for channel in self.__channels:
+            if channel not in channel_positions:
+                continue
+            excluded_positions = None
+            if channel in self.__exclusions:
+                excluded_positions = [m.start() for m in self.__exclusions[channel].finditer(name)]
+            # The last token has priority
+            for start, end in reversed(channel_positions[channel]):
+                index_extension = bisect.bisect_left(extension_positions, end)
+                if index_extension == len(extension_positions):
+                    continue
+                if excluded_positions is not None:
+                    extension_position = extension_positions[index_extension]
+                    if any(pos < extension_position for pos in excluded_positions):
+                        continue
+                results.append((name[:start], channel))
+                break
+        return results
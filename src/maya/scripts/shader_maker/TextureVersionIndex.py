@@ -0,0 +1,116 @@
+import os
+import re
+
+########################################################################################################################
+
+DEFAULT_MAX_DEPTH = 4
+
+# Maximum number of digits of the UDIM between the prefix and the extension
+_UDIM_MAX_DIGITS = 4
+
+
+########################################################################################################################
+
+
+class TextureVersionIndex:
+    """
+    Index of the textures of an update folder, built in one walk, to find the last version of a texture in O(1).
+    A texture is found by its prefix (the filename without the UDIM and the extension) and optionally its UDIM.
+    The textures of the shallowest folders have priority then, at the same depth, the ones of the folders with the
+    greatest name (the last version).
+    """
+    def __init__(self, root, extensions, max_depth=DEFAULT_MAX_DEPTH):
+        """
+        Constructor
+        :param root: update folder
+        :param extensions: texture extensions supported
+        :param max_depth: number of folder levels walked (the root included)
+        """
+        self.__root = root
+        self.__extension_regex = re.compile(r"\.(?:" + "|".join(extensions) + ")")
+        self.__max_depth = max_depth
+        self.__index = {}
+        self.__dir_mtimes = {}
+        self.__build()
+
+    def get_root(self):
+        """
+        Getter of the update folder
+        :return: root
+        """
+        return self.__root
+
+    def __add_file(self, directory, file_name):
+        """
+        Index a file under every prefix that can match it. The tiles of a prefix are only taken from the folder of
+        its first file so that the UDIMs found all belong to the same version
+        :param directory
+        :param file_name
+        :return:
+        """
+        file_path = directory + "/" + file_name
+        for match in self.__extension_regex.finditer(file_name):
+            end_prefix = match.start()
+            for nb_digits in range(_UDIM_MAX_DIGITS + 1):
+                start_udim = end_prefix - nb_digits
+                if start_udim < 0 or (nb_digits > 0 and not file_name[start_udim].isdigit()):
+                    break
+                entry = self.__index.setdefault(file_name[:start_udim],
+                                                {"any": file_path, "directory": directory, "tiles": {}})
+                if nb_digits > 0 and entry["directory"] == directory:
+                    entry["tiles"].setdefault(file_name[start_udim:end_prefix], file_path)
+
+    def __build(self):
+        """
+        Walk the update folder level by level and index its textures
+        :return:
+        """
+        level = [self.__root] if os.path.isdir(self.__root) else []
+        depth = 0
+        while len(level) > 0 and depth < self.__max_depth:
+            next_level = []
+            for directory in level:
+                try:
+                    self.__dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                    with os.scandir(directory) as it:
+                        entries = sorted(it, key=lambda e: e.name)
+                except OSError:
+                    continue
+                sub_dirs = []
+                for entry in entries:
+                    if entry.is_file():
+                        self.__add_file(directory, entry.name)
+                    elif entry.is_dir():
+                        sub_dirs.append(entry.path.replace('\\', '/'))
+                next_level.extend(sub_dirs)
+            # Last versions first
+            next_level.sort(reverse=True)
+            level = next_level
+            depth += 1
+
+    def is_up_to_date(self):
+        """
+        Check that no folder walked has been modified since the index was built
+        :return: boolean
+        """
+        for directory, mtime in self.__dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def find(self, prefix, udim=None):
+        """
+        Get the last version of a texture
+        :param prefix: filename without the UDIM and the extension
+        :param udim: UDIM wanted if it exists in the last version
+        :return: filepath or None if not found
+        """
+        entry = self.__index.get(prefix)
+        if entry is None:
+            return None
+        if udim is not None and udim in entry["tiles"]:
+            return entry["tiles"][udim]
+        return entry["any"]
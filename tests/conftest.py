@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+# The tools are imported as Maya imports them, from the scripts folder
+SCRIPTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "maya", "scripts")
+if SCRIPTS_PATH not in sys.path:
+    sys.path.insert(0, SCRIPTS_PATH)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """
+    Redirect the home folder (and so the prefs folder) to a temporary folder
+    :param tmp_path
+    :param monkeypatch
+    :return: temporary home path
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return tmp_path
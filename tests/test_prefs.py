@@ -0,0 +1,111 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import common.Prefs as prefs_module
+from common.Prefs import Prefs, get_folder_prefs, create_folder_prefs
+
+_NB_WRITERS = 16
+_NB_KEYS_BY_WRITER = 25
+
+
+def _write_keys(home, writer_index, nb_keys):
+    """
+    Writer process of the stress test. Each key is flushed on its own to maximize the concurrent writes
+    :param home
+    :param writer_index
+    :param nb_keys
+    :return:
+    """
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    prefs = Prefs("stress")
+    for key_index in range(nb_keys):
+        prefs["writer_" + str(writer_index) + "_" + str(key_index)] = key_index
+        prefs.flush()
+
+
+def test_set_get_pop(home):
+    prefs = Prefs("tool")
+    with prefs:
+        prefs["a"] = {"x": 1}
+        prefs["b"] = 2
+    assert "a" in prefs
+    assert prefs["a"] == {"x": 1}
+    with prefs:
+        assert prefs.pop("b") == 2
+    assert "b" not in Prefs("tool")
+    with pytest.raises(IndexError):
+        prefs["b"]
+
+
+def test_flush_merges_other_sessions(home):
+    session_1 = Prefs("tool")
+    session_2 = Prefs("tool")
+    # Load the file in the second session before the first one writes
+    assert "a" not in session_2
+    with session_1:
+        session_1["a"] = 1
+    with session_2:
+        session_2["b"] = 2
+    reader = Prefs("tool")
+    assert reader["a"] == 1
+    assert reader["b"] == 2
+
+
+def test_unflushed_keys_are_flushed_at_exit(home):
+    prefs = Prefs("tool")
+    prefs["a"] = 1
+    prefs_module._flush_all_prefs()
+    assert Prefs("tool")["a"] == 1
+
+
+def test_locked_file_keeps_keys_dirty(home, monkeypatch):
+    prefs = Prefs("tool")
+    with prefs:
+        prefs["a"] = 1
+
+    def replace_denied(src, dst):
+        raise PermissionError(dst)
+
+    real_replace = os.replace
+    monkeypatch.setattr(prefs_module, "_REPLACE_RETRY_DELAY", 0)
+    monkeypatch.setattr(os, "replace", replace_denied)
+    prefs["a"] = 2
+    assert not prefs.flush()
+    # No temporary file left behind
+    assert sorted(os.listdir(get_folder_prefs())) == ["tool", "tool.lock"]
+
+    monkeypatch.setattr(os, "replace", real_replace)
+    assert prefs.flush()
+    assert Prefs("tool")["a"] == 2
+
+
+def test_concurrent_writers_lose_no_update(home):
+    context = multiprocessing.get_context("spawn")
+    writers = [context.Process(target=_write_keys, args=(str(home), writer_index, _NB_KEYS_BY_WRITER))
+               for writer_index in range(_NB_WRITERS)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join(60)
+        assert writer.exitcode == 0
+
+    with open(os.path.join(get_folder_prefs(), "stress"), "r") as f:
+        datas = json.load(f)
+    assert len(datas) == _NB_WRITERS * _NB_KEYS_BY_WRITER
+    for writer_index in range(_NB_WRITERS):
+        for key_index in range(_NB_KEYS_BY_WRITER):
+            assert datas["writer_" + str(writer_index) + "_" + str(key_index)] == key_index
+
+
+def test_create_folder_prefs_is_hidden(home):
+    path_prefs = get_folder_prefs()
+    create_folder_prefs(path_prefs)
+    assert os.path.isdir(path_prefs)
+    # Hidden by its name outside of Windows
+    assert os.path.basename(path_prefs).startswith(".")
+    # Creating it again does nothing
+    create_folder_prefs(path_prefs)
@@ -0,0 +1,27 @@
+from shader_maker.TextureVersionIndex import TextureVersionIndex
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("")
+
+
+def test_find_last_version(tmp_path):
+    _touch(tmp_path / "v001" / "tex_color.1001.exr")
+    _touch(tmp_path / "v002" / "tex_color.1001.exr")
+    index = TextureVersionIndex(str(tmp_path).replace("\\", "/"), ["exr"])
+    root = index.get_root()
+    assert index.find("tex_color.", "1001") == root + "/v002/tex_color.1001.exr"
+    assert index.find("tex_color.") == root + "/v002/tex_color.1001.exr"
+    assert index.find("missing.") is None
+
+
+def test_tiles_of_the_last_version_only(tmp_path):
+    # The tile 1002 only exists in the old version: it must not be mixed with the last version
+    _touch(tmp_path / "v001" / "tex_color.1001.exr")
+    _touch(tmp_path / "v001" / "tex_color.1002.exr")
+    _touch(tmp_path / "v002" / "tex_color.1001.exr")
+    index = TextureVersionIndex(str(tmp_path).replace("\\", "/"), ["exr"])
+    root = index.get_root()
+    assert index.find("tex_color.", "1001") == root + "/v002/tex_color.1001.exr"
+    assert index.find("tex_color.", "1002") == root + "/v002/tex_color.1001.exr"